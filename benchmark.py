@@ -0,0 +1,1161 @@
+#!/usr/bin/python
+
+#############################################################
+# CSE 539 (Applied Cryptography) Fall 2015 - Project        #
+# Team: Saurabh Gupta, Omkar Kaptan                         #
+# Instructor: Dr. Rida Bazzi                                #
+#############################################################
+
+"""Code for benchmarking the secret sharing operations.
+
+Each benchmark times the current implementation of an operation
+against the implementation it replaced, which is kept in this file
+as a reference, and prints the timings along with the speedup.
+
+Global Methods:
+~~~~~~~~~~~~~~~
+	timeIt(func, repeat)
+	printResult(name, refTime, newTime)
+	naiveEvaluatePolynomial(msgNum, coefficients, n, prime)
+	benchEvaluation(n, k, prime, repeat)
+	naiveReconstructSecret(shares, k, prime)
+	benchReconstruction(n, k, prime, repeat)
+	benchReduction(count, repeat)
+	benchVectorized(count, n, k, prime, repeat)
+	printThroughput(name, size, elapsed)
+	benchByteField(size, n, k, repeat)
+	benchShareFile(count, n, k, prime, repeat)
+	benchNtt(n, kList, repeat)
+	naiveCheckConsistency(shares, k, prime)
+	benchConsistency(n, k, prime, repeat)
+	naiveVerifyCommitment(share, commitments, group)
+	benchFeldman(n, k, prime, repeat)
+	benchMacTags(count, prime, repeat)
+	naiveGenerateMac(msg, key)
+	benchMacContext(count, repeat)
+	benchAuxInfoBatch(count, n, prime, repeat)
+	benchAuxInfoSize(nList, prime, repeat)
+	benchHashCommitments(n, t, prime, repeat)
+	benchShareCodec(count, n, prime, repeat)
+	benchRecv(size, count, buffer, repeat)
+	naiveSend(sock, msg, separator)
+	benchSend(size, count, batch, repeat)
+	benchFraming(size, rounds, nodelay, repeat)
+	benchFanOut(n, delay, size, repeat)
+	benchFanIn(n, k, maxDelay, repeat)
+
+Usage:
+~~~~~~
+Execute the following format command in a linux/unix shell.
+./benchmark.py [-b <benchmark>] [-n <nodes>] [-k <shares>] [-r <repeat>]
+	-b <benchmark> is the name of the benchmark to be executed.
+		Default value is all. Options: eval, recon,
+		reduce, numpy, gf256, sharefile, ntt,
+		parity, feldman, mac, auxbatch, auxsize,
+		hashvote, hmac, codec, recv, send,
+			framing, fanout, fanin
+	-n <nodes> is an integer value representing the number
+		of shares to be generated. Default value is 500.
+	-k <shares> is an integer value representing the number
+		of shares requried for reconstruction. Default value
+		is 250.
+	-r <repeat> is an integer value representing the number
+		of times each operation is repeated. Default value is 1.
+"""
+
+#################### Import modules #########################
+import argparse
+import base64
+import hashlib
+import hmac
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+from time import time
+from modules.util import genRandNum, genRandNums, generatekey, message
+from modules.secretSharing import secretSharing, BYTE_FIELD, CHUNK_PRIME
+from modules.polynomial import polynomial
+from modules.reduction import getReducer
+from modules.vectorSharing import vectorSharing, MERSENNE_61
+from modules.shareFile import shareFile, writeShareFile, reconstructFromFiles
+from modules.primeField import getField
+from modules.ntt import ntt, NTT_PRIME
+from modules.feldman import getGroup
+from modules.polyMac import polyMac
+from modules.macContext import getMacContext
+from modules.shareCodec import shareCodec
+from modules.mysocket import mysocket, LENGTH_HEADER
+from modules.secretSharing import NO_VERIFICATION, MAC_VERIFICATION, AUX_INFO_VERIFICATION
+from modules.secretSharing import HASH_VERIFICATION
+from time import sleep
+from sender import sender, MAX_WORKERS
+from receiver import receiver
+
+#################### Module Metadata ########################
+__author__ = "Saurabh Gupta, Omkar Kaptan"
+__email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
+__license__ = "GPL"
+__version__ = "1.0"
+
+############### Global variables for benchmarks #############
+MERSENNE_1279 = 2**1279 - 1
+REDUCTION_PRIMES = [2**192 - 237, 2**256 - 189, 2**384 - 317, 2**1279 - 1]
+
+#################### Method Definitions #####################
+
+def timeIt(func, repeat=1):
+	"""Calls func repeat times and returns the best time taken by a call.
+
+	Args:
+		func: A callable with no arguments.
+		repeat: An integer specifying the number of calls. Default value = 1.
+
+	Returns:
+		A float value of the minimum time in seconds taken by a call.
+	"""
+
+	best = None
+	for i in range(0, repeat):
+		startTime = time()
+		func()
+		elapsed = time() - startTime
+		if best == None or elapsed < best:
+			best = elapsed
+
+	return best
+
+def printResult(name, refTime, newTime):
+	"""Prints the timings of the reference and the current implementations
+	of the named operation along with the speedup.
+
+	Args:
+		name: A string name of the benchmarked operation.
+		refTime: A float value of the reference implementation time in seconds.
+		newTime: A float value of the current implementation time in seconds.
+	"""
+
+	print "%-40s ref: %10.4fs  new: %10.4fs  speedup: %6.2fx" % \
+		(name, refTime, newTime, refTime / max(newTime, 1e-9))
+
+def printThroughput(name, size, elapsed):
+	"""Prints the throughput of the named operation in MB/s.
+
+	Args:
+		name: A string name of the benchmarked operation.
+		size: An integer value of the number of bytes processed.
+		elapsed: A float value of the time taken in seconds.
+	"""
+
+	print "%-40s %10.4fs  %10.2f MB/s" % \
+		(name, elapsed, size / (1024.0 * 1024.0) / max(elapsed, 1e-9))
+
+def naiveEvaluatePolynomial(msgNum, coefficients, n, prime):
+	"""Reference implementation of secretSharing.evaluatePolynomial which
+	computes (x ** i) % prime for every coefficient and every x.
+	"""
+
+	shares = []
+	for x in range(1, n+1):
+		y = msgNum
+		for i in range(1, len(coefficients) + 1):
+			exp = (x ** i) % prime
+			term = (exp * coefficients[i-1]) % prime
+			y = (y + term) % prime
+		shares.append([x, y])
+
+	return shares
+
+def benchEvaluation(n, k, prime, repeat=1):
+	"""Benchmarks the share generation of a degree k-1 polynomial at n points
+	using the naive loop, Horner's rule and the cached power table.
+
+	Args:
+		n: An integer value representing the number of shares.
+		k: An integer value representing the reconstruction threshold.
+		prime: An integer value to be used as the order of modulo operations.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	msgNum = genRandNum(prime)
+	coefficients = secretSharing.randomPolynomial(k, prime)
+	expected = naiveEvaluatePolynomial(msgNum, coefficients, n, prime)
+
+	if polynomial.evaluateAll(msgNum, coefficients, n, prime) != expected:
+		raise RuntimeError("horner evaluation mismatch")
+	elif polynomial.evaluateAll(msgNum, coefficients, n, prime, True) != expected:
+		raise RuntimeError("power table evaluation mismatch")
+
+	refTime = timeIt(lambda: naiveEvaluatePolynomial(msgNum, coefficients, n, prime), repeat)
+	hornerTime = timeIt(lambda: polynomial.evaluateAll(msgNum, coefficients, n, prime), repeat)
+	tableTime = timeIt(lambda: polynomial.evaluateAll(msgNum, coefficients, n, prime, True), repeat)
+
+	label = "(n=%d, k=%d, %d-bit)" % (n, k, len(bin(prime)) - 2)
+	printResult("evaluate: horner " + label, refTime, hornerTime)
+	printResult("evaluate: power table " + label, refTime, tableTime)
+
+def naiveReconstructSecret(shares, k, prime):
+	"""Reference implementation of secretSharing.reconstructSecret which
+	calls secretSharing.modularInverse once per share.
+	"""
+
+	shares = shares[:k]
+	xList = [share[0] for share in shares]
+	secret = 0
+	for [xi, yi] in shares:
+		numerator, denominator = 1, 1
+		for xj in xList:
+			if xi != xj:
+				numerator = (numerator * -xj) % prime
+				denominator = (denominator * (xi - xj)) % prime
+		term = numerator * secretSharing.modularInverse(denominator, prime)
+		secret = (secret + prime + (yi * term)) % prime
+
+	return secret
+
+def benchReconstruction(n, k, prime, repeat=1):
+	"""Benchmarks the reconstruction of a secret from k of n shares using
+	the per-share inversion loop, the batch inversion with an empty Lagrange
+	weight cache, and the cached Lagrange weights.
+
+	Args:
+		n: An integer value representing the number of shares.
+		k: An integer value representing the reconstruction threshold.
+		prime: An integer value to be used as the order of modulo operations.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	msgNum = genRandNum(prime)
+	coefficients = secretSharing.randomPolynomial(k, prime)
+	shares = polynomial.evaluateAll(msgNum, coefficients, n, prime)[n-k:]
+
+	if naiveReconstructSecret(shares, k, prime) != msgNum:
+		raise RuntimeError("reference reconstruction mismatch")
+	elif secretSharing.reconstructSecret(shares, k, prime) != msgNum:
+		raise RuntimeError("reconstruction mismatch")
+
+	def reconstructCold():
+		secretSharing.lagrangeCache.clear()
+		secretSharing.reconstructSecret(shares, k, prime)
+
+	refTime = timeIt(lambda: naiveReconstructSecret(shares, k, prime), repeat)
+	coldTime = timeIt(reconstructCold, repeat)
+	secretSharing.reconstructSecret(shares, k, prime)
+	cachedTime = timeIt(lambda: secretSharing.reconstructSecret(shares, k, prime), repeat)
+
+	label = "(k=%d, %d-bit)" % (k, len(bin(prime)) - 2)
+	printResult("reconstruct: batch inverse " + label, refTime, coldTime)
+	printResult("reconstruct: cached weights " + label, refTime, cachedTime)
+
+def benchReduction(count=100000, repeat=1):
+	"""Benchmarks the reduction of count products of two field elements using
+	the % operator and the reducer object returned by reduction.getReducer
+	for the 192, 256, 384 and 1279-bit primes of util.generatePrimes.
+
+	Args:
+		count: An integer value representing the number of products.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	for prime in REDUCTION_PRIMES:
+		reducer = getReducer(prime)
+		reduce = reducer.reduce
+		products = [genRandNum(prime) * genRandNum(prime) for i in range(0, count)]
+
+		if [reduce(a) for a in products] != [a % prime for a in products]:
+			raise RuntimeError("reduction mismatch")
+
+		refTime = timeIt(lambda: [a % prime for a in products], repeat)
+		newTime = timeIt(lambda: [reduce(a) for a in products], repeat)
+
+		label = "%s (%d-bit, preferred=%s)" % \
+			(reducer.__class__.__name__, len(bin(prime)) - 2, reducer.preferred)
+		printResult("reduce: " + label, refTime, newTime)
+
+def benchVectorized(count=100000, n=10, k=5, prime=MERSENNE_61, repeat=1):
+	"""Benchmarks splitting and reconstructing count small secrets with the
+	secretSharing loops and with the numpy based vectorSharing methods.
+
+	Args:
+		count: An integer value representing the number of secrets.
+		n: An integer value representing the number of shares per secret.
+		k: An integer value representing the reconstruction threshold.
+		prime: An integer value supported by vectorSharing.isSupported.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	if not vectorSharing.isSupported(prime):
+		print "vectorized: skipped, numpy not available"
+		return
+
+	secrets = [genRandNum(prime) for i in range(0, count)]
+	xList = range(1, k+1)
+
+	def splitLoop():
+		return [secretSharing.evaluatePolynomial(secret, \
+			secretSharing.randomPolynomial(k, prime), n, prime) for secret in secrets]
+
+	def reconstructLoop(sharesList):
+		return [secretSharing.reconstructSecret(shares, k, prime) for shares in sharesList]
+
+	sharesList = splitLoop()
+	shareMatrix = vectorSharing.generateShares(secrets, n, k, prime)
+	if reconstructLoop(sharesList) != secrets:
+		raise RuntimeError("reference reconstruction mismatch")
+	elif vectorSharing.reconstructSecrets(xList, shareMatrix[:, 0:k], k, prime).tolist() != secrets:
+		raise RuntimeError("vectorized reconstruction mismatch")
+
+	refTime = timeIt(splitLoop, repeat)
+	newTime = timeIt(lambda: vectorSharing.generateShares(secrets, n, k, prime), repeat)
+	label = "(%d secrets, n=%d, k=%d, %d-bit)" % (count, n, k, len(bin(prime)) - 2)
+	printResult("vectorized split " + label, refTime, newTime)
+
+	refTime = timeIt(lambda: reconstructLoop(sharesList), repeat)
+	newTime = timeIt(lambda: vectorSharing.reconstructSecrets(xList, shareMatrix[:, 0:k], k, prime), repeat)
+	printResult("vectorized reconstruct " + label, refTime, newTime)
+
+def benchByteField(size=1048576, n=10, k=5, repeat=1):
+	"""Benchmarks the throughput in MB/s of splitting and reconstructing a
+	random binary payload of size bytes over GF(2^8), and over CHUNK_PRIME
+	using chunked sharing for comparison.
+
+	Args:
+		size: An integer value of the payload size in bytes.
+		n: An integer value representing the number of shares.
+		k: An integer value representing the reconstruction threshold.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	payload = os.urandom(size)
+	label = "(%d KB, n=%d, k=%d)" % (size // 1024, n, k)
+
+	shares = secretSharing.generateShares(payload, n, k, None, field=BYTE_FIELD)
+	if secretSharing.reconstructSecret(shares[n-k:], k, None, BYTE_FIELD) != payload:
+		raise RuntimeError("GF(256) reconstruction mismatch")
+
+	splitTime = timeIt(lambda: secretSharing.generateShares(payload, n, k, None, field=BYTE_FIELD), repeat)
+	reconTime = timeIt(lambda: secretSharing.reconstructSecret(shares[n-k:], k, None, BYTE_FIELD), repeat)
+	printThroughput("gf256 split " + label, size, splitTime)
+	printThroughput("gf256 reconstruct " + label, size, reconTime)
+
+	shares = secretSharing.generateChunkedShares(payload, n, k, CHUNK_PRIME)
+	if secretSharing.reconstructChunkedSecret(shares[n-k:], k, CHUNK_PRIME) != payload:
+		raise RuntimeError("chunked reconstruction mismatch")
+
+	splitTime = timeIt(lambda: secretSharing.generateChunkedShares(payload, n, k, CHUNK_PRIME), repeat)
+	reconTime = timeIt(lambda: secretSharing.reconstructChunkedSecret(shares[n-k:], k, CHUNK_PRIME), repeat)
+	printThroughput("chunked prime split " + label, size, splitTime)
+	printThroughput("chunked prime reconstruct " + label, size, reconTime)
+
+def benchShareFile(count=100000, n=5, k=3, prime=CHUNK_PRIME, repeat=1):
+	"""Benchmarks the reconstruction of a single secret out of count secrets
+	stored in k share files, using text files of message.listToStr lists
+	that are parsed with message.strToList, and binary share files that are
+	opened with mmap.
+
+	Args:
+		count: An integer value representing the number of secrets.
+		n: An integer value representing the number of shares per secret.
+		k: An integer value representing the reconstruction threshold.
+		prime: An integer prime from util.generatePrimes.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	secrets = [genRandNum(prime) for i in range(0, count)]
+	sharesList = [polynomial.evaluateAll(secret, \
+		secretSharing.randomPolynomial(k, prime), n, prime) for secret in secrets]
+	index = count // 2
+	directory = tempfile.mkdtemp()
+
+	try:
+		textPaths, binaryPaths = [], []
+		for x in range(1, k+1):
+			textPaths.append(os.path.join(directory, "shares%d.txt" % x))
+			fp = open(textPaths[-1], "w")
+			fp.write(message.listToStr([shares[x-1] for shares in sharesList]))
+			fp.close()
+
+			binaryPaths.append(os.path.join(directory, "shares%d.ssf" % x))
+			writeShareFile(binaryPaths[-1], x, n, k, prime, \
+				(shares[x-1][1] for shares in sharesList))
+
+		def reconstructText():
+			shares = []
+			for path in textPaths:
+				fp = open(path, "r")
+				shares.append(message.strToList(fp.read())[index])
+				fp.close()
+			return secretSharing.reconstructSecret(shares, k, prime)
+
+		def reconstructBinary():
+			shareFiles = [shareFile(path) for path in binaryPaths]
+			secret = reconstructFromFiles(shareFiles, index)
+			for opened in shareFiles:
+				opened.close()
+			return secret
+
+		if reconstructText() != secrets[index]:
+			raise RuntimeError("text share file reconstruction mismatch")
+		elif reconstructBinary() != secrets[index]:
+			raise RuntimeError("binary share file reconstruction mismatch")
+
+		refTime = timeIt(reconstructText, repeat)
+		newTime = timeIt(reconstructBinary, repeat)
+		label = "(%d secrets, k=%d, %d-bit)" % (count, k, len(bin(prime)) - 2)
+		printResult("share file lookup " + label, refTime, newTime)
+	finally:
+		shutil.rmtree(directory)
+
+def benchNtt(n=4096, kList=[4, 8, 16, 32, 64, 128, 256, 1024], repeat=1):
+	"""Benchmarks the evaluation of n shares at the roots of unity and the
+	Lagrange weights of k shares over NTT_PRIME, using Horner's rule and
+	naiveReconstructSecret as the reference, and ntt.evaluateAll and
+	ntt.lagrangeWeights as the new methods, for each k in kList. The method
+	picked by ntt.preferEvaluation and ntt.preferWeights is printed for each
+	k, to check the crossovers against the timings.
+
+	Args:
+		n: An integer value representing the number of shares.
+		kList: A list of integer reconstruction thresholds not larger than n.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	field = getField(NTT_PRIME)
+	points = ntt.getPoints(n)
+
+	for k in kList:
+		msgNum = genRandNum(NTT_PRIME)
+		coefficients = secretSharing.randomPolynomial(k, NTT_PRIME)
+		shares = ntt.evaluateAll(msgNum, coefficients, n)
+		if [share[1] for share in shares] != field.hornerMany(msgNum, coefficients, points):
+			raise RuntimeError("NTT evaluation mismatch")
+
+		refTime = timeIt(lambda: field.hornerMany(msgNum, coefficients, points), repeat)
+		newTime = timeIt(lambda: ntt.evaluateAll(msgNum, coefficients, n), repeat)
+		picked = "ntt" if ntt.preferEvaluation(k) else "horner"
+		printResult("ntt evaluate (n=%d, k=%d, picks %s)" % (n, k, picked), refTime, newTime)
+
+	for k in kList:
+		shares = ntt.evaluateAll(genRandNum(NTT_PRIME), \
+			secretSharing.randomPolynomial(k, NTT_PRIME), n)[n-k:]
+		xList = [share[0] for share in shares]
+		weights = ntt.lagrangeWeights(xList)
+		if field.dot([weights[x] for x in xList], [share[1] for share in shares]) != \
+			naiveReconstructSecret(shares, k, NTT_PRIME):
+			raise RuntimeError("NTT weights mismatch")
+
+		refTime = timeIt(lambda: naiveReconstructSecret(shares, k, NTT_PRIME), repeat)
+		newTime = timeIt(lambda: ntt.lagrangeWeights(xList), repeat)
+		picked = "ntt" if ntt.preferWeights(k) else "quadratic"
+		printResult("ntt weights (k=%d, picks %s)" % (k, picked), refTime, newTime)
+
+def naiveCheckConsistency(shares, k, prime):
+	"""Reference implementation of secretSharing.checkConsistency which
+	interpolates the first k shares at the x-coordinate of every other share
+	and compares the value with the share.
+	"""
+
+	base = shares[:k]
+	for [x, y] in shares[k:]:
+		value = 0
+		for [xi, yi] in base:
+			numerator, denominator = 1, 1
+			for [xj, yj] in base:
+				if xi != xj:
+					numerator = (numerator * (x - xj)) % prime
+					denominator = (denominator * (xi - xj)) % prime
+			value += yi * numerator * secretSharing.modularInverse(denominator, prime)
+		if value % prime != y:
+			return False
+
+	return True
+
+def benchConsistency(n, k, prime, repeat=1):
+	"""Benchmarks checking that n shares lie on a polynomial of degree less
+	than k by interpolation, and by the cached parity check weights of
+	secretSharing.checkConsistency.
+
+	Args:
+		n: An integer value representing the number of shares.
+		k: An integer value representing the reconstruction threshold.
+		prime: An integer value to be used as the order of modulo operations.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	shares = polynomial.evaluateAll(genRandNum(prime), \
+		secretSharing.randomPolynomial(k, prime), n, prime)
+
+	if not naiveCheckConsistency(shares, k, prime):
+		raise RuntimeError("reference consistency check mismatch")
+	elif not secretSharing.checkConsistency(shares, k, prime):
+		raise RuntimeError("consistency check mismatch")
+
+	refTime = timeIt(lambda: naiveCheckConsistency(shares, k, prime), repeat)
+	newTime = timeIt(lambda: secretSharing.checkConsistency(shares, k, prime), repeat)
+	label = "(n=%d, k=%d, %d-bit)" % (n, k, len(bin(prime)) - 2)
+	printResult("consistency check " + label, refTime, newTime)
+
+def naiveVerifyCommitment(share, commitments, group):
+	"""Verifies the share [x, y] against the Feldman commitments of the
+	Schnorr group by a full modular exponentiation for g^y and for each
+	commitment C[j]^(x^j).
+	"""
+
+	x, y = share
+	expected = 1
+	for j in range(0, len(commitments)):
+		expected = expected * pow(commitments[j], x ** j, group.p) % group.p
+	return expected == pow(group.g, y, group.p)
+
+def benchFeldman(n, k, prime, repeat=1):
+	"""Benchmarks verifying n shares against k Feldman commitments by full
+	modular exponentiations, and by schnorrGroup.verifyShare with the cached
+	fixed-base table of g and Horner's rule in the exponent.
+
+	Args:
+		n: An integer value representing the number of shares.
+		k: An integer value representing the reconstruction threshold.
+		prime: An integer value to be used as the order of modulo operations.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	msg = "Feldman verification benchmark"
+	shares, commitments = secretSharing.generateVerifiableShares(msg, n, k, prime)
+	group = getGroup(prime)
+
+	for share in shares:
+		if not naiveVerifyCommitment(share, commitments, group):
+			raise RuntimeError("reference commitment verification mismatch")
+		elif not group.verifyShare(share[0], share[1], commitments):
+			raise RuntimeError("commitment verification mismatch")
+
+	refTime = timeIt(lambda: [naiveVerifyCommitment(share, commitments, group) \
+		for share in shares], repeat)
+	newTime = timeIt(lambda: [group.verifyShare(share[0], share[1], commitments) \
+		for share in shares], repeat)
+	label = "(n=%d, k=%d, %d-bit)" % (n, k, len(bin(prime)) - 2)
+	printResult("Feldman verification " + label, refTime, newTime)
+
+def benchMacTags(count=100000, prime=CHUNK_PRIME, repeat=1):
+	"""Benchmarks tagging and verifying count shares with the HMAC-SHA256
+	tags of secretSharing.generateMac on the serialized shares, and with the
+	polynomial hash tags of polyMac on the integer shares, and prints the
+	tags per second of both. The polyMac object is built within the timed
+	call, so the key decoding and the derivation of the one-time pads are
+	included.
+
+	Args:
+		count: An integer value specifying the number of shares.
+		prime: An integer value to be used as the order of modulo operations.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	key = generatekey(256)
+	shares = [[x, genRandNum(prime)] for x in range(1, count+1)]
+
+	def hmacTags():
+		tags = [secretSharing.generateMac(message.listToStr(share), key) for share in shares]
+		for i in range(0, count):
+			if not secretSharing.verifyMac(message.listToStr(shares[i]), key, tags[i]):
+				raise RuntimeError("HMAC tag mismatch")
+
+	def polyMacTags():
+		mac = polyMac(key, prime)
+		tags = [mac.generateTag(share) for share in shares]
+		for i in range(0, count):
+			if not mac.verifyTag(shares[i], tags[i]):
+				raise RuntimeError("polynomial hash tag mismatch")
+
+	refTime = timeIt(hmacTags, repeat)
+	newTime = timeIt(polyMacTags, repeat)
+	label = "(%d shares, %d-bit)" % (count, len(bin(prime)) - 2)
+	printResult("MAC tag and verify " + label, refTime, newTime)
+	print "%-40s ref: %10.0f tags/s  new: %10.0f tags/s" % \
+		("", count / max(refTime, 1e-9), count / max(newTime, 1e-9))
+
+def naiveGenerateMac(msg, key):
+	"""Reference implementation of secretSharing.generateMac, which decodes 
+	the key and builds a new HMAC object for every message.
+	"""
+
+	keyString = message.base64ToStr(key)
+	dig = hmac.new(keyString, msg, hashlib.sha256).digest()
+	return base64.b64encode(dig)
+
+def benchMacContext(count=100000, repeat=1):
+	"""Benchmarks tagging and verifying count serialized shares with the 
+	HMAC-SHA256 tags of naiveGenerateMac, and with the batch methods of the 
+	macContext object, which is looked up within the timed call.
+
+	Args:
+		count: An integer value specifying the number of shares.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	key = generatekey(256)
+	shareStrList = [message.listToStr([x, genRandNum(CHUNK_PRIME)]) for x in range(1, count+1)]
+
+	def naiveTags():
+		tags = [naiveGenerateMac(shareStr, key) for shareStr in shareStrList]
+		for i in range(0, count):
+			if not hmac.compare_digest(naiveGenerateMac(shareStrList[i], key), tags[i]):
+				raise RuntimeError("HMAC tag mismatch")
+
+	def contextTags():
+		context = getMacContext(key)
+		tags = context.tagMany(shareStrList)
+		if False in context.verifyMany(shareStrList, tags):
+			raise RuntimeError("HMAC tag mismatch")
+
+	refTime = timeIt(naiveTags, repeat)
+	newTime = timeIt(contextTags, repeat)
+	printResult("HMAC tag and verify (%d shares)" % count, refTime, newTime)
+
+def benchAuxInfoBatch(count=100, n=20, prime=CHUNK_PRIME, repeat=1):
+	"""Benchmarks verifying the auxilliary information of count secrets dealt
+	to the same n nodes, by checking every equation c = b*s + y with an 
+	unvalidated (c - b*s - y) % prime loop, and by folding the count equations 
+	of each pair of nodes with secretSharing.verifyAuxInfoBatch, with one 
+	equation of the first pair altered.
+
+	Args:
+		count: An integer value specifying the number of secrets.
+		n: An integer value representing the number of nodes.
+		prime: An integer value to be used as the order of modulo operations.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	pairs = []
+	for pair in range(0, n * (n - 1)):
+		sList = genRandNums(prime, count)
+		cList, bList, yList = [], [], []
+		for s in sList:
+			c, b, y = secretSharing.generateAuxInfo(s, prime)
+			cList.append(c)
+			bList.append(b)
+			yList.append(y)
+		pairs.append([sList, yList, bList, cList])
+	pairs[0][3][0] = (pairs[0][3][0] + 1) % prime
+
+	def verifyEach():
+		return [[(c - b * s - y) % prime == 0 for s, y, b, c in zip(*pair)] \
+			for pair in pairs]
+
+	def verifyBatch():
+		return [secretSharing.verifyAuxInfoBatch(sList, yList, bList, cList, prime) \
+			for sList, yList, bList, cList in pairs]
+
+	expected = verifyEach()
+	if verifyBatch() != expected:
+		raise RuntimeError("batch auxilliary information mismatch")
+	elif sum(results.count(False) for results in expected) != 1:
+		raise RuntimeError("altered auxilliary information not rejected")
+
+	refTime = timeIt(verifyEach, repeat)
+	newTime = timeIt(verifyBatch, repeat)
+	label = "(%d secrets, n=%d, %d-bit)" % (count, n, len(bin(prime)) - 2)
+	printResult("aux info checks " + label, refTime, newTime)
+
+def benchAuxInfoSize(nList=[5, 20, 100], prime=MERSENNE_1279, repeat=1):
+	"""Benchmarks the shares with auxilliary information against the shares 
+	with seeded auxilliary information for each number of nodes in nList, and 
+	prints the average share size and the total bytes sent on the wire, 
+	including the LENGTH_HEADER added by mysocket.send. The seeded shares 
+	are checked to be accepted by receiver.verifySeededAuxInfo, and one 
+	altered share to be rejected.
+
+	Args:
+		nList: A list of integer values representing the numbers of nodes.
+		prime: An integer value to be used as the order of modulo operations.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	key = generatekey(256)
+	dealer = sender([], key)
+	collector = receiver([], key)
+	for n in nList:
+		shares = [[x, genRandNum(prime)] for x in range(1, n+1)]
+		encodings = {}
+
+		def buildAuxInfo():
+			encodings["aux"] = dealer.getSharesWithAuxInfo(shares, prime)
+
+		def buildSeededAuxInfo():
+			encodings["seeded"] = dealer.getSharesWithSeededAuxInfo(shares, prime)
+
+		refTime = timeIt(buildAuxInfo, repeat)
+		newTime = timeIt(buildSeededAuxInfo, repeat)
+		printResult("aux info shares (n=%d, %d-bit)" % (n, len(bin(prime)) - 2), \
+			refTime, newTime)
+
+		sList, seedList, cList = collector.unpackSharesSeededAuxMode(encodings["seeded"])
+		sList[0][1] = (sList[0][1] + 1) % prime
+		if collector.verifySeededAuxInfo(sList, seedList, cList, prime)[0] != \
+				[False] + [True] * (n - 1):
+			raise RuntimeError("seeded aux info shares not verified")
+
+		for name in ["aux", "seeded"]:
+			sharesToSend = encodings[name]
+			shareBytes = sum(len(share) for share in sharesToSend)
+			wireBytes = sum(LENGTH_HEADER.size + len(share) for share in sharesToSend)
+			print "%-40s share: %10d bytes  wire: %12d bytes" % \
+				("  %s (n=%d)" % (name, n), shareBytes // n, wireBytes)
+
+def benchHashCommitments(n=100, t=10, prime=MERSENNE_1279, repeat=1):
+	"""Benchmarks identifying the faulty nodes among n nodes, t of which 
+	altered their shares, by checking all the auxilliary information with 
+	receiver.verifyAuxInfo, and by the majority vote on the hash commitments 
+	with receiver.verifyHashCommitments.
+
+	Args:
+		n: An integer value representing the number of nodes.
+		t: An integer value representing the number of faulty nodes.
+		prime: An integer value to be used as the order of modulo operations.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	dealer, verifier = sender([]), receiver([])
+	shares = [[x, genRandNum(prime)] for x in range(1, n+1)]
+	sList, yList, bList, cList = verifier.unpackSharesAuxMode( \
+		dealer.getSharesWithAuxInfo(shares, prime))
+	hList, saltList, digestLists = verifier.unpackSharesHashMode( \
+		dealer.getSharesWithHashCommitments(shares))
+	for i in range(0, t):
+		sList[i] = [sList[i][0], genRandNum(prime)]
+		hList[i] = sList[i]
+
+	def verifyAuxInfo():
+		honestNodes = verifier.verifyAuxInfo(sList, yList, bList, cList, t, prime)[0]
+		if honestNodes.count(False) != t:
+			raise RuntimeError("auxilliary information mismatch")
+
+	def verifyHashCommitments():
+		honestNodes = verifier.verifyHashCommitments(hList, saltList, digestLists)
+		if honestNodes.count(False) != t:
+			raise RuntimeError("hash commitment mismatch")
+
+	refTime = timeIt(verifyAuxInfo, repeat)
+	newTime = timeIt(verifyHashCommitments, repeat)
+	label = "(n=%d, t=%d, %d-bit)" % (n, t, len(bin(prime)) - 2)
+	printResult("fault identification " + label, refTime, newTime)
+
+def benchShareCodec(count=2000, n=20, prime=MERSENNE_1279, repeat=1):
+	"""Benchmarks encoding and decoding count shares of the no verification, 
+	MAC verification and auxilliary information modes as Python repr text 
+	with message.listToStr and message.strToList, and as binary strings with 
+	shareCodec, and prints the microseconds per share and bytes per share of 
+	both formats.
+
+	Args:
+		count: An integer value specifying the number of shares per mode.
+		n: An integer value representing the number of nodes for the 
+			auxilliary information shares.
+		prime: An integer value to be used as the order of modulo operations.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	dealer = sender([], generatekey(256))
+	shares = [[x % n + 1, genRandNum(prime)] for x in range(0, count)]
+	tags = getMacContext(dealer.key).tagMany([shareCodec.encodeValue(share) for share in shares])
+	auxShares = []
+	for i in range(0, count // n):
+		sharesToSend = dealer.getSharesWithAuxInfo(shares[i*n:(i+1)*n], prime)
+		auxShares += [shareCodec.decodeShare(share) for share in sharesToSend]
+
+	cases = [
+		("no verification", NO_VERIFICATION, shares, shares),
+		("MAC", MAC_VERIFICATION, [[message.listToStr(share), tag] \
+			for share, tag in zip(shares, tags)], [[shareCodec.encodeValue(share), tag] \
+			for share, tag in zip(shares, tags)]),
+		("aux info n=%d" % n, AUX_INFO_VERIFICATION, auxShares, auxShares),
+	]
+
+	for name, mode, textShares, binaryShares in cases:
+		size = len(textShares)
+		encoded = {}
+
+		def encodeText():
+			encoded["text"] = [message.listToStr(shareList) for shareList in textShares]
+
+		def encodeBinary():
+			encoded["binary"] = [shareCodec.encodeShare(shareList, mode) for shareList in binaryShares]
+
+		def decodeText():
+			for share in encoded["text"]:
+				message.strToList(share)
+
+		def decodeBinary():
+			for share in encoded["binary"]:
+				shareCodec.decodeShare(share, mode)
+
+		label = "%s (%d-bit)" % (name, len(bin(prime)) - 2)
+		for operation, refFunc, newFunc in [("encode ", encodeText, encodeBinary), \
+			("decode ", decodeText, decodeBinary)]:
+			refTime = timeIt(refFunc, repeat)
+			newTime = timeIt(newFunc, repeat)
+			printResult(operation + label, refTime, newTime)
+			print "%-40s ref: %10.2f us/share  new: %10.2f us/share" % \
+				("", refTime * 1e6 / size, newTime * 1e6 / size)
+		print "%-40s ref: %10d B/share   new: %10d B/share" % \
+			("", sum(len(share) for share in encoded["text"]) // size, \
+			sum(len(share) for share in encoded["binary"]) // size)
+
+def benchRecv(size=1048576, count=20, buffer=1024, repeat=1):
+	"""Benchmarks receiving count messages of size bytes over a connected 
+	pair of sockets with mysocket.recv, using the decimal length and 
+	separator framing with the given buffer size, and using the length 
+	header framing with recv_into, and prints the throughput of both.
+
+	Args:
+		size: An integer value specifying the size of each message in bytes.
+		count: An integer value specifying the number of messages.
+		buffer: An integer value specifying the buffer size for receiving data.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	msg = os.urandom(size)
+
+	def receiveAll(separator):
+		senderSock, receiverSock = socket.socketpair()
+		senderSock, receiverSock = mysocket(senderSock), mysocket(receiverSock)
+
+		def sendAll():
+			for index in range(0, count):
+				if separator == None:
+					senderSock.send(msg)
+				else:
+					senderSock.sock.sendall(str(size) + separator + msg)
+
+		thread = threading.Thread(target=sendAll)
+		thread.start()
+		for index in range(0, count):
+			if len(receiverSock.recv(buffer, separator)) != size:
+				raise RuntimeError("message size mismatch")
+		thread.join()
+		senderSock.close()
+		receiverSock.close()
+
+	refTime = timeIt(lambda: receiveAll(","), repeat)
+	newTime = timeIt(lambda: receiveAll(None), repeat)
+	label = "(%d x %d bytes, buffer=%d)" % (count, size, buffer)
+	printResult("recv " + label, refTime, newTime)
+	print "%-40s ref: %10.2f MB/s     new: %10.2f MB/s" % ("", \
+		size * count / (1024.0 * 1024.0) / max(refTime, 1e-9), \
+		size * count / (1024.0 * 1024.0) / max(newTime, 1e-9))
+
+def naiveSend(sock, msg, separator):
+	"""Sends msg prefixed with its decimal length and separator as in the 
+	original mysocket.send, by concatenating them and re-slicing the 
+	remaining string after each partial send.
+
+	Args:
+		sock: A socket object.
+		msg: A string message to be sent.
+		separator: A string separator between message length and content.
+	"""
+
+	msg = str(len(msg)) + separator + msg
+	totalsent = 0
+	while totalsent < len(msg):
+		sent = sock.send(msg[totalsent:])
+		if sent == 0:
+			raise RuntimeError("socket connection broken")
+		totalsent = totalsent + sent
+
+def benchSend(size=1048576, count=20, batch=1, repeat=1):
+	"""Benchmarks sending count messages of size bytes over a connected 
+	pair of sockets, with naiveSend one message at a time, and with 
+	mysocket.send, or mysocket.sendMany in batches of the given number 
+	of messages, and prints the times of both. The bytes sent are 
+	drained by a receiving thread.
+
+	Args:
+		size: An integer value specifying the size of each message in bytes.
+		count: An integer value specifying the number of messages.
+		batch: An integer value specifying the number of messages per sendMany.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	msg = os.urandom(size)
+
+	def sendAll(batched):
+		senderSock, receiverSock = socket.socketpair()
+		senderSock, receiverSock = mysocket(senderSock), mysocket(receiverSock)
+
+		def receiveAll():
+			prefix = 4 if batched else len(str(size)) + 1
+			receiverSock.recvInto(memoryview(bytearray((prefix + size) * count)))
+
+		thread = threading.Thread(target=receiveAll)
+		thread.start()
+		for index in range(0, count, batch):
+			if batched and batch == 1:
+				senderSock.send(msg)
+			elif batched:
+				senderSock.sendMany([msg] * min(batch, count - index))
+			else:
+				for msgIndex in range(index, min(index + batch, count)):
+					naiveSend(senderSock.sock, msg, ",")
+		thread.join()
+		senderSock.close()
+		receiverSock.close()
+
+	refTime = timeIt(lambda: sendAll(False), repeat)
+	newTime = timeIt(lambda: sendAll(True), repeat)
+	label = "(%d x %d bytes, batch=%d)" % (count, size, batch)
+	printResult("send " + label, refTime, newTime)
+
+def benchFraming(size=400, rounds=100, nodelay=False, repeat=1):
+	"""Benchmarks rounds of sending a message of size bytes over a loopback 
+	TCP connection and waiting for a one byte reply, with the LENGTH_HEADER 
+	and the message written by two sendall calls, and with mysocket.send, 
+	which joins them when the message is at most MAX_JOIN_SIZE bytes. When 
+	nodelay is True, TCP_NODELAY is set on the sending socket to disable 
+	Nagle's algorithm.
+
+	Args:
+		size: An integer value specifying the size of each message in bytes.
+		rounds: An integer value specifying the number of round trips.
+		nodelay: A boolean specifying whether TCP_NODELAY is set.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	msg = os.urandom(size)
+
+	def sendAll(joined):
+		listener = mysocket()
+		listener.sock.bind(("127.0.0.1", 0))
+		listener.listen(1)
+
+		def reply():
+			client = listener.accept()[0]
+			for index in range(0, rounds):
+				client.recv(65536)
+				client.sock.sendall("k")
+			client.close()
+
+		thread = threading.Thread(target=reply)
+		thread.start()
+		senderSock = mysocket()
+		senderSock.connect(listener.sock.getsockname())
+		if nodelay:
+			senderSock.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+		for index in range(0, rounds):
+			if joined:
+				senderSock.send(msg)
+			else:
+				senderSock.sock.sendall(LENGTH_HEADER.pack(size))
+				senderSock.sock.sendall(msg)
+			senderSock.sock.recv(1)
+		thread.join()
+		senderSock.close()
+		listener.close()
+
+	refTime = timeIt(lambda: sendAll(False), repeat)
+	newTime = timeIt(lambda: sendAll(True), repeat)
+	label = "(%d bytes, nodelay=%s)" % (size, nodelay)
+	printResult("framing round trips " + label, refTime, newTime)
+
+def benchFanOut(n=20, delay=0.02, size=65536, repeat=1):
+	"""Benchmarks sender.deliverShares delivering a share of size bytes 
+	to each of n local nodes that wait delay seconds before reading it, 
+	with one worker as in the sequential delivery and with MAX_WORKERS 
+	workers, and prints the times of both. Small socket buffers make the 
+	sender wait for each node.
+
+	Args:
+		n: An integer value representing the number of nodes.
+		delay: A float value of the time in seconds each node waits.
+		size: An integer value specifying the size of each share in bytes.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	share = shareCodec.encodeShare([os.urandom(size)], NO_VERIFICATION)
+	listeners = []
+	for i in range(0, n):
+		listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+		listener.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+		listener.bind(("127.0.0.1", 0))
+		listener.listen(5)
+		listeners.append(listener)
+	nodes = [listener.getsockname() for listener in listeners]
+
+	def serve(listener):
+		while True:
+			try:
+				client = listener.accept()[0]
+			except socket.error:
+				return
+			sleep(delay)
+			while client.recv(65536) != "":
+				pass
+			client.close()
+
+	for listener in listeners:
+		thread = threading.Thread(target=serve, args=(listener,))
+		thread.daemon = True
+		thread.start()
+
+	def deliverAll(workers):
+		s = sender([], None, True)
+		s.sock = []
+		for i in range(0, n):
+			s.sock.append(mysocket())
+			s.sock[-1].sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+
+		stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+		try:
+			report = s.deliverShares([share] * n, nodes, workers)
+		finally:
+			sys.stdout.close()
+			sys.stdout = stdout
+
+		if [entry[1] for entry in report].count(True) != n:
+			raise RuntimeError("share delivery failed")
+
+	refTime = timeIt(lambda: deliverAll(1), repeat)
+	newTime = timeIt(lambda: deliverAll(MAX_WORKERS), repeat)
+	for listener in listeners:
+		listener.close()
+
+	label = "(n=%d, delay=%.3fs)" % (n, delay)
+	printResult("deliver shares " + label, refTime, newTime)
+
+def benchFanIn(n=20, k=10, maxDelay=0.05, repeat=1):
+	"""Benchmarks receiver.getShares collecting the hash commitment mode 
+	shares of n local nodes, the i-th of which waits i * maxDelay / n 
+	seconds before sending its share. The nodes are queried one at a time 
+	as in the sequential collection, and concurrently until k shares are 
+	received, and the times of both are printed.
+
+	Args:
+		n: An integer value representing the number of nodes.
+		k: An integer value representing the number of shares awaited.
+		maxDelay: A float value of the longest time in seconds a node waits.
+		repeat: An integer specifying the number of repetitions.
+	"""
+
+	prime = 2**127 - 1
+	shares = secretSharing.generateShares("fan-in", n, k, prime)
+	salts, digests = secretSharing.generateHashCommitments(shares)
+	sharesToSend = [shareCodec.encodeShare([shares[i], salts[i], digests], \
+		HASH_VERIFICATION) for i in range(0, n)]
+
+	listeners = []
+	for i in range(0, n):
+		listener = mysocket()
+		listener.sock.bind(("127.0.0.1", 0))
+		listener.listen(n)
+		listeners.append(listener)
+	nodes = [listener.sock.getsockname() for listener in listeners]
+
+	def serve(listener, share, delay):
+		while True:
+			try:
+				client = listener.accept()[0]
+			except socket.error:
+				return
+			sleep(delay)
+			client.send(share)
+			client.close()
+
+	for i in range(0, n):
+		thread = threading.Thread(target=serve, \
+			args=(listeners[i], sharesToSend[i], i * maxDelay / n))
+		thread.daemon = True
+		thread.start()
+
+	def collectAll(workers, quorum):
+		r = receiver([], None, True)
+		r.sock = [mysocket() for i in range(0, n)]
+		received = r.getShares(nodes, 1024, 10.0, quorum, workers)
+		if len(received) - received.count(None) < min(quorum or n, n):
+			raise RuntimeError("share collection failed")
+
+	stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+	try:
+		refTime = timeIt(lambda: collectAll(1, None), repeat)
+		newTime = timeIt(lambda: collectAll(MAX_WORKERS, k), repeat)
+		sleep(2 * maxDelay)
+	finally:
+		sys.stdout.close()
+		sys.stdout = stdout
+	for listener in listeners:
+		listener.close()
+
+	label = "(n=%d, k=%d, delay<=%.3fs)" % (n, k, maxDelay)
+	printResult("collect shares " + label, refTime, newTime)
+
+
+#############################################################
+#					Boilerplate Code						#
+#############################################################
+
+if __name__ == "__main__":		#code to execute if called from command-line
+	parser = argparse.ArgumentParser(description="Benchmark secret sharing operations")
+	parser.add_argument("-b", "--benchmark", default="all")
+	parser.add_argument("-n", "--nodes", type=int, default=500)
+	parser.add_argument("-k", "--klimit", type=int, default=250)
+	parser.add_argument("-r", "--repeat", type=int, default=1)
+
+	args = parser.parse_args()
+	n, k, repeat = args.nodes, args.klimit, args.repeat
+
+	print "-" * 50
+	if args.benchmark in ["all", "eval"]:
+		benchEvaluation(n, k, MERSENNE_1279, repeat)
+	if args.benchmark in ["all", "recon"]:
+		benchReconstruction(n, k, MERSENNE_1279, repeat)
+	if args.benchmark in ["all", "reduce"]:
+		benchReduction(100000, repeat)
+	if args.benchmark in ["all", "numpy"]:
+		benchVectorized(100000, 10, 5, MERSENNE_61, repeat)
+		benchVectorized(100000, 10, 5, 2**31 - 1, repeat)
+	if args.benchmark in ["all", "gf256"]:
+		benchByteField(262144, 10, 5, repeat)
+	if args.benchmark in ["all", "sharefile"]:
+		benchShareFile(100000, 5, 3, CHUNK_PRIME, repeat)
+	if args.benchmark in ["all", "ntt"]:
+		benchNtt(4096, [4, 8, 16, 32, 64, 128, 256, 1024], repeat)
+	if args.benchmark in ["all", "parity"]:
+		benchConsistency(n, k, MERSENNE_1279, repeat)
+	if args.benchmark in ["all", "feldman"]:
+		benchFeldman(100, 10, MERSENNE_1279, repeat)
+	if args.benchmark in ["all", "mac"]:
+		benchMacTags(100000, CHUNK_PRIME, repeat)
+	if args.benchmark in ["all", "hmac"]:
+		benchMacContext(100000, repeat)
+	if args.benchmark in ["all", "codec"]:
+		benchShareCodec(2000, 20, MERSENNE_1279, repeat)
+		benchShareCodec(2000, 20, CHUNK_PRIME, repeat)
+	if args.benchmark in ["all", "recv"]:
+		benchRecv(1048576, 20, 1024, repeat)
+		benchRecv(1048576, 20, 65536, repeat)
+		benchRecv(10240, 2000, 1024, repeat)
+	if args.benchmark in ["all", "send"]:
+		benchSend(1048576, 20, 1, repeat)
+		benchSend(200, 5000, 1, repeat)
+		benchSend(200, 5000, 50, repeat)
+	if args.benchmark in ["all", "framing"]:
+		for size in [400, 4096, 65536, 262144]:
+			benchFraming(size, 100, False, repeat)
+			benchFraming(size, 100, True, repeat)
+	if args.benchmark in ["all", "fanout"]:
+		benchFanOut(20, 0.02, 65536, repeat)
+		benchFanOut(100, 0.02, 65536, repeat)
+	if args.benchmark in ["all", "fanin"]:
+		benchFanIn(20, 10, 0.05, repeat)
+		benchFanIn(100, 50, 0.05, repeat)
+	if args.benchmark in ["all", "auxbatch"]:
+		benchAuxInfoBatch(100, 20, CHUNK_PRIME, repeat)
+		benchAuxInfoBatch(100, 20, MERSENNE_1279, repeat)
+	if args.benchmark in ["all", "auxsize"]:
+		benchAuxInfoSize([5, 20, 100], MERSENNE_1279, repeat)
+	if args.benchmark in ["all", "hashvote"]:
+		benchHashCommitments(100, 10, MERSENNE_1279, repeat)
+		benchHashCommitments(100, 10, CHUNK_PRIME, repeat)
+	print "-" * 50
+
+##################### End of Code ###########################
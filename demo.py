@@ -12,11 +12,14 @@ The algorithm used is as follows:
 	1. Takes the number of intermediate nodes (n), the number 
 		of shares required for reconstruction (k) and the 
 		number of faulty nodes (t) as command line arguments.
-	2. Accepts secret message (maximum length 159 characters) 
-		and verification mode (1, 2 or 3) as console input.
+	2. Accepts secret message (maximum length 159 characters, 
+		or CHUNK_LIMIT characters in chunked mode) and 
+		verification mode (1 to 7, or 1, 3, 5 or 7 in chunked mode) 
+		as console input.
 	3. Generates a prime number larger than the integer 
 		equivalent of the secret message as the order of 
-		modulo operations.
+		modulo operations. In chunked mode, CHUNK_PRIME is
+		used instead.
 	4. Generates a 256-bit cryptographically secure random 
 		key to be shared with sender and receiver nodes for 
 		MAC mode verification.
@@ -34,7 +37,7 @@ The algorithm used is as follows:
 Global Methods:
 ~~~~~~~~~~~~~~~
 	getSecretMessage(limit)
-	getVerificationMode()
+	getVerificationMode(chunked)
 	generateFile(data, fileName)
 	initNodes(n, t, nodePorts, verbose)
 	initClient(clientPy, verbose)
@@ -42,7 +45,7 @@ Global Methods:
 Usage:
 ~~~~~~
 Execute the following format command in a linux/unix shell.
-./demo.py -n <nodes> -k <shares> [-t <faulty>] [-v] [-d]
+./demo.py -n <nodes> -k <shares> [-t <faulty>] [-c] [-v] [-d]
 	-n <nodes> is an integer value representing the number 
 		of intermediate nodes and number of shares to be 
 		generated.
@@ -52,6 +55,9 @@ Execute the following format command in a linux/unix shell.
 	-t <faulty> is an integer value representing the 
 		maximum number of faulty nodes allowed. Default 
 		Value is 0.
+	-c is for chunked mode. If used, the secret message is 
+		split into blocks that are shared separately, which 
+		allows messages longer than 159 characters.
 	-v is for verbose mode. If used, the intermediate node 
 		shell windows remain open after the execution is 
 		complete. Otherwise, they terminate.
@@ -65,6 +71,7 @@ import argparse
 import random
 import os
 from modules.util import generatekey, getLargePrime, message
+from modules.secretSharing import CHUNK_PRIME
 
 #################### Module Metadata ########################
 __author__ = "Saurabh Gupta, Omkar Kaptan"
@@ -85,6 +92,9 @@ portOption = " -p "
 faultyOption = " -f"
 debugOption = " -d"
 
+########### Global variables for chunked mode ###############
+CHUNK_LIMIT = 65536
+
 #################### Method Definitions #####################
 
 def getSecretMessage(limit):
@@ -108,28 +118,46 @@ def getSecretMessage(limit):
 
 	return secret
 
-def getVerificationMode():
-	"""Gets an integer value in the range [1-3], corresponding to the verification 
-	modes, from the user and returns the value. 
+def getVerificationMode(chunked=False):
+	"""Gets an integer value in the range [1-7], corresponding to the verification 
+	modes, from the user and returns the value. In chunked mode, Information 
+	Theoretic, Feldman Commitment and Seeded Information Theoretic Verification 
+	are not available and only 1, 3, 5 or 7 is accepted.
+
+	Args:
+		chunked: A boolean specifying whether or not chunked mode is selected.
+			Default value = False.
 
 	Returns:
-		An integer in the range [1-3] for the corresponding verification mode.
+		An integer in the range [1-7] for the corresponding verification mode.
 	"""
 
+	if chunked == True:
+		modes = [1, 3, 5, 7]
+	else:
+		modes = [1, 2, 3, 4, 5, 6, 7]
+
 	mode = 0
 	print "Select a mode of verification:"
 	print "1. No Verification"
-	print "2. Information Theoretic Verification"
+	if 2 in modes:
+		print "2. Information Theoretic Verification"
 	print "3. MAC Verification"
-
-	while mode not in range(1, 4):
-		modeStr = raw_input("[1-3]: ")
+	if 4 in modes:
+		print "4. Feldman Commitment Verification"
+	print "5. Polynomial Hash MAC Verification"
+	if 6 in modes:
+		print "6. Seeded Information Theoretic Verification"
+	print "7. Hash Commitment Verification"
+
+	while mode not in modes:
+		modeStr = raw_input("[%s]: " % ", ".join(str(m) for m in modes))
 		try:
 			mode = int(modeStr)
-			if mode not in range(1, 4):
+			if mode not in modes:
 				raise ValueError()
 		except:
-			print "Invalid input: integer in range [1-3] expected."
+			print "Invalid input: integer in %s expected." % modes
 			mode = 0
 
 	return mode
@@ -227,8 +255,10 @@ if __name__ == "__main__":		#code to execute if called from command-line
 	parser.add_argument("-n", "--nodes", type=int)
 	parser.add_argument("-k", "--klimit", type=int)
 	parser.add_argument("-t", "--tolerance", type=int)
+	parser.add_argument("-c", "--chunked", dest="chunked", action='store_true')
 	parser.add_argument("-v", "--verbose", dest="verbose", action='store_true')
 	parser.add_argument("-d", "--debug", dest="debug", action='store_true')
+	parser.set_defaults(chunked=False)
 	parser.set_defaults(verbose=False)
 	parser.set_defaults(debug=False)
 
@@ -248,13 +278,19 @@ if __name__ == "__main__":		#code to execute if called from command-line
 		t = min(args.tolerance, k-1, n-k)
 
 	print "-" * 50
-	secret = getSecretMessage(159)
+	if args.chunked == True:
+		secret = getSecretMessage(CHUNK_LIMIT)
+	else:
+		secret = getSecretMessage(159)
 	print "-" * 50
-	mode = getVerificationMode()
+	mode = getVerificationMode(args.chunked)
 	print "-" * 50
 
-	secretNum = message.strToNum(secret)
-	prime = getLargePrime(secretNum)
+	if args.chunked == True:
+		prime = CHUNK_PRIME
+	else:
+		secretNum = message.strToNum(secret)
+		prime = getLargePrime(secretNum)
 	key = generatekey(256)
 	buf = 1024
 
@@ -265,11 +301,11 @@ if __name__ == "__main__":		#code to execute if called from command-line
 
 	senderDict = {'msg': secret, 'n': n, 'k': k, 'mode': mode,
 				  'prime': prime, 'key': key, 'ports': senderPorts,
-				  'nodes': nodePorts}
+				  'nodes': nodePorts, 'chunked': args.chunked}
 
 	recvrDict = {'k': k, 'mode': mode, 't': t, 'buffer': buf,
 				  'prime': prime, 'key': key, 'ports': receiverPorts,
-				  'nodes': nodePorts}
+				  'nodes': nodePorts, 'chunked': args.chunked}
 
 	nodeDict = {'mode': mode, 'buffer': buf, 'sender': senderPorts,
 				  'receiver': receiverPorts}
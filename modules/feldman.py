@@ -0,0 +1,336 @@
+#!/usr/bin/python
+
+#############################################################
+# CSE 539 (Applied Cryptography) Fall 2015 - Project        #
+# Team: Saurabh Gupta, Omkar Kaptan                         #
+# Instructor: Dr. Rida Bazzi                                #
+#############################################################
+
+"""Provides a Schnorr group module for Feldman verifiable secret
+sharing.
+
+For a sharing prime q, the Schnorr group is the subgroup of order q
+of the integers modulo a prime p = 2 * m * q + 1 of FELDMAN_GROUP_BITS
+bits, generated by g = h^(2 * m) mod p. The dealer publishes the k
+commitments C[j] = g^a[j] to the coefficients a[0], ..., a[k-1] of
+the sharing polynomial, a[0] being the secret. A share [x, y] is then
+valid iff g^y = C[0] * C[1]^x * ... * C[k-1]^(x^(k-1)) mod p, which is
+checked by Horner's rule in the exponent with small exponents x.
+
+The group is derived deterministically from q by searching m upwards
+from the smallest value giving FELDMAN_GROUP_BITS bits, so the dealer
+and the verifiers agree on it without exchanging it. The search
+results for the primes of util.generatePrimes, CHUNK_PRIME and
+NTT_PRIME are stored in GROUP_OFFSETS, which skips the primality
+tests for them.
+
+The powers of g are computed with a fixed-base windowed table holding
+g^(d * 2^(WINDOW_BITS * i)) for every window i and digit d, so that
+g^y costs one multiplication per window instead of a full modular
+exponentiation. The tables are cached per generator.
+
+The commitments are only computationally hiding: C[0] = g^secret
+reveals the secret to anyone able to compute discrete logarithms in
+the group, or to check a guess of a low entropy secret.
+
+Global Variables
+~~~~~~~~~~~~~~~~
+    FELDMAN_GROUP_BITS - the bit length of the group modulus p
+    WINDOW_BITS - the window width of the fixed-base tables
+    GROUP_OFFSETS - the known offsets of m for the usual primes q
+    SMALL_PRIMES - the odd primes used for trial division and as
+        Miller-Rabin bases
+
+Global Methods
+~~~~~~~~~~~~~~
+    isProbablePrime(num, rounds)
+    getGroup(prime)
+
+Class schnorrGroup
+~~~~~~~~~~~~~~~~~~
+    Class Attributes:
+        tableCache - cache of fixed-base tables keyed by (g, p)
+        maxTableCache - maximum number of cached tables
+    Attributes:
+        q - the order of the group
+        p - the modulus of the group
+        g - the generator of the group
+        table - the fixed-base table of g
+    Constructor:
+        __init__(self, q, p, g)
+    Static Methods:
+        getTable(g, p, bits)
+    Methods:
+        power(self, e)
+        commit(self, coefficients)
+        verifyShare(self, x, y, commitments)
+"""
+
+#################### Import modules #########################
+from collections import OrderedDict
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+#################### Module Metadata ########################
+__author__ = "Saurabh Gupta, Omkar Kaptan"
+__email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
+__license__ = "GPL"
+__version__ = "1.0"
+
+############ Global Variables for Schnorr Groups ############
+FELDMAN_GROUP_BITS = 2048
+WINDOW_BITS = 4
+GROUP_OFFSETS = {2**31 - 1: 872, 2**61 - 1: 1236, 2**89 - 1: 475,
+    2**107 - 1: 1145, 2**127 - 1: 398, 2**192 - 237: 1994,
+    2**256 - 189: 1282, 2**320 - 197: 1244, 2**384 - 317: 680,
+    2**521 - 1: 26, 2**607 - 1: 2412, 2**1279 - 1: 3041,
+    (2**192 - 139) * 2**64 + 1: 777}
+SMALL_PRIMES = [num for num in range(3, 1000, 2) \
+    if all(num % d != 0 for d in range(3, int(num ** 0.5) + 1, 2))]
+
+groupCache = OrderedDict()
+maxGroupCache = 16
+
+#################### Method Definitions #####################
+
+def isProbablePrime(num, rounds=32):
+    """Returns whether num is a probable prime, using gmpy2.is_prime when
+    gmpy2 is available. Otherwise, num is divided by SMALL_PRIMES and then
+    tested by the Miller-Rabin test with the first rounds of SMALL_PRIMES
+    as bases.
+
+    Args:
+        num: An integer value to be tested.
+        rounds: An integer value specifying the number of Miller-Rabin
+            rounds. Default value = 32.
+
+    Returns:
+        A boolean, True if num is a probable prime and False otherwise.
+    """
+
+    if num < 2:
+        return False
+    elif gmpy2 != None:
+        return bool(gmpy2.is_prime(num, rounds))
+    elif num % 2 == 0:
+        return num == 2
+
+    for smallPrime in SMALL_PRIMES:
+        if num % smallPrime == 0:
+            return num == smallPrime
+
+    d, s = num - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+
+    for base in SMALL_PRIMES[:rounds]:
+        value = pow(base, d, num)
+        if value == 1 or value == num - 1:
+            continue
+        for i in range(1, s):
+            value = value * value % num
+            if value == num - 1:
+                break
+        else:
+            return False
+
+    return True
+
+def getGroup(prime):
+    """Returns the Schnorr group of order prime, i.e. the subgroup of order
+    prime modulo p = 2 * m * prime + 1, where m is the smallest value from
+    2^(FELDMAN_GROUP_BITS - 1) / (2 * prime) upwards for which p is prime,
+    and the generator is g = h^(2 * m) mod p for the smallest h > 1 with
+    g != 1. Groups are cached by prime.
+
+    Args:
+        prime: An integer prime value specifying the order of the group.
+
+    Returns:
+        A schnorrGroup object for the given prime.
+
+    Raises:
+        TypeError: Error when prime is not an integer.
+        ValueError: Error when prime is not a prime number smaller than
+            2^(FELDMAN_GROUP_BITS - 2).
+    """
+
+    if type(prime) not in [int, long]:
+        raise TypeError("invalid prime: int or long expected")
+
+    group = groupCache.pop(prime, None)
+
+    if group == None:
+        if prime < 3 or prime >= 2 ** (FELDMAN_GROUP_BITS - 2):
+            raise ValueError("invalid prime: value smaller than 2^%d expected" \
+                % (FELDMAN_GROUP_BITS - 2))
+
+        m = (1 << (FELDMAN_GROUP_BITS - 1)) // (2 * prime) + 1
+        if prime in GROUP_OFFSETS:
+            m += GROUP_OFFSETS[prime]
+        elif not isProbablePrime(prime):
+            raise ValueError("invalid prime: prime number expected")
+        else:
+            while not isProbablePrime(2 * m * prime + 1):
+                m += 1
+
+        p = 2 * m * prime + 1
+        h = 2
+        while pow(h, 2 * m, p) == 1:
+            h += 1
+        group = schnorrGroup(prime, p, pow(h, 2 * m, p))
+
+        while len(groupCache) >= maxGroupCache:
+            groupCache.popitem(last=False)
+
+    groupCache[prime] = group
+    return group
+
+#############################################################
+#                    Class: schnorrGroup                    #
+#############################################################
+
+class schnorrGroup:
+    """A class for Feldman commitments in a Schnorr group.
+
+    Class Attributes:
+        tableCache: An OrderedDict mapping (g, p) to the fixed-base table of
+            g modulo p, in least recently used order.
+        maxTableCache: An integer specifying the maximum number of cached
+            tables.
+
+    Attributes:
+        q: An integer prime value for the order of the group.
+        p: An integer prime value for the modulus of the group.
+        g: An integer generator of the group.
+        table: A list of lists, where table[i][d] = g^(d * 2^(WINDOW_BITS * i))
+            mod p.
+    """
+
+    tableCache = OrderedDict()
+    maxTableCache = 8
+
+    def __init__(self, q, p, g):
+        """Initializes the group object and gets the fixed-base table of g.
+
+        Args:
+            q: An integer prime value for the order of the group.
+            p: An integer prime value for the modulus, with q dividing p - 1.
+            g: An integer generator of the subgroup of order q modulo p.
+        """
+
+        self.q, self.p, self.g = q, p, g
+        self.table = schnorrGroup.getTable(g, p, q.bit_length())
+
+    @staticmethod
+    def getTable(g, p, bits):
+        """Returns the fixed-base table of g modulo p for exponents of up to
+        bits bits. Row i of the table holds g^(d * 2^(WINDOW_BITS * i)) for
+        the digits d = 0, ..., 2^WINDOW_BITS - 1. The values are gmpy2.mpz
+        values when gmpy2 is available. Tables are cached by (g, p).
+
+        Args:
+            g: An integer value for the fixed base.
+            p: An integer value for the modulus.
+            bits: An integer value for the maximum bit length of exponents.
+
+        Returns:
+            A list of (bits + WINDOW_BITS - 1) / WINDOW_BITS rows.
+        """
+
+        key = (g, p)
+        table = schnorrGroup.tableCache.pop(key, None)
+
+        if table == None:
+            if gmpy2 != None:
+                g, p = gmpy2.mpz(g), gmpy2.mpz(p)
+
+            table = []
+            base = g
+            for i in range(0, (bits + WINDOW_BITS - 1) // WINDOW_BITS):
+                row = [1, base]
+                for d in range(2, 1 << WINDOW_BITS):
+                    row.append(row[-1] * base % p)
+                table.append(row)
+                base = row[-1] * base % p
+
+            while len(schnorrGroup.tableCache) >= schnorrGroup.maxTableCache:
+                schnorrGroup.tableCache.popitem(last=False)
+
+        schnorrGroup.tableCache[key] = table
+        return table
+
+    def power(self, e):
+        """Returns g^e mod p using the fixed-base table, with one modular
+        multiplication per non-zero window of e mod q.
+
+        Args:
+            e: An integer exponent.
+
+        Returns:
+            An integer value of g^e mod p.
+        """
+
+        e %= self.q
+        mask = (1 << WINDOW_BITS) - 1
+        result = 1
+        i = 0
+        while e != 0:
+            d = e & mask
+            if d != 0:
+                result = result * self.table[i][d] % self.p
+            e >>= WINDOW_BITS
+            i += 1
+
+        return int(result)
+
+    def commit(self, coefficients):
+        """Returns the list of Feldman commitments g^a mod p for the
+        coefficients a of the sharing polynomial, lowest degree first.
+
+        Args:
+            coefficients: A list of integer coefficients, starting with the
+                secret.
+
+        Returns:
+            A list of integer commitments.
+        """
+
+        return [self.power(coeff) for coeff in coefficients]
+
+    def verifyShare(self, x, y, commitments):
+        """Verifies the share [x, y] against the commitments by checking
+        g^y = C[0] * C[1]^x * ... * C[k-1]^(x^(k-1)) mod p, where the right
+        hand side is computed by Horner's rule in the exponent.
+
+        Args:
+            x: An integer x-coordinate of the share.
+            y: An integer share value.
+            commitments: A list of integer commitments returned by commit.
+
+        Returns:
+            A boolean, True if the share is consistent with the commitments
+                and False otherwise.
+        """
+
+        p = self.p
+        x %= self.q
+        for commitment in commitments:
+            if type(commitment) not in [int, long] or commitment < 1 or commitment >= p:
+                return False
+
+        if gmpy2 != None:
+            expected = gmpy2.mpz(1)
+            for commitment in reversed(commitments):
+                expected = gmpy2.powmod(expected, x, p) * commitment % p
+        else:
+            expected = 1
+            for commitment in reversed(commitments):
+                expected = pow(expected, x, p) * commitment % p
+
+        return expected == self.power(y)
+
+##################### End of Code ###########################
@@ -0,0 +1,266 @@
+#!/usr/bin/python
+
+#############################################################
+# CSE 539 (Applied Cryptography) Fall 2015 - Project        #
+# Team: Saurabh Gupta, Omkar Kaptan                         #
+# Instructor: Dr. Rida Bazzi                                #
+#############################################################
+
+"""Provides an (n, k) secret sharing module over the binary field
+GF(2^8) for sharing binary payloads byte by byte.
+
+Each byte of the secret is shared independently with its own random
+polynomial, and the share at x holds one byte per secret byte, so a
+share is exactly as long as the secret. Field multiplication uses
+log/antilog tables for the AES polynomial x^8 + x^4 + x^3 + x + 1
+with generator 3.
+
+Instead of looping over the bytes in Python, a share is computed by
+Horner's rule on whole byte strings: multiplying every byte by a
+constant c is a str.translate with the multiplication table of c,
+and the addition of two byte strings is a XOR of their uint8 arrays
+when numpy is installed, or of their integer values otherwise.
+
+Global Variables
+~~~~~~~~~~~~~~~~
+    EXP - antilog table, EXP[i] = 3^i for i in 0..509
+    LOG - log table, LOG[a] = i such that 3^i = a for a in 1..255
+
+Class gf256
+~~~~~~~~~~~
+    Class Attributes:
+        mulTables - cache of byte multiplication tables
+    Static Methods:
+        mul(a, b)
+        div(a, b)
+        getMulTable(c)
+        mulBytes(data, c)
+        xorBytes(a, b)
+        lagrangeWeights(xList)
+        generateShares(msg, n, k)
+        reconstructSecret(shares, k)
+"""
+
+#################### Import modules #########################
+import os
+import binascii
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#################### Module Metadata ########################
+__author__ = "Saurabh Gupta, Omkar Kaptan"
+__email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
+__license__ = "GPL"
+__version__ = "1.0"
+
+############### Global Variables for Tables #################
+EXP = [0] * 510
+LOG = [0] * 256
+
+value = 1
+for i in range(0, 255):
+    EXP[i] = EXP[i + 255] = value
+    LOG[value] = i
+    value ^= (value << 1) ^ (0x11b if value & 0x80 else 0)
+del value, i
+
+#############################################################
+#                    Class: gf256                           #
+#############################################################
+
+class gf256:
+    """A class of static methods for secret sharing over GF(2^8).
+
+    Class Attributes:
+        mulTables: A dict mapping a byte value c to the 256 character
+            translation table of multiplication by c.
+    """
+
+    mulTables = {}
+
+    @staticmethod
+    def mul(a, b):
+        """Returns the product of the bytes a and b in GF(2^8)."""
+
+        if a == 0 or b == 0:
+            return 0
+        return EXP[LOG[a] + LOG[b]]
+
+    @staticmethod
+    def div(a, b):
+        """Returns the quotient of the bytes a and b in GF(2^8).
+
+        Raises:
+            ZeroDivisionError: Error when b is 0.
+        """
+
+        if b == 0:
+            raise ZeroDivisionError("division by zero in GF(256)")
+        elif a == 0:
+            return 0
+        return EXP[LOG[a] + 255 - LOG[b]]
+
+    @staticmethod
+    def getMulTable(c):
+        """Returns the translation table for multiplying bytes by c, i.e. a
+        256 character string whose ath character is chr(c * a).
+        """
+
+        table = gf256.mulTables.get(c)
+        if table == None:
+            table = ''.join(chr(gf256.mul(c, a)) for a in range(0, 256))
+            gf256.mulTables[c] = table
+        return table
+
+    @staticmethod
+    def mulBytes(data, c):
+        """Returns the byte string data with every byte multiplied by c."""
+        return data.translate(gf256.getMulTable(c))
+
+    @staticmethod
+    def xorBytes(a, b):
+        """Returns the byte-wise XOR of the equal length byte strings a and b."""
+
+        if len(a) == 0:
+            return ''
+        elif numpy != None:
+            xor = numpy.frombuffer(a, numpy.uint8) ^ numpy.frombuffer(b, numpy.uint8)
+            return xor.tobytes()
+        value = int(binascii.hexlify(a), 16) ^ int(binascii.hexlify(b), 16)
+        return binascii.unhexlify('%0*x' % (2 * len(a), value))
+
+    @staticmethod
+    def lagrangeWeights(xList):
+        """Returns the Lagrange basis weights at x = 0 in GF(2^8) for the
+        given list of distinct non-zero x-coordinates. Subtraction is XOR in
+        GF(2^8), so the weight of x[i] is the product of x[j] / (x[j] ^ x[i])
+        over j != i.
+
+        Args:
+            xList: A list of distinct integer x-coordinates in 1..255.
+
+        Returns:
+            A list of integer weights, one for each x in xList.
+        """
+
+        weights = []
+        for xi in xList:
+            weight = 1
+            for xj in xList:
+                if xi != xj:
+                    weight = gf256.mul(weight, gf256.div(xj, xj ^ xi))
+            weights.append(weight)
+
+        return weights
+
+    @staticmethod
+    def generateShares(msg, n, k):
+        """Generates n shares for the byte string msg such that any k shares
+        can be used for reconstructing the msg. Every byte of msg is shared
+        with its own random polynomial of degree k-1 over GF(2^8).
+
+        Args:
+            msg: A string or bytearray message for which the shares are to be
+                generated.
+            n: An integer value representing the number of shares to be
+                generated.
+            k: An integer value representing the number of shares that are
+                required for reconstructing the msg.
+
+        Returns:
+            A list of n shares of the form [x, y] where y is a string of the
+            same length as msg.
+
+        Raises:
+            TypeError: Error when msg is not a string or bytearray, or when
+                either n or k is not an integer.
+            ValueError: Error when n and k do not satisfy 255 >= n >= k >= 2.
+        """
+
+        if type(msg) not in [str, bytearray]:
+            raise TypeError("invalid msg: str or bytearray expected")
+        elif type(n) not in [int, long]:
+            raise TypeError("invalid n: int or long expected")
+        elif type(k) not in [int, long]:
+            raise TypeError("invalid k: int or long expected")
+        elif n < 2 or k < 2:
+            raise ValueError("invalid n or k: value greater than or equal to 2 expected")
+        elif n < k:
+            raise ValueError("invalid k: value less than or equal to n expected")
+        elif n > 255:
+            raise ValueError("invalid n: value less than 256 expected")
+
+        msg = str(msg)
+        coefficients = [os.urandom(len(msg)) for i in range(1, k)]
+
+        shares = []
+        for x in range(1, n+1):
+            y = '\x00' * len(msg)
+            for coeff in reversed(coefficients):
+                y = gf256.mulBytes(gf256.xorBytes(y, coeff), x)
+            shares.append([x, gf256.xorBytes(y, msg)])
+
+        return shares
+
+    @staticmethod
+    def reconstructSecret(shares, k):
+        """Reconstructs the byte string secret from the first k shares
+        generated by generateShares.
+
+        Args:
+            shares: A list of shares of the form [x, y] where x is an integer
+                in 1..255 and y is a string.
+            k: An integer value representing the number of shares that are
+                required for reconstructing the secret.
+
+        Returns:
+            The reconstructed string secret.
+
+        Raises:
+            TypeError: Error when k is not an integer, or when shares is not a
+                list of [int, str] lists.
+            ValueError: Error when k < 2, when number of shares is less than k,
+                when the x-coordinates are not distinct values in 1..255, or
+                when the shares have different lengths.
+        """
+
+        if type(shares) != list:
+            raise TypeError("invalid shares: list expected")
+        elif type(k) not in [int, long]:
+            raise TypeError("invalid k: int or long expected")
+        elif k < 2:
+            raise ValueError("invalid k: value greater than 1 expected")
+        elif k > len(shares):
+            raise ValueError("insufficient number of shares: expected k or more")
+
+        shares = shares[:k]
+
+        try:
+            xList, yList = zip(*shares)
+        except TypeError:
+            raise TypeError("invalid shares: list of lists expected")
+
+        for x in xList:
+            if type(x) not in [int, long]:
+                raise TypeError("invalid shares: list of [int, str] lists expected")
+            elif x < 1 or x > 255:
+                raise ValueError("invalid shares: x-coordinates in 1..255 expected")
+        for y in yList:
+            if type(y) != str:
+                raise TypeError("invalid shares: list of [int, str] lists expected")
+            elif len(y) != len(yList[0]):
+                raise ValueError("invalid shares: equal length values expected")
+        if len(set(xList)) != len(xList):
+            raise ValueError("invalid shares: distinct x-coordinates expected")
+
+        weights = gf256.lagrangeWeights(list(xList))
+        secret = '\x00' * len(yList[0])
+        for i in range(0, k):
+            secret = gf256.xorBytes(secret, gf256.mulBytes(yList[i], weights[i]))
+
+        return secret
+
+##################### End of Code ###########################
@@ -0,0 +1,212 @@
+#!/usr/bin/python
+
+#############################################################
+# CSE 539 (Applied Cryptography) Fall 2015 - Project        #
+# Team: Saurabh Gupta, Omkar Kaptan                         #
+# Instructor: Dr. Rida Bazzi                                #
+#############################################################
+
+"""Provides a MAC context module for the base64 HMAC-SHA256 tags
+of the MAC verification mode.
+
+The base64 key is decoded once per context, and the HMAC object
+keyed with it holds the inner and outer hash states after hashing
+the padded key. The tag of each message is computed on a copy of
+this object, so the key is neither decoded nor hashed again per
+message. The tags are the same as those of hmac.new(key, msg,
+hashlib.sha256).
+
+The contexts are cached per key, and are returned by getMacContext.
+
+Global Methods
+~~~~~~~~~~~~~~
+    getMacContext(key)
+
+Class macContext
+~~~~~~~~~~~~~~~~
+    Attributes:
+        keyHmac - the HMAC-SHA256 object keyed with the decoded key
+    Constructor:
+        __init__(self, key)
+    Methods:
+        generateTag(self, msg)
+        verifyTag(self, msg, tag)
+        tagMany(self, msgList)
+        verifyMany(self, msgList, tagList)
+"""
+
+#################### Import modules #########################
+import hmac
+import hashlib
+import base64
+from collections import OrderedDict
+from util import message
+
+#################### Module Metadata ########################
+__author__ = "Saurabh Gupta, Omkar Kaptan"
+__email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
+__license__ = "GPL"
+__version__ = "1.0"
+
+############## Global Variables for Key Contexts ############
+contextCache = OrderedDict()
+maxContextCache = 16
+
+#################### Method Definitions #####################
+
+def getMacContext(key):
+    """Returns the macContext object for the given key. The objects are
+    cached by key, so the key is decoded and hashed once per key.
+
+    Args:
+        key: A base64 format string key shared by the sender and receiver.
+
+    Returns:
+        A macContext object for the given key.
+
+    Raises:
+        TypeError: Error when key is not a string.
+    """
+
+    if type(key) != str:
+        raise TypeError("invalid key: string expected")
+
+    context = contextCache.pop(key, None)
+
+    if context == None:
+        context = macContext(key)
+
+        while len(contextCache) >= maxContextCache:
+            contextCache.popitem(last=False)
+
+    contextCache[key] = context
+    return context
+
+#############################################################
+#                    Class: macContext                      #
+#############################################################
+
+class macContext:
+    """A class for the base64 HMAC-SHA256 tags of string messages.
+
+    Attributes:
+        keyHmac: A hmac object keyed with the decoded shared key, which is
+            copied for every message.
+    """
+
+    def __init__(self, key):
+        """Initializes the macContext object by decoding the base64 key and
+        keying the HMAC-SHA256 object with it.
+
+        Args:
+            key: A base64 format string key.
+        """
+
+        self.keyHmac = hmac.new(message.base64ToStr(key), digestmod=hashlib.sha256)
+
+    def generateTag(self, msg):
+        """Generates the base64 HMAC-SHA256 tag of the given msg.
+
+        Args:
+            msg: A string message for which the MAC tag is to be generated.
+
+        Returns:
+            A base64 format string representing the MAC tag for the msg.
+
+        Raises:
+            TypeError: Error when msg is not a string.
+        """
+
+        if type(msg) != str:
+            raise TypeError("invalid msg: string expected")
+
+        msgHmac = self.keyHmac.copy()
+        msgHmac.update(msg)
+        return base64.b64encode(msgHmac.digest())
+
+    def verifyTag(self, msg, tag):
+        """Canonically verifies the given MAC tag for the given msg.
+
+        Args:
+            msg: A string message for which the MAC tag is to be verified.
+            tag: A base64 format string MAC tag to be verified.
+
+        Returns:
+            A boolean, True if tag is the valid tag of msg and False otherwise.
+
+        Raises:
+            TypeError: Error when either msg or tag is not a string.
+        """
+
+        if type(tag) != str:
+            raise TypeError("invalid tag: string expected")
+
+        return hmac.compare_digest(self.generateTag(msg), tag)
+
+    def tagMany(self, msgList):
+        """Generates the base64 HMAC-SHA256 tags of all the messages in
+        msgList.
+
+        Args:
+            msgList: A list of string messages.
+
+        Returns:
+            A list of base64 format string MAC tags, one for each message in
+                msgList.
+
+        Raises:
+            TypeError: Error when msgList is not a list of strings.
+        """
+
+        if type(msgList) != list:
+            raise TypeError("invalid msgList: list expected")
+
+        keyHmac = self.keyHmac
+        tagList = []
+        for msg in msgList:
+            if type(msg) != str:
+                raise TypeError("invalid msg: string expected")
+            msgHmac = keyHmac.copy()
+            msgHmac.update(msg)
+            tagList.append(base64.b64encode(msgHmac.digest()))
+
+        return tagList
+
+    def verifyMany(self, msgList, tagList):
+        """Canonically verifies the MAC tags in tagList for the corresponding
+        messages in msgList. A message or tag that is not a string fails the
+        verification.
+
+        Args:
+            msgList: A list of string messages.
+            tagList: A list of base64 format string MAC tags.
+
+        Returns:
+            A list of boolean values, one for each message in msgList. True if
+                the corresponding tag is valid, and False otherwise.
+
+        Raises:
+            TypeError: Error when either msgList or tagList is not a list.
+            ValueError: Error when the sizes of msgList and tagList differ.
+        """
+
+        if type(msgList) != list:
+            raise TypeError("invalid msgList: list expected")
+        elif type(tagList) != list:
+            raise TypeError("invalid tagList: list expected")
+        elif len(msgList) != len(tagList):
+            raise ValueError("invalid msgList or tagList: list counts expected to match")
+
+        keyHmac = self.keyHmac
+        results = []
+        for msg, tag in zip(msgList, tagList):
+            if type(msg) != str or type(tag) != str:
+                results.append(False)
+                continue
+            msgHmac = keyHmac.copy()
+            msgHmac.update(msg)
+            results.append(hmac.compare_digest(base64.b64encode(msgHmac.digest()), tag))
+
+        return results
+
+##################### End of Code ###########################
@@ -9,6 +9,28 @@
 """Provides a socket wrapper module for communication involving
 arbitrary length messages.
 
+A message is framed either by its decimal length and a separator, or,
+when no separator is given, by a fixed LENGTH_HEADER holding its
+length as a 4 byte big-endian integer. In the latter mode, the message
+is received with recv_into directly into a preallocated bytearray of
+the exact message size, and returned as a memoryview of it, so that
+it is neither copied nor received in chunks of the buffer size. Since
+the length is sent by the peer, messages longer than MAX_MESSAGE_SIZE
+are rejected before any buffer is allocated.
+
+Messages are sent by sendBuffers, which joins the length prefix and
+the message into one string only when their total size is at most
+MAX_JOIN_SIZE. The sockets do not set TCP_NODELAY, and a message
+written after its header is held by Nagle's algorithm until the
+header is acknowledged: benchmark.py -b framing measures about 44 ms
+per round trip for 400 and 4096 byte messages sent in two writes,
+against 30 us joined. With TCP_NODELAY set, joining is still about
+1.3x faster up to 4096 bytes and on par at 65536 bytes, so the copy is
+no more expensive than the second write. Larger buffers are written one by one
+with sendall without concatenating them. A batch of messages can be
+framed and written at once by sendMany, but the sender and the nodes
+send one share per connection, so the batching is only an API.
+
 Class mysocket
 ~~~~~~~~~~~~~~
     Attributes: 
@@ -21,15 +43,21 @@ Class mysocket
         connect(self, (host, port))
         listen(self, backlog)
         accept(self)
+        settimeout(self, timeout)
         send(self, msg, separator)
+        sendMany(self, msgList)
+        sendBuffers(self, buffers)
         recv(self, buffer, separator)
+        recvInto(self, view)
         close(self)
+        shutdown(self)
     Static Methods: 
         gethostname()
 """
 
 #################### Import modules #########################
 import socket
+import struct
 
 #################### Module Metadata ########################
 __author__ = "Saurabh Gupta, Omkar Kaptan"
@@ -37,6 +65,11 @@ __email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
 __license__ = "GPL"
 __version__ = "1.0"
 
+############## Global Variables for Framing #################
+LENGTH_HEADER = struct.Struct(">I")
+MAX_MESSAGE_SIZE = 1 << 24
+MAX_JOIN_SIZE = 65536
+
 #############################################################
 #                    Class: mysocket                        #
 #############################################################
@@ -108,6 +141,36 @@ class mysocket:
         """ Closes the socket. """
         self.sock.close()
 
+    def shutdown(self):
+        """Shuts down both directions of the connection, which wakes up a 
+        thread blocked on the socket. Errors of a socket that is not 
+        connected or already closed are ignored.
+        """
+
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            pass
+
+    def settimeout(self, timeout):
+        """Sets the timeout of the blocking socket operations.
+
+        Args:
+            timeout: A float value specifying the timeout in seconds, or None 
+                for blocking operations without a timeout.
+
+        Raises:
+            TypeError: Error when timeout is neither None nor a number.
+            ValueError: Error when timeout is not positive.
+        """
+
+        if timeout != None and type(timeout) not in [int, long, float]:
+            raise TypeError("invalid timeout: None, int, long or float expected")
+        elif timeout != None and timeout <= 0:
+            raise ValueError("invalid timeout: positive value expected")
+
+        self.sock.settimeout(timeout)
+
     def listen(self, backlog):
         """Listen for connections made to the socket. 
 
@@ -117,67 +180,163 @@ class mysocket:
         """
         self.sock.listen(backlog)
 
-    def send(self, msg, separator):
+    def send(self, msg, separator=None):
         """Sends the arbitrary length msg over the socket connection by 
         concatenating the message length at the beginning of the message 
-        separated by the given separator. It sends the message in chunks 
-        based on the number of bytes accepted by the receiver in preceding 
-        transmission.
+        separated by the given separator. A message of at most MAX_JOIN_SIZE 
+        bytes is sent joined with its length prefix, and a larger one is 
+        written by sendBuffers without copying the message.
+
+        When separator is None, the message length is sent in LENGTH_HEADER 
+        instead, and msg may also be a bytearray or memoryview, such as a 
+        message returned by recv in the same mode.
 
         Args:
             msg: A string message to be sent.
             separator: A string to be used as separator between message length and 
-                message content.
+                message content. Default value = None, for LENGTH_HEADER.
 
         Returns:
-            An integer corresponding to the total number of bytes sent.
+            An integer corresponding to the total number of message bytes sent.
 
         Raises:
             TypeError: Error when either msg or separator is not a string value.
         """
 
-        if type(msg) != str:
+        if separator == None:
+            if type(msg) != str or len(msg) > MAX_JOIN_SIZE:
+                return self.sendMany([msg])
+            prefix = LENGTH_HEADER.pack(len(msg))
+        elif type(msg) != str:
             raise TypeError("invalid msg: str expected")
         elif type(separator) != str:
             raise TypeError("invalid separator: str expected")
-        elif len(msg) == 0:
+        else:
+            prefix = str(len(msg)) + separator
+
+        if len(msg) == 0:
             return 0
-       
-        length = len(msg)
-        totalsent = 0
-        msg = str(length) + separator + msg
-
-        while totalsent < length:
-            sent = self.sock.send(msg[totalsent:])
-            if sent == 0:
-                raise RuntimeError("socket connection broken")
-            totalsent = totalsent + sent
+        elif len(msg) <= MAX_JOIN_SIZE:
+            self.sock.sendall(prefix + msg)
+        else:
+            self.sendBuffers([prefix, msg])
+
+        return len(msg)
 
-        return totalsent
+    def sendMany(self, msgList):
+        """Sends a batch of arbitrary length messages over the socket 
+        connection, each framed by its LENGTH_HEADER, with a single call to 
+        sendBuffers. The receiver reads them one at a time with recv, 
+        without a separator. Empty messages are skipped. The shares of this 
+        project are sent one per connection by send, so sendMany is not used 
+        by the sender or the nodes.
 
-    def recv(self, buffer, separator):
+        Args:
+            msgList: A list of string, bytearray or memoryview messages.
+
+        Returns:
+            An integer corresponding to the total number of message bytes sent.
+
+        Raises:
+            TypeError: Error when msgList is not a list, or when any message 
+                is not a string, bytearray or memoryview.
+            ValueError: Error when any message is longer than MAX_MESSAGE_SIZE.
+        """
+
+        if type(msgList) != list:
+            raise TypeError("invalid msgList: list expected")
+
+        buffers = []
+        total = 0
+        for msg in msgList:
+            if type(msg) not in [str, bytearray, memoryview]:
+                raise TypeError("invalid msg: str, bytearray or memoryview expected")
+            elif len(msg) > MAX_MESSAGE_SIZE:
+                raise ValueError("invalid msg: %d bytes or less expected" % MAX_MESSAGE_SIZE)
+            elif len(msg) == 0:
+                continue
+            buffers.append(LENGTH_HEADER.pack(len(msg)))
+            buffers.append(msg)
+            total += len(msg)
+
+        self.sendBuffers(buffers)
+        return total
+
+    def sendBuffers(self, buffers):
+        """Writes the given buffers over the socket connection in order. The 
+        buffers are joined into one string when their total size is at most 
+        MAX_JOIN_SIZE, and otherwise written one at a time by sendall without 
+        concatenating them.
+
+        Args:
+            buffers: A list of string, bytearray or memoryview buffers.
+
+        Returns:
+            An integer corresponding to the total number of bytes sent.
+
+        Raises:
+            TypeError: Error when buffers is not a list.
+        """
+
+        if type(buffers) != list:
+            raise TypeError("invalid buffers: list expected")
+
+        total = sum([len(buf) for buf in buffers])
+
+        if total <= MAX_JOIN_SIZE:
+            self.sock.sendall("".join([buf if type(buf) == str else bytes(buf) \
+                if type(buf) == bytearray else buf.tobytes() for buf in buffers]))
+            return total
+
+        for buf in buffers:
+            self.sock.sendall(buf)
+
+        return total
+
+    def recv(self, buffer, separator=None):
         """Receive an arbitrary length msg over the socket connection using 
         the message length concatenated at the beginning of the message 
         separated by the given separator. It receives the message in chunks 
         based on the buffer size.
 
+        When separator is None, the message length is read from LENGTH_HEADER, 
+        and the message is received by recvInto into a bytearray of the 
+        message length, regardless of the buffer size. The message is returned 
+        as a memoryview of the bytearray, which supports indexing, slicing and 
+        struct.unpack_from like a string without copying the data.
+
         Args:
             buffer: A integer value specifying the buffer size for receiving data.
             separator: A string used as separator between message length and 
-                message content.
+                message content. Default value = None, for LENGTH_HEADER.
 
         Returns:
-            A string corresponding to the received message.
+            A string corresponding to the received message, or a memoryview 
+                when separator is None.
 
         Raises:
             RuntimeError: Error when no data received from the connection.
             TypeError: Error when buffer is not an integer, or when separator 
                 is not a string.
-            ValueError: Error when received message has invalid format.
+            ValueError: Error when received message has invalid format, or when 
+                the LENGTH_HEADER exceeds MAX_MESSAGE_SIZE.
         """
 
         if type(buffer) not in [int, long]:
             raise TypeError("invalid buffer: int or long expected")
+        elif separator == None:
+            header = bytearray(LENGTH_HEADER.size)
+            self.recvInto(memoryview(header))
+            length = LENGTH_HEADER.unpack_from(header)[0]
+            if length == 0:
+                raise ValueError("invalid message received: empty message")
+            elif length > MAX_MESSAGE_SIZE:
+                raise ValueError("invalid message received: %d bytes or less expected" \
+                    % MAX_MESSAGE_SIZE)
+
+            view = memoryview(bytearray(length))
+            self.recvInto(view)
+            return view
         elif type(separator) != str:
             raise TypeError("invalid separator: str expected")
 
@@ -201,4 +360,29 @@ class mysocket:
 
         return ''.join(chunks)
 
+    def recvInto(self, view):
+        """Receives exactly len(view) bytes over the socket connection into the 
+        given writable memoryview, requesting all the remaining bytes with 
+        each recv_into call.
+
+        Args:
+            view: A memoryview of a bytearray to be filled.
+
+        Raises:
+            RuntimeError: Error when the connection is closed before the view 
+                is filled.
+            TypeError: Error when view is not a memoryview.
+        """
+
+        if type(view) != memoryview:
+            raise TypeError("invalid view: memoryview expected")
+
+        size = len(view)
+        received = 0
+        while received < size:
+            count = self.sock.recv_into(view[received:], size - received)
+            if count == 0:
+                raise RuntimeError("socket connection broken")
+            received += count
+
 ##################### End of Code ###########################
\ No newline at end of file
@@ -0,0 +1,321 @@
+#!/usr/bin/python
+
+#############################################################
+# CSE 539 (Applied Cryptography) Fall 2015 - Project        #
+# Team: Saurabh Gupta, Omkar Kaptan                         #
+# Instructor: Dr. Rida Bazzi                                #
+#############################################################
+
+"""Provides a number theoretic transform (NTT) module for sharing a
+secret among a very large number of nodes.
+
+The module works over the prime NTT_PRIME = c * 2^64 + 1, whose
+multiplicative group holds a root of unity w of order 2^m for every
+m <= 64. The n shares of a secret are placed at the x-coordinates
+1, w, w^2, ..., w^(n-1), where w is of order size, the smallest power
+of 2 not smaller than n. The share values are then the discrete
+Fourier transform of the coefficient vector, and are all computed by
+a single NTT in O(n log n), instead of O(n * k) for Horner's rule.
+
+For reconstruction, the Lagrange weight at x = 0 of the share at x[i]
+is Z(0) / (-x[i] * Z'(x[i])), where Z is the product of (X - x[j])
+over all the shares. Z is computed with a product tree, using NTT
+based multiplication for the large subproducts, and Z' is evaluated
+at all the roots of unity with a single NTT, which computes all the k
+weights in O(k log^2 k) instead of O(k^2).
+
+The crossovers from which the NTT methods beat the generic ones were
+measured by benchmark.py, and are used by the secret sharing module to
+pick the faster method based on k. Horner's rule at the same points
+is used below the crossover, so the shares do not depend on the
+method.
+
+Global Variables
+~~~~~~~~~~~~~~~~
+    NTT_PRIME - the prime (2^192 - 139) * 2^64 + 1
+    NTT_TWO_ADICITY - the largest m such that 2^m divides NTT_PRIME - 1
+    NTT_ROOT - a root of unity of order 2^NTT_TWO_ADICITY
+    NTT_EVAL_CROSSOVER - the k from which evaluateAll beats Horner's rule
+    NTT_WEIGHTS_CROSSOVER - the k from which lagrangeWeights beats the
+        quadratic Lagrange weights
+    SCHOOLBOOK_LIMIT - the length below which polynomials are multiplied
+        by the schoolbook method
+
+Class ntt
+~~~~~~~~~
+    Class Attributes:
+        rootCache - cache of roots of unity by order
+    Static Methods:
+        getSize(n)
+        getRoot(size)
+        getPoints(n)
+        transform(values, root)
+        inverseTransform(values, root)
+        multiply(a, b)
+        productTree(xList)
+        evaluateAll(msgNum, coefficients, n)
+        lagrangeWeights(xList)
+        preferEvaluation(k)
+        preferWeights(k)
+"""
+
+#################### Import modules #########################
+from primeField import getField
+
+#################### Module Metadata ########################
+__author__ = "Saurabh Gupta, Omkar Kaptan"
+__email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
+__license__ = "GPL"
+__version__ = "1.0"
+
+################ Global Variables for NTT ###################
+NTT_PRIME = (2**192 - 139) * 2**64 + 1
+NTT_TWO_ADICITY = 64
+NTT_ROOT = pow(5, NTT_PRIME >> NTT_TWO_ADICITY, NTT_PRIME)
+NTT_EVAL_CROSSOVER = 16
+NTT_WEIGHTS_CROSSOVER = 128
+SCHOOLBOOK_LIMIT = 64
+
+#############################################################
+#                    Class: ntt                             #
+#############################################################
+
+class ntt:
+    """A class of static methods for secret sharing at roots of unity using
+    the number theoretic transform over NTT_PRIME.
+
+    Class Attributes:
+        rootCache: A dict mapping a power of 2 size to the root of unity of
+            order size.
+    """
+
+    rootCache = {}
+
+    @staticmethod
+    def getSize(n):
+        """Returns the smallest power of 2 not smaller than n."""
+
+        size = 1
+        while size < n:
+            size <<= 1
+        return size
+
+    @staticmethod
+    def getRoot(size):
+        """Returns the root of unity of order size modulo NTT_PRIME, i.e.
+        NTT_ROOT^(2^NTT_TWO_ADICITY / size).
+
+        Args:
+            size: An integer power of 2 not larger than 2^NTT_TWO_ADICITY.
+
+        Returns:
+            An integer root of unity of order size.
+
+        Raises:
+            ValueError: Error when size is not a power of 2 in range.
+        """
+
+        root = ntt.rootCache.get(size)
+        if root == None:
+            if size < 1 or size & (size - 1) or size > (1 << NTT_TWO_ADICITY):
+                raise ValueError("invalid size: power of 2 up to 2^%d expected" \
+                    % NTT_TWO_ADICITY)
+            root = pow(NTT_ROOT, (1 << NTT_TWO_ADICITY) // size, NTT_PRIME)
+            ntt.rootCache[size] = root
+        return root
+
+    @staticmethod
+    def getPoints(n):
+        """Returns the list of the n x-coordinates 1, w, ..., w^(n-1) of the
+        shares generated by evaluateAll, where w = getRoot(getSize(n)).
+        """
+
+        root = ntt.getRoot(ntt.getSize(n))
+        points = [1]
+        for i in range(1, n):
+            points.append(points[-1] * root % NTT_PRIME)
+        return points
+
+    @staticmethod
+    def transform(values, root):
+        """Returns the number theoretic transform of values, i.e. the list of
+        the values of the polynomial with coefficients values at root^i for
+        i = 0, ..., len(values) - 1, using the iterative radix-2 Cooley-Tukey
+        algorithm modulo NTT_PRIME. Each butterfly stage is run on whole slices
+        of the list.
+
+        Args:
+            values: A list of integer coefficients, of a power of 2 length.
+            root: An integer root of unity of order len(values).
+
+        Returns:
+            A list of the transformed integer values.
+        """
+
+        prime = NTT_PRIME
+        size = len(values)
+        order = [0]
+        while len(order) < size:
+            order = [2 * i for i in order] + [2 * i + 1 for i in order]
+        result = [values[i] for i in order]
+
+        length = 2
+        while length <= size:
+            half = length // 2
+            step = pow(root, size // length, prime)
+            twiddles = [1] * half
+            for j in range(1, half):
+                twiddles[j] = twiddles[j-1] * step % prime
+
+            for start in range(0, size, length):
+                middle, end = start + half, start + length
+                lower = result[start:middle]
+                upper = [u * t % prime for u, t in zip(result[middle:end], twiddles)]
+                result[start:middle] = [(a + b) % prime for a, b in zip(lower, upper)]
+                result[middle:end] = [(a - b) % prime for a, b in zip(lower, upper)]
+            length <<= 1
+
+        return result
+
+    @staticmethod
+    def inverseTransform(values, root):
+        """Returns the inverse number theoretic transform of values, i.e. the
+        list of coefficients of the polynomial whose values at root^i are
+        values[i].
+        """
+
+        field = getField(NTT_PRIME)
+        result = ntt.transform(values, field.inv(root))
+        scale = field.inv(len(values))
+        return [value * scale % NTT_PRIME for value in result]
+
+    @staticmethod
+    def multiply(a, b):
+        """Returns the coefficients of the product of the polynomials with the
+        coefficient lists a and b modulo NTT_PRIME, lowest degree first. The
+        schoolbook method
+        is used when either polynomial is shorter than SCHOOLBOOK_LIMIT, and
+        an NTT based convolution otherwise.
+        """
+
+        prime = NTT_PRIME
+        resultLength = len(a) + len(b) - 1
+        if min(len(a), len(b)) < SCHOOLBOOK_LIMIT:
+            result = [0] * resultLength
+            for i in range(0, len(a)):
+                ai = a[i]
+                for j in range(0, len(b)):
+                    result[i+j] += ai * b[j]
+            return [value % prime for value in result]
+
+        size = ntt.getSize(resultLength)
+        root = ntt.getRoot(size)
+        aValues = ntt.transform(a + [0] * (size - len(a)), root)
+        bValues = ntt.transform(b + [0] * (size - len(b)), root)
+        product = [x * y % prime for x, y in zip(aValues, bValues)]
+        return ntt.inverseTransform(product, root)[:resultLength]
+
+    @staticmethod
+    def productTree(xList):
+        """Returns the coefficients of the product of (X - x) over all x in
+        xList modulo NTT_PRIME, lowest degree first, by multiplying the products of the two
+        halves of xList recursively.
+        """
+
+        if len(xList) == 0:
+            return [1]
+        elif len(xList) == 1:
+            return [-xList[0] % NTT_PRIME, 1]
+
+        middle = len(xList) // 2
+        return ntt.multiply(ntt.productTree(xList[:middle]), \
+            ntt.productTree(xList[middle:]))
+
+    @staticmethod
+    def evaluateAll(msgNum, coefficients, n):
+        """Returns the n shares [x, y] of the polynomial y = msgNum + c[0]*x +
+        ... + c[k-2]*x^(k-1) modulo NTT_PRIME at the x-coordinates returned by
+        getPoints(n), computed with a single NTT of length getSize(n).
+
+        Args:
+            msgNum: An integer value smaller than NTT_PRIME.
+            coefficients: A list of k-1 integer coefficients, where k <= n.
+            n: An integer value representing the number of shares.
+
+        Returns:
+            A list of n shares of the form [x, y].
+        """
+
+        size = ntt.getSize(n)
+        values = [msgNum] + coefficients
+        values = ntt.transform(values + [0] * (size - len(values)), ntt.getRoot(size))
+
+        return [list(share) for share in zip(ntt.getPoints(n), values[:n])]
+
+    @staticmethod
+    def lagrangeWeights(xList):
+        """Returns the Lagrange basis weights at x = 0 modulo NTT_PRIME for the
+        given list of distinct x-coordinates on roots of unity, such as the
+        x-coordinates of the shares generated by evaluateAll.
+
+        Args:
+            xList: A list of distinct integer roots of unity modulo NTT_PRIME.
+
+        Returns:
+            A dict mapping each x-coordinate in xList to its integer weight.
+
+        Raises:
+            ValueError: Error when an x-coordinate is not a root of unity of
+                order at most 2^NTT_TWO_ADICITY, or when an x-coordinate is
+                repeated.
+        """
+
+        prime = NTT_PRIME
+        size = ntt.getSize(len(xList))
+        for x in xList:
+            value, order = x % prime, 1
+            while value != 1 and order <= (1 << NTT_TWO_ADICITY):
+                value, order = value * value % prime, order << 1
+            if value != 1:
+                raise ValueError("invalid xList: roots of unity modulo NTT_PRIME expected")
+            size = max(size, order)
+
+        zPoly = ntt.productTree(xList)
+        derivative = [i * zPoly[i] % prime for i in range(1, len(zPoly))]
+        root = ntt.getRoot(size)
+        values = ntt.transform(derivative + [0] * (size - len(derivative)), root)
+
+        valueAt = {}
+        point = 1
+        for i in range(0, size):
+            valueAt[point] = values[i]
+            point = point * root % prime
+
+        field = getField(prime)
+        denominators = [-x * valueAt[x % prime] % prime for x in xList]
+        try:
+            inverses = field.batchInv(denominators)
+        except ValueError:
+            raise ValueError("invalid xList: distinct x-coordinates expected")
+
+        weights = {}
+        for i in range(0, len(xList)):
+            weights[xList[i]] = zPoly[0] * inverses[i] % prime
+        return weights
+
+    @staticmethod
+    def preferEvaluation(k):
+        """Returns whether evaluateAll is expected to be faster than Horner's
+        rule for the shares of a degree k-1 polynomial. Both costs grow with n
+        at about the same rate, so the crossover only depends on k.
+        """
+        return k >= NTT_EVAL_CROSSOVER
+
+    @staticmethod
+    def preferWeights(k):
+        """Returns whether lagrangeWeights is expected to be faster than the
+        quadratic Lagrange weights for k shares.
+        """
+        return k >= NTT_WEIGHTS_CROSSOVER
+
+##################### End of Code ###########################
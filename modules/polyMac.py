@@ -0,0 +1,229 @@
+#!/usr/bin/python
+
+#############################################################
+# CSE 539 (Applied Cryptography) Fall 2015 - Project        #
+# Team: Saurabh Gupta, Omkar Kaptan                         #
+# Instructor: Dr. Rida Bazzi                                #
+#############################################################
+
+"""Provides a Carter-Wegman MAC module built on a polynomial
+universal hash over the prime field of the shares.
+
+The tag of a share [x, y], where y is an integer or a list of block
+integers, is computed on its integer values m = [len, x, y...] as
+    tag = m[0]*a + m[1]*a^2 + ... + m[l-1]*a^l + pad(x)  (mod prime)
+where the hash key a and the one-time pads pad(x) are field elements
+derived from the shared key with SHA-256. A tag thus costs one
+multiplication per value of the share, without any serialization of
+the share or decoding of the key.
+
+Two different messages of at most l values hash to the same value
+for at most l of the prime possible hash keys, and the pads hide the
+hash key, so a forgery succeeds with probability about l / prime.
+The pads are one-time pads: every x-coordinate must be tagged once
+per key, so a fresh key is required for every shared secret.
+
+The derived key material is cached per (key, prime) in polyMac
+objects, which are returned by getPolyMac.
+
+Global Variables
+~~~~~~~~~~~~~~~~
+    SECURITY_MARGIN - the extra bits derived to make the field elements
+        uniform modulo prime
+
+Global Methods
+~~~~~~~~~~~~~~
+    getPolyMac(key, prime)
+
+Class polyMac
+~~~~~~~~~~~~~
+    Attributes:
+        prime - the order of the field
+        keyHash - the SHA-256 state after hashing the decoded key
+        hashKey - the hash key a
+        pads - cache of the one-time pads by x-coordinate
+    Constructor:
+        __init__(self, key, prime)
+    Methods:
+        derive(self, label)
+        getPad(self, x)
+        generateTag(self, share)
+        verifyTag(self, share, tag)
+"""
+
+#################### Import modules #########################
+import hashlib
+from collections import OrderedDict
+from util import message
+
+#################### Module Metadata ########################
+__author__ = "Saurabh Gupta, Omkar Kaptan"
+__email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
+__license__ = "GPL"
+__version__ = "1.0"
+
+############## Global Variables for Key Material ############
+SECURITY_MARGIN = 128
+
+macCache = OrderedDict()
+maxMacCache = 16
+
+#################### Method Definitions #####################
+
+def getPolyMac(key, prime):
+    """Returns the polyMac object for the given key and prime. The objects
+    are cached by (key, prime), so the key is decoded and the hash key is
+    derived once per key.
+
+    Args:
+        key: A base64 format string key shared by the sender and receiver.
+        prime: An integer value specifying the order of the field.
+
+    Returns:
+        A polyMac object for the given key and prime.
+
+    Raises:
+        TypeError: Error when key is not a string, or when prime is not an
+            integer.
+        ValueError: Error when prime is less than 3.
+    """
+
+    if type(key) != str:
+        raise TypeError("invalid key: str expected")
+    elif type(prime) not in [int, long]:
+        raise TypeError("invalid prime: int or long expected")
+    elif prime < 3:
+        raise ValueError("invalid prime: value greater than 2 expected")
+
+    mac = macCache.pop((key, prime), None)
+
+    if mac == None:
+        mac = polyMac(key, prime)
+
+        while len(macCache) >= maxMacCache:
+            macCache.popitem(last=False)
+
+    macCache[(key, prime)] = mac
+    return mac
+
+#############################################################
+#                    Class: polyMac                         #
+#############################################################
+
+class polyMac:
+    """A class for Carter-Wegman MAC tags of integer shares.
+
+    Attributes:
+        prime: An integer value for the order of the field.
+        keyHash: A hashlib SHA-256 object that has hashed the decoded shared
+            key, which is copied for every derivation.
+        hashKey: A non-zero integer hash key a modulo prime.
+        pads: A dict mapping an x-coordinate to its integer one-time pad.
+    """
+
+    def __init__(self, key, prime):
+        """Initializes the polyMac object by decoding the base64 key and
+        deriving the hash key.
+
+        Args:
+            key: A base64 format string key.
+            prime: An integer value specifying the order of the field.
+        """
+
+        self.prime = prime
+        self.keyHash = hashlib.sha256(message.base64ToStr(key))
+        self.hashKey = self.derive("hash") % (prime - 1) + 1
+        self.pads = {}
+
+    def derive(self, label):
+        """Returns an integer of SECURITY_MARGIN bits more than the prime,
+        derived from the key and label by SHA-256 in counter mode. The hash
+        state of the key is copied instead of hashing the key again.
+
+        Args:
+            label: A string label of the derived value.
+
+        Returns:
+            An integer derived value.
+        """
+
+        hexCount = (len(bin(self.prime)) - 2 + SECURITY_MARGIN + 3) // 4
+        digest = ""
+        counter = 0
+        while len(digest) < hexCount:
+            blockHash = self.keyHash.copy()
+            blockHash.update("%s:%d" % (label, counter))
+            digest += blockHash.hexdigest()
+            counter += 1
+
+        return int(digest[:hexCount], 16)
+
+    def getPad(self, x):
+        """Returns the one-time pad of the x-coordinate x modulo prime.
+
+        Args:
+            x: An integer x-coordinate.
+
+        Returns:
+            An integer pad value.
+        """
+
+        pad = self.pads.get(x)
+        if pad == None:
+            pad = self.derive("pad%d" % x) % self.prime
+            self.pads[x] = pad
+        return pad
+
+    def generateTag(self, share):
+        """Returns the integer tag of the share [x, y], where y is an integer
+        or a list of integer blocks, by evaluating the polynomial hash of the
+        values [len, x, y...] at the hash key and adding the pad of x.
+
+        Args:
+            share: A share of the form [x, y].
+
+        Returns:
+            An integer tag modulo prime.
+
+        Raises:
+            TypeError: Error when share is not a list of an integer x and an
+                integer or list of integers y.
+        """
+
+        if type(share) != list or len(share) != 2:
+            raise TypeError("invalid share: [x, y] list expected")
+        elif type(share[0]) not in [int, long]:
+            raise TypeError("invalid share: int or long x expected")
+
+        if type(share[1]) == list:
+            values = [len(share[1]) + 1, share[0]] + share[1]
+        else:
+            values = [2, share[0], share[1]]
+
+        prime, hashKey = self.prime, self.hashKey
+        digest = 0
+        for value in values:
+            if type(value) not in [int, long]:
+                raise TypeError("invalid share: int or long values expected")
+            digest = (digest + value) * hashKey % prime
+
+        return (digest + self.getPad(share[0])) % prime
+
+    def verifyTag(self, share, tag):
+        """Verifies the integer tag of the share [x, y].
+
+        Args:
+            share: A share of the form [x, y].
+            tag: An integer tag to be verified.
+
+        Returns:
+            A boolean, True if tag is the valid tag of the share and False
+                otherwise.
+        """
+
+        try:
+            return type(tag) in [int, long] and self.generateTag(share) == tag
+        except TypeError:
+            return False
+
+##################### End of Code ###########################
@@ -0,0 +1,157 @@
+#!/usr/bin/python
+
+#############################################################
+# CSE 539 (Applied Cryptography) Fall 2015 - Project        #
+# Team: Saurabh Gupta, Omkar Kaptan                         #
+# Instructor: Dr. Rida Bazzi                                #
+#############################################################
+
+"""Provides a polynomial evaluation module for computing the shares
+of a secret by evaluating the sharing polynomial at many points over
+a prime field.
+
+Each point is evaluated using Horner's rule, which needs one modular
+multiplication per coefficient instead of a modular exponentiation.
+Optionally, a table of the powers x^1, ..., x^(k-1) for x = 1, ..., n
+can be computed once per (n, k, prime) and cached, which turns every
+further evaluation into a dot product followed by a single reduction.
+
+Class polynomial
+~~~~~~~~~~~~~~~~
+    Class Attributes:
+        powerTables - cache of power tables keyed by (n, k, prime)
+        maxPowerTables - maximum number of cached power tables
+    Static Methods:
+        horner(msgNum, coefficients, x, prime)
+        evaluateAll(msgNum, coefficients, n, prime, usePowerTable)
+        getPowerTable(n, k, prime)
+        clearPowerTables()
+"""
+
+#################### Import modules #########################
+from collections import OrderedDict
+from primeField import getField
+
+#################### Module Metadata ########################
+__author__ = "Saurabh Gupta, Omkar Kaptan"
+__email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
+__license__ = "GPL"
+__version__ = "1.0"
+
+#############################################################
+#                    Class: polynomial                      #
+#############################################################
+
+class polynomial:
+    """A class of static methods for polynomial evaluation over a prime field.
+
+    Class Attributes:
+        powerTables: An OrderedDict mapping (n, k, prime) to the list of power
+            lists [x^1, ..., x^(k-1)] for x = 1, ..., n.
+        maxPowerTables: An integer specifying the maximum number of cached
+            power tables.
+    """
+
+    powerTables = OrderedDict()
+    maxPowerTables = 8
+
+    @staticmethod
+    def horner(msgNum, coefficients, x, prime):
+        """Evaluates the polynomial y = msgNum + c[0]*x + ... + c[k-2]*x^(k-1)
+        at the given x using Horner's rule, i.e. as
+        msgNum + x*(c[0] + x*(c[1] + ... + x*c[k-2])).
+
+        The arguments are not validated; callers are expected to validate
+        them once before evaluating the polynomial at many points. The
+        evaluation is run through the field object for prime.
+
+        Args:
+            msgNum: An integer value specifying the constant term.
+            coefficients: A list of integer coefficients c[i].
+            x: An integer value at which the polynomial is evaluated.
+            prime: An integer value to be used as the order of modulo operations.
+
+        Returns:
+            An integer y such that [x, y] lies on the polynomial.
+        """
+
+        return getField(prime).horner(msgNum, coefficients, x)
+
+    @staticmethod
+    def getPowerTable(n, k, prime):
+        """Returns the table of powers [x^1, ..., x^(k-1)] modulo prime for
+        x = 1, ..., n. Tables are cached by (n, k, prime), and the least
+        recently used table is discarded once maxPowerTables are cached.
+
+        Args:
+            n: An integer value representing the number of points.
+            k: An integer value representing the number of coefficients of
+                the polynomial including the constant term.
+            prime: An integer value to be used as the order of modulo operations.
+
+        Returns:
+            A list of n lists, the (x-1)th list holding the k-1 powers of x.
+        """
+
+        key = (n, k, prime)
+        table = polynomial.powerTables.pop(key, None)
+
+        if table == None:
+            table = []
+            for x in range(1, n+1):
+                powers = []
+                power = 1
+                for i in range(1, k):
+                    power = (power * x) % prime
+                    powers.append(power)
+                table.append(powers)
+
+            while len(polynomial.powerTables) >= polynomial.maxPowerTables:
+                polynomial.powerTables.popitem(last=False)
+
+        polynomial.powerTables[key] = table
+        return table
+
+    @staticmethod
+    def clearPowerTables():
+        """Discards all cached power tables."""
+        polynomial.powerTables.clear()
+
+    @staticmethod
+    def evaluateAll(msgNum, coefficients, n, prime, usePowerTable=False):
+        """Evaluates the polynomial y = msgNum + c[0]*x + ... + c[k-2]*x^(k-1)
+        for x = 1, ..., n and returns a list of n pairs [x, y].
+
+        By default each point is evaluated using Horner's rule. When
+        usePowerTable is True, the cached power table for (n, k, prime) is
+        used instead and each point costs k-1 multiplications with a single
+        reduction at the end.
+
+        Args:
+            msgNum: An integer value specifying the constant term.
+            coefficients: A list of integer coefficients c[i].
+            n: An integer value representing the number of shares to be generated.
+            prime: An integer value to be used as the order of modulo operations.
+            usePowerTable: A boolean specifying whether or not the cached power
+                table is to be used. Default value = False.
+
+        Returns:
+            A list of n shares of the form [x, y].
+        """
+
+        field = getField(prime)
+        shares = []
+
+        if usePowerTable == True:
+            table = polynomial.getPowerTable(n, len(coefficients) + 1, prime)
+            for x in range(1, n+1):
+                y = field.add(msgNum, field.dot(coefficients, table[x-1]))
+                shares.append([x, y])
+        else:
+            xList = range(1, n+1)
+            yList = field.hornerMany(msgNum, coefficients, xList)
+            shares = [[xList[i], yList[i]] for i in range(0, n)]
+
+        return shares
+
+##################### End of Code ###########################
@@ -0,0 +1,369 @@
+#!/usr/bin/python
+
+#############################################################
+# CSE 539 (Applied Cryptography) Fall 2015 - Project        #
+# Team: Saurabh Gupta, Omkar Kaptan                         #
+# Instructor: Dr. Rida Bazzi                                #
+#############################################################
+
+"""Provides a prime field module for arithmetic modulo a prime p,
+i.e. in GF(p).
+
+A primeField object holds the prime along with constants that are
+precomputed once per prime, and exposes the field operations used by
+the secret sharing module. The arguments of the field operations are
+not validated; callers validate their inputs once per call and then
+run all the element operations through the field object.
+
+Two implementations are provided: primeField in pure Python, and
+gmpyPrimeField backed by gmpy2, which is chosen by getField when the
+gmpy2 module can be imported. Both return plain int or long values.
+
+Global Methods
+~~~~~~~~~~~~~~
+    getField(prime)
+
+Class primeField
+~~~~~~~~~~~~~~~~
+    Attributes:
+        prime - the order of the field
+        bitLength - the bit length of the prime
+        reducer - the reducer object for the prime
+    Constructor:
+        __init__(self, prime)
+    Methods:
+        reduce(self, a)
+        add(self, a, b)
+        sub(self, a, b)
+        neg(self, a)
+        mul(self, a, b)
+        inv(self, a)
+        batchInv(self, nums)
+        product(self, nums)
+        dot(self, aList, bList)
+        horner(self, constant, coefficients, x)
+        hornerMany(self, constant, coefficients, xList)
+
+Class gmpyPrimeField(primeField)
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    Overrides mul, inv, batchInv, product, dot, horner and hornerMany
+    using gmpy2.
+"""
+
+#################### Import modules #########################
+from collections import OrderedDict
+from reduction import getReducer
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+#################### Module Metadata ########################
+__author__ = "Saurabh Gupta, Omkar Kaptan"
+__email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
+__license__ = "GPL"
+__version__ = "1.0"
+
+############ Global Variables for Field Backends ############
+fieldCache = OrderedDict()
+maxFieldCache = 16
+
+#################### Method Definitions #####################
+
+def getField(prime):
+    """Returns the field object for the given prime, using gmpyPrimeField
+    when gmpy2 is available and primeField otherwise. Field objects are
+    cached by prime.
+
+    Args:
+        prime: An integer value specifying the order of the field.
+
+    Returns:
+        A primeField or gmpyPrimeField object for the given prime.
+
+    Raises:
+        TypeError: Error when prime is not an integer.
+        ValueError: Error when prime is less than 2.
+    """
+
+    field = fieldCache.pop(prime, None)
+
+    if field == None:
+        if gmpy2 != None:
+            field = gmpyPrimeField(prime)
+        else:
+            field = primeField(prime)
+
+        while len(fieldCache) >= maxFieldCache:
+            fieldCache.popitem(last=False)
+
+    fieldCache[prime] = field
+    return field
+
+#############################################################
+#                    Class: primeField                      #
+#############################################################
+
+class primeField:
+    """A class for arithmetic in the prime field GF(prime).
+
+    Attributes:
+        prime: An integer value specifying the order of the field.
+        bitLength: An integer value specifying the bit length of prime.
+        reducer: A reducer object returned by reduction.getReducer, used for
+            the reductions of full products when it is preferred over the %
+            operator.
+    """
+
+    def __init__(self, prime):
+        """Initializes the field object and precomputes the constants for
+        the given prime.
+
+        Args:
+            prime: An integer value specifying the order of the field.
+
+        Raises:
+            TypeError: Error when prime is not an integer.
+            ValueError: Error when prime is less than 2.
+        """
+
+        if type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+        elif prime < 2:
+            raise ValueError("invalid prime: value greater than 1 expected")
+
+        self.prime = prime
+        self.bitLength = len(bin(prime)) - 2
+        self.reducer = getReducer(prime)
+        if self.reducer.preferred:
+            self.reduce = self.reducer.reduce
+
+    def reduce(self, a):
+        """Returns a modulo prime. Replaced by the reduce method of reducer
+        when the reducer is preferred over the % operator.
+        """
+        return a % self.prime
+
+    def add(self, a, b):
+        """Returns a + b modulo prime."""
+        return (a + b) % self.prime
+
+    def sub(self, a, b):
+        """Returns a - b modulo prime."""
+        return (a - b) % self.prime
+
+    def neg(self, a):
+        """Returns -a modulo prime."""
+        return -a % self.prime
+
+    def mul(self, a, b):
+        """Returns a * b modulo prime."""
+
+        if self.reducer.preferred:
+            return self.reducer.reduce(a * b)
+        return (a * b) % self.prime
+
+    def inv(self, a):
+        """Returns the modular inverse of a using the iterative extended
+        Euclidean algorithm.
+
+        Raises:
+            ValueError: Error when a is 0 modulo prime.
+        """
+
+        a = a % self.prime
+        if a == 0:
+            raise ValueError("invalid a: value non-zero modulo prime expected")
+
+        x0, x1, r0, r1 = 0, 1, self.prime, a
+        while r1 != 0:
+            q = r0 // r1
+            r0, r1 = r1, r0 - q * r1
+            x0, x1 = x1, x0 - q * x1
+
+        return x0 % self.prime
+
+    def batchInv(self, nums):
+        """Returns the list of modular inverses of the values in nums using a
+        single inversion (Montgomery's batch inversion trick).
+
+        Raises:
+            ValueError: Error when any value in nums is 0 modulo prime.
+        """
+
+        if len(nums) == 0:
+            return []
+        elif self.reducer.preferred:
+            reduce = self.reducer.reduce
+        else:
+            prime = self.prime
+            reduce = lambda a: a % prime
+
+        prefix = []
+        product = 1
+        for num in nums:
+            product = reduce(product * num)
+            prefix.append(product)
+
+        inverse = self.inv(product)
+        inverses = [0] * len(nums)
+        for i in range(len(nums) - 1, 0, -1):
+            inverses[i] = reduce(inverse * prefix[i-1])
+            inverse = reduce(inverse * nums[i])
+        inverses[0] = inverse
+
+        return inverses
+
+    def product(self, nums):
+        """Returns the product of the values in nums modulo prime. The % 
+        operator is used since the values are typically small, e.g. the 
+        differences of x-coordinates, for which it beats folding.
+        """
+
+        prime = self.prime
+        result = 1
+        for num in nums:
+            result = (result * num) % prime
+        return result
+
+    def dot(self, aList, bList):
+        """Returns the sum of aList[i] * bList[i] modulo prime, reducing once
+        at the end.
+        """
+
+        total = 0
+        for i in range(0, len(aList)):
+            total += aList[i] * bList[i]
+        return self.reduce(total)
+
+    def horner(self, constant, coefficients, x):
+        """Returns constant + c[0]*x + ... + c[k-2]*x^(k-1) modulo prime for
+        the list coefficients of c[i] values using Horner's rule.
+        """
+
+        prime = self.prime
+        y = 0
+        for coeff in reversed(coefficients):
+            y = (y + coeff) * x % prime
+        return (y + constant) % prime
+
+    def hornerMany(self, constant, coefficients, xList):
+        """Returns the list of values of constant + c[0]*x + ... + c[k-2]*x^(k-1)
+        modulo prime for each x in xList using Horner's rule.
+        """
+
+        return [self.horner(constant, coefficients, x) for x in xList]
+
+#############################################################
+#                    Class: gmpyPrimeField                  #
+#############################################################
+
+class gmpyPrimeField(primeField):
+    """A class for arithmetic in the prime field GF(prime) using gmpy2.
+
+    Attributes:
+        mpzPrime: A gmpy2.mpz value of prime.
+    """
+
+    def __init__(self, prime):
+        """Initializes the field object for the given prime.
+
+        Args:
+            prime: An integer value specifying the order of the field.
+        """
+
+        primeField.__init__(self, prime)
+        self.mpzPrime = gmpy2.mpz(prime)
+
+    def mul(self, a, b):
+        """Returns a * b modulo prime."""
+        return int(gmpy2.mpz(a) * b % self.mpzPrime)
+
+    def inv(self, a):
+        """Returns the modular inverse of a.
+
+        Raises:
+            ValueError: Error when a is 0 modulo prime.
+        """
+
+        a = gmpy2.mpz(a) % self.mpzPrime
+        if a == 0:
+            raise ValueError("invalid a: value non-zero modulo prime expected")
+        return int(gmpy2.invert(a, self.mpzPrime))
+
+    def batchInv(self, nums):
+        """Returns the list of modular inverses of the values in nums using a
+        single inversion.
+
+        Raises:
+            ValueError: Error when any value in nums is 0 modulo prime.
+        """
+
+        prime = self.mpzPrime
+        prefix = []
+        product = gmpy2.mpz(1)
+        for num in nums:
+            product = product * num % prime
+            prefix.append(product)
+
+        if len(nums) == 0:
+            return []
+        elif product == 0:
+            raise ValueError("invalid a: value non-zero modulo prime expected")
+
+        inverse = gmpy2.invert(product, prime)
+        inverses = [0] * len(nums)
+        for i in range(len(nums) - 1, 0, -1):
+            inverses[i] = int(inverse * prefix[i-1] % prime)
+            inverse = inverse * nums[i] % prime
+        inverses[0] = int(inverse)
+
+        return inverses
+
+    def product(self, nums):
+        """Returns the product of the values in nums modulo prime."""
+
+        prime = self.mpzPrime
+        result = gmpy2.mpz(1)
+        for num in nums:
+            result = result * num % prime
+        return int(result)
+
+    def dot(self, aList, bList):
+        """Returns the sum of aList[i] * bList[i] modulo prime."""
+
+        total = gmpy2.mpz(0)
+        for i in range(0, len(aList)):
+            total += gmpy2.mpz(aList[i]) * bList[i]
+        return int(total % self.mpzPrime)
+
+    def horner(self, constant, coefficients, x):
+        """Returns constant + c[0]*x + ... + c[k-2]*x^(k-1) modulo prime using
+        Horner's rule.
+        """
+
+        prime = self.mpzPrime
+        y = gmpy2.mpz(0)
+        for coeff in reversed(coefficients):
+            y = (y + coeff) * x % prime
+        return int((y + constant) % prime)
+
+    def hornerMany(self, constant, coefficients, xList):
+        """Returns the list of values of constant + c[0]*x + ... + c[k-2]*x^(k-1)
+        modulo prime for each x in xList, converting the coefficients to mpz
+        values once for all the points.
+        """
+
+        prime = self.mpzPrime
+        coefficients = [gmpy2.mpz(coeff) for coeff in reversed(coefficients)]
+        constant = gmpy2.mpz(constant)
+        values = []
+        for x in xList:
+            y = gmpy2.mpz(0)
+            for coeff in coefficients:
+                y = (y + coeff) * x % prime
+            values.append(int((y + constant) % prime))
+        return values
+
+##################### End of Code ###########################
@@ -0,0 +1,215 @@
+#!/usr/bin/python
+
+#############################################################
+# CSE 539 (Applied Cryptography) Fall 2015 - Project        #
+# Team: Saurabh Gupta, Omkar Kaptan                         #
+# Instructor: Dr. Rida Bazzi                                #
+#############################################################
+
+"""Provides a modular reduction module for the special form primes
+returned by util.generatePrimes.
+
+Every prime in the list is either a Mersenne prime 2^e - 1 or a
+pseudo-Mersenne prime 2^e - c for a small c. Since 2^e = c modulo
+such a prime, a value a = hi * 2^e + lo reduces to hi * c + lo, which
+only needs a shift, a mask, a small multiplication and an addition.
+The folding is repeated until the value fits in e bits, followed by
+a single conditional subtraction.
+
+getReducer detects the shape of a prime and returns a per-prime
+reducer object. Each reducer class records the bit length from which
+it is faster than the native % operator in CPython, as measured by
+benchmark.py, in the preferred attribute of its objects.
+
+Global Methods
+~~~~~~~~~~~~~~
+    getReducer(prime)
+
+Class genericReducer
+~~~~~~~~~~~~~~~~~~~~
+    Attributes:
+        prime - the modulus
+        preferred - whether reduce is faster than a % prime
+    Constructor:
+        __init__(self, prime)
+    Methods:
+        reduce(self, a)
+
+Class mersenneReducer(genericReducer)
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    Attributes:
+        exponent - the exponent e such that prime = 2^e - 1
+        mask - the value 2^e - 1
+    Methods:
+        reduce(self, a)
+
+Class pseudoMersenneReducer(genericReducer)
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+    Attributes:
+        exponent - the exponent e such that prime = 2^e - c
+        offset - the value c
+        mask - the value 2^e - 1
+    Methods:
+        reduce(self, a)
+"""
+
+#################### Module Metadata ########################
+__author__ = "Saurabh Gupta, Omkar Kaptan"
+__email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
+__license__ = "GPL"
+__version__ = "1.0"
+
+#################### Method Definitions #####################
+
+def getReducer(prime):
+    """Returns a reducer object for the given prime. A mersenneReducer is
+    returned for primes of the form 2^e - 1, a pseudoMersenneReducer for
+    primes of the form 2^e - c where c < 2^(e/2), and a genericReducer
+    otherwise.
+
+    Args:
+        prime: An integer value specifying the modulus.
+
+    Returns:
+        A reducer object for the given prime.
+
+    Raises:
+        TypeError: Error when prime is not an integer.
+        ValueError: Error when prime is less than 2.
+    """
+
+    if type(prime) not in [int, long]:
+        raise TypeError("invalid prime: int or long expected")
+    elif prime < 2:
+        raise ValueError("invalid prime: value greater than 1 expected")
+
+    exponent = len(bin(prime)) - 2
+    offset = (1 << exponent) - prime
+
+    if offset == 1:
+        return mersenneReducer(prime)
+    elif offset < (1 << (exponent // 2)):
+        return pseudoMersenneReducer(prime)
+    else:
+        return genericReducer(prime)
+
+#############################################################
+#                    Class: genericReducer                  #
+#############################################################
+
+class genericReducer:
+    """A class for reduction modulo an arbitrary prime using the % operator.
+
+    Class Attributes:
+        minPreferredBits: An integer bit length from which reduce is faster
+            than the % operator, or None if it never is.
+
+    Attributes:
+        prime: An integer value specifying the modulus.
+        preferred: A boolean value specifying whether reduce is faster than
+            the % operator for prime.
+    """
+
+    minPreferredBits = None
+
+    def __init__(self, prime):
+        """Initializes the reducer object for the given prime.
+
+        Args:
+            prime: An integer value specifying the modulus.
+        """
+
+        self.prime = prime
+        bits = len(bin(prime)) - 2
+        self.preferred = self.minPreferredBits != None and bits >= self.minPreferredBits
+
+    def reduce(self, a):
+        """Returns a modulo prime."""
+        return a % self.prime
+
+#############################################################
+#                    Class: mersenneReducer                 #
+#############################################################
+
+class mersenneReducer(genericReducer):
+    """A class for reduction modulo a Mersenne prime 2^e - 1.
+
+    Attributes:
+        exponent: An integer value e such that prime = 2^e - 1.
+        mask: An integer value equal to 2^e - 1.
+    """
+
+    minPreferredBits = 512
+
+    def __init__(self, prime):
+        """Initializes the reducer object for the given Mersenne prime.
+
+        Args:
+            prime: An integer value of the form 2^e - 1.
+        """
+
+        genericReducer.__init__(self, prime)
+        self.exponent = len(bin(prime)) - 2
+        self.mask = prime
+
+    def reduce(self, a):
+        """Returns a modulo prime by adding the e-bit words of a, since
+        2^e = 1 modulo prime. Negative values fall back to the % operator.
+        """
+
+        if a < 0:
+            return a % self.prime
+
+        exponent, mask = self.exponent, self.mask
+        while a >> exponent:
+            a = (a >> exponent) + (a & mask)
+
+        if a == mask:
+            return 0
+        return a
+
+#############################################################
+#                    Class: pseudoMersenneReducer           #
+#############################################################
+
+class pseudoMersenneReducer(genericReducer):
+    """A class for reduction modulo a pseudo-Mersenne prime 2^e - c.
+
+    Attributes:
+        exponent: An integer value e such that prime = 2^e - c.
+        offset: An integer value c.
+        mask: An integer value equal to 2^e - 1.
+    """
+
+    minPreferredBits = None
+
+    def __init__(self, prime):
+        """Initializes the reducer object for the given pseudo-Mersenne prime.
+
+        Args:
+            prime: An integer value of the form 2^e - c for a small c.
+        """
+
+        genericReducer.__init__(self, prime)
+        self.exponent = len(bin(prime)) - 2
+        self.mask = (1 << self.exponent) - 1
+        self.offset = self.mask + 1 - prime
+
+    def reduce(self, a):
+        """Returns a modulo prime by folding the bits of a above 2^e back in
+        multiplied by c, since 2^e = c modulo prime. Negative values fall
+        back to the % operator.
+        """
+
+        if a < 0:
+            return a % self.prime
+
+        exponent, mask, offset = self.exponent, self.mask, self.offset
+        while a >> exponent:
+            a = (a >> exponent) * offset + (a & mask)
+
+        if a >= self.prime:
+            a -= self.prime
+        return a
+
+##################### End of Code ###########################
@@ -0,0 +1,279 @@
+#!/usr/bin/python
+
+#############################################################
+# CSE 539 (Applied Cryptography) Fall 2015 - Project        #
+# Team: Saurabh Gupta, Omkar Kaptan                         #
+# Instructor: Dr. Rida Bazzi                                #
+#############################################################
+
+"""Provides a Reed-Solomon decoding module for correcting faulty
+shares without any verification information.
+
+The n shares [x, y] of a secret are the evaluations of a polynomial
+f of degree less than k, i.e. a codeword of a Reed-Solomon code, so up
+to (n - k) / 2 wrong share values can be corrected. The decoder uses
+Gao's algorithm:
+    1. g0 = the product of (X - x) over all the x-coordinates, and
+       g1 = the polynomial of degree less than n through all the shares.
+    2. The extended Euclidean algorithm is run on g0 and g1 until the
+       remainder g has degree less than (n + k) / 2, giving g = u*g0 + v*g1.
+    3. f = g / v if the division is exact and f has degree less than k.
+       Otherwise there are too many errors to correct.
+The wrong shares are the ones with f(x) != y. All the steps are O(n^2)
+with a single modular inversion per polynomial division.
+
+Polynomials are lists of integer coefficients, lowest degree first.
+
+Class reedSolomon
+~~~~~~~~~~~~~~~~~
+    Static Methods:
+        trim(poly)
+        evaluate(poly, x, prime)
+        multiply(a, b, prime)
+        subtract(a, b, prime)
+        divide(a, b, prime)
+        vanishing(xList, prime)
+        interpolate(xList, yList, prime)
+        decode(xList, yList, k, prime)
+        findErrors(shares, k, prime)
+"""
+
+#################### Import modules #########################
+from primeField import getField
+
+#################### Module Metadata ########################
+__author__ = "Saurabh Gupta, Omkar Kaptan"
+__email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
+__license__ = "GPL"
+__version__ = "1.0"
+
+#############################################################
+#                    Class: reedSolomon                     #
+#############################################################
+
+class reedSolomon:
+    """A class of static methods for Reed-Solomon decoding of shares."""
+
+    @staticmethod
+    def trim(poly):
+        """Removes the zero leading coefficients of poly in place and returns
+        it. The zero polynomial is the empty list.
+        """
+
+        while len(poly) > 0 and poly[-1] == 0:
+            poly.pop()
+        return poly
+
+    @staticmethod
+    def evaluate(poly, x, prime):
+        """Returns the value of poly at x modulo prime using Horner's rule."""
+
+        y = 0
+        for coeff in reversed(poly):
+            y = (y * x + coeff) % prime
+        return y
+
+    @staticmethod
+    def multiply(a, b, prime):
+        """Returns the product of the polynomials a and b modulo prime."""
+
+        if len(a) == 0 or len(b) == 0:
+            return []
+
+        result = [0] * (len(a) + len(b) - 1)
+        for i in range(0, len(a)):
+            ai = a[i]
+            for j in range(0, len(b)):
+                result[i+j] += ai * b[j]
+        return reedSolomon.trim([coeff % prime for coeff in result])
+
+    @staticmethod
+    def subtract(a, b, prime):
+        """Returns the difference of the polynomials a and b modulo prime."""
+
+        result = list(a) + [0] * max(0, len(b) - len(a))
+        for i in range(0, len(b)):
+            result[i] = (result[i] - b[i]) % prime
+        return reedSolomon.trim(result)
+
+    @staticmethod
+    def divide(a, b, prime):
+        """Returns the quotient and remainder of the polynomial a divided by
+        the non-zero polynomial b modulo prime, using long division with a
+        single inversion of the leading coefficient of b.
+
+        Returns:
+            A list [quotient, remainder] of polynomials.
+        """
+
+        remainder = [coeff % prime for coeff in a]
+        reedSolomon.trim(remainder)
+        if len(remainder) < len(b):
+            return [[], remainder]
+
+        leadInverse = getField(prime).inv(b[-1])
+        shift = len(remainder) - len(b)
+        quotient = [0] * (shift + 1)
+
+        for i in range(shift, -1, -1):
+            coeff = remainder[i + len(b) - 1] * leadInverse % prime
+            quotient[i] = coeff
+            if coeff != 0:
+                for j in range(0, len(b)):
+                    remainder[i+j] = (remainder[i+j] - coeff * b[j]) % prime
+
+        return [reedSolomon.trim(quotient), reedSolomon.trim(remainder[:len(b) - 1])]
+
+    @staticmethod
+    def vanishing(xList, prime):
+        """Returns the polynomial product of (X - x) over all x in xList."""
+
+        poly = [1]
+        for x in xList:
+            shifted = [0] + poly
+            for i in range(0, len(poly)):
+                shifted[i] = (shifted[i] - x * poly[i]) % prime
+            poly = shifted
+        return poly
+
+    @staticmethod
+    def interpolate(xList, yList, prime):
+        """Returns the polynomial of degree less than len(xList) through the
+        points (xList[i], yList[i]), as the sum of y[i] * g0 / (X - x[i]) /
+        g0'(x[i]) where g0 = vanishing(xList, prime). The values g0'(x[i]) are
+        inverted together with a single modular inversion.
+        """
+
+        field = getField(prime)
+        g0 = reedSolomon.vanishing(xList, prime)
+        derivative = [i * g0[i] % prime for i in range(1, len(g0))]
+        inverses = field.batchInv([reedSolomon.evaluate(derivative, x, prime) for x in xList])
+
+        result = [0] * len(xList)
+        for i in range(0, len(xList)):
+            scale = yList[i] * inverses[i] % prime
+            if scale == 0:
+                continue
+
+            coeff = 0
+            x = xList[i]
+            for j in range(len(g0) - 1, 0, -1):
+                coeff = (coeff * x + g0[j]) % prime
+                result[j-1] += scale * coeff
+
+        return reedSolomon.trim([coeff % prime for coeff in result])
+
+    @staticmethod
+    def decode(xList, yList, k, prime):
+        """Decodes the shares (xList[i], yList[i]) into the polynomial of degree
+        less than k that agrees with all but at most (n - k) / 2 of them, using
+        Gao's algorithm.
+
+        Args:
+            xList: A list of n distinct integer x-coordinates.
+            yList: A list of n integer share values.
+            k: An integer value representing the number of shares required for
+                reconstructing the secret.
+            prime: An integer value to be used as the order of modulo operations.
+
+        Returns:
+            A list [poly, errors] where poly is the decoded polynomial and errors
+            is the list of x-coordinates whose share values do not lie on it.
+
+        Raises:
+            ValueError: Error when more than (n - k) / 2 shares are wrong.
+        """
+
+        n = len(xList)
+        g0 = reedSolomon.vanishing(xList, prime)
+        g1 = reedSolomon.interpolate(xList, yList, prime)
+
+        r0, r1 = g0, g1
+        v0, v1 = [], [1]
+        while 2 * (len(r1) - 1) >= n + k:
+            quotient, remainder = reedSolomon.divide(r0, r1, prime)
+            r0, r1 = r1, remainder
+            v0, v1 = v1, reedSolomon.subtract(v0, reedSolomon.multiply(quotient, v1, prime), prime)
+
+        poly, remainder = reedSolomon.divide(r1, v1, prime)
+        if len(remainder) != 0 or len(poly) > k:
+            raise ValueError("invalid shares: at most %d wrong shares expected" % ((n - k) // 2))
+
+        errors = [xList[i] for i in range(0, n) \
+            if reedSolomon.evaluate(poly, xList[i], prime) != yList[i] % prime]
+        if 2 * len(errors) > n - k:
+            raise ValueError("invalid shares: at most %d wrong shares expected" % ((n - k) // 2))
+
+        return [poly, errors]
+
+    @staticmethod
+    def findErrors(shares, k, prime):
+        """Returns the x-coordinates of the wrong shares among all the given
+        shares. For chunked shares, whose values are lists of blocks, every
+        block is decoded and the wrong x-coordinates of all the blocks are
+        returned.
+
+        Args:
+            shares: A list of shares of the form [x, y] where x is an integer and
+                y is an integer or a list of integers.
+            k: An integer value representing the number of shares required for
+                reconstructing the secret.
+            prime: An integer value to be used as the order of modulo operations.
+
+        Returns:
+            A sorted list of the x-coordinates of the wrong shares.
+
+        Raises:
+            TypeError: Error when shares is not a list of [x, y] lists, or when
+                either k or prime is not an integer.
+            ValueError: Error when k < 2, when fewer than k shares are given,
+                when the x-coordinates are not distinct, when chunked shares have
+                different numbers of blocks, or when more than (n - k) / 2 shares
+                are wrong.
+        """
+
+        if type(shares) != list:
+            raise TypeError("invalid shares: list expected")
+        elif type(k) not in [int, long]:
+            raise TypeError("invalid k: int or long expected")
+        elif type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+        elif k < 2:
+            raise ValueError("invalid k: value greater than 1 expected")
+        elif k > len(shares):
+            raise ValueError("insufficient number of shares: expected k or more")
+
+        try:
+            xList, yList = [list(values) for values in zip(*shares)]
+        except (TypeError, ValueError):
+            raise TypeError("invalid shares: list of [x, y] lists expected")
+
+        for x in xList:
+            if type(x) not in [int, long]:
+                raise TypeError("invalid shares: integer x-coordinates expected")
+        if len(set(x % prime for x in xList)) != len(xList):
+            raise ValueError("invalid shares: distinct x-coordinates expected")
+
+        if type(yList[0]) != list:
+            blockLists = [yList]
+        else:
+            blockCount = len(yList[0])
+            for y in yList:
+                if type(y) != list or len(y) != blockCount:
+                    raise ValueError("invalid shares: equal numbers of blocks expected")
+            blockLists = [list(blocks) for blocks in zip(*yList)]
+
+        errors = set()
+        for blocks in blockLists:
+            for y in blocks:
+                if type(y) not in [int, long]:
+                    raise TypeError("invalid shares: integer share values expected")
+            errors.update(reedSolomon.decode(xList, blocks, k, prime)[1])
+
+        if 2 * len(errors) > len(xList) - k:
+            raise ValueError("invalid shares: at most %d wrong shares expected" \
+                % ((len(xList) - k) // 2))
+
+        return sorted(errors)
+
+##################### End of Code ###########################
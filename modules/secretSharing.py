@@ -9,29 +9,66 @@
 """Provides an (n, k) secret sharing module for generating n
 shares from a secret message, and reconstructing the secret 
 message from k shares. Additional methods include the generation
-and verification of MAC tags and auxilliary information for 
-information theoretic verification.
+and verification of MAC tags, polynomial hash MAC tags, auxilliary 
+information for information theoretic verification, seeded auxilliary 
+information derived with a keyed PRF, SHA-256 hash commitments, and 
+Feldman commitments for verifiable secret sharing. The field arithmetic of these 
+methods is run through the primeField object for the given prime, 
+after validating the arguments once per call.
 
 Class secretSharing
 ~~~~~~~~~~~~~~~~~~~
+    Class Attributes:
+        lagrangeCache - cache of Lagrange weights keyed by (x-set, prime)
+        maxLagrangeCache - maximum number of cached weight sets
+        parityCache - cache of parity check weights keyed by (x-set, k, prime)
+        maxParityCache - maximum number of cached parity check weight sets
     Static Methods:
         extendedGCD(a, b)
         modularInverse(num, prime)
-        generateShares(msg, n, k, prime)
+        batchModularInverse(nums, prime)
+        lagrangeWeights(xList, prime)
+        parityCheckWeights(xList, k, prime)
+        checkConsistency(shares, k, prime)
+        generateShares(msg, n, k, prime, usePowerTable, field)
+        generateVerifiableShares(msg, n, k, prime)
         randomPolynomial(k, prime)
-        evaluatePolynomial(msgNum, coefficients, n, prime)
+        evaluatePolynomial(msgNum, coefficients, n, prime, usePowerTable)
         generateMac(msg, key)
         generateAuxInfo(s, prime)
-        reconstructSecret(shares, k, prime) 
+        generateAuxInfoBatch(s, count, prime)
+        deriveAuxInfo(key, seed, i, prime)
+        generateSeededAuxInfo(s, key, i, prime)
+        generateShareDigest(share, salt)
+        generateHashCommitments(shares)
+        reconstructSecret(shares, k, prime, field) 
+        getBlockSize(prime)
+        generateChunkedShares(msg, n, k, prime)
+        reconstructChunkedSecret(shares, k, prime)
         verifyMac(msg, key, tag)
+        generatePolyMac(share, key, prime)
+        verifyPolyMac(share, key, prime, tag)
         verifyAuxInfo(s, y, b, c, prime)
+        verifyAuxInfoBatch(sList, yList, bList, cList, prime)
+        verifyCommitment(share, commitments, prime)
+        verifyShareDigest(share, salt, digest)
 """
 
 #################### Import modules #########################
 import hmac
 import hashlib
 import base64
-from util import genRandNum, message
+import os
+import struct
+from collections import OrderedDict
+from util import genRandNum, genRandNums, message
+from polynomial import polynomial
+from primeField import getField
+from gf256 import gf256
+from ntt import ntt, NTT_PRIME
+from feldman import getGroup
+from polyMac import getPolyMac
+from macContext import getMacContext
 
 #################### Module Metadata ########################
 __author__ = "Saurabh Gupta, Omkar Kaptan"
@@ -43,13 +80,47 @@ __version__ = "1.0"
 NO_VERIFICATION = 1
 AUX_INFO_VERIFICATION = 2
 MAC_VERIFICATION = 3
+FELDMAN_VERIFICATION = 4
+POLY_MAC_VERIFICATION = 5
+SEEDED_AUX_INFO_VERIFICATION = 6
+HASH_VERIFICATION = 7
+
+############ Global Variables for Sharing Fields ############
+PRIME_FIELD = 1
+BYTE_FIELD = 2
+NTT_FIELD = 3
+
+############ Global Variables for Chunked Sharing ###########
+CHUNK_PRIME = 2**127 - 1
+
+########### Global Variables for Batch Verification #########
+BATCH_COEFF_BYTES = 8
+
+########### Global Variables for Seeded Aux Info ############
+SEED_BYTES = 16
 
 #############################################################
 #                    Class: secretSharing                   #
 #############################################################
 
 class secretSharing:
-    """A class of static methods for secret sharing related operations."""
+    """A class of static methods for secret sharing related operations.
+
+    Class Attributes:
+        lagrangeCache: An OrderedDict mapping (sorted x-set, prime) to a dict
+            of Lagrange basis weights at x = 0, in least recently used order.
+        maxLagrangeCache: An integer specifying the maximum number of cached
+            weight sets.
+        parityCache: An OrderedDict mapping (sorted x-set, k, prime) to the
+            list of parity check weight dicts, in least recently used order.
+        maxParityCache: An integer specifying the maximum number of cached
+            parity check weight sets.
+    """
+
+    lagrangeCache = OrderedDict()
+    maxLagrangeCache = 64
+    parityCache = OrderedDict()
+    maxParityCache = 64
 
     @staticmethod
     def extendedGCD(a, b):
@@ -111,15 +182,243 @@ class secretSharing:
             r = secretSharing.extendedGCD(prime, num)[2]
         return (prime + r) % prime
 
+    @staticmethod
+    def batchModularInverse(nums, prime):
+        """Calculates the modular inverses of all the values in nums with a 
+        single modular inversion using Montgomery's batch inversion trick.
+
+        The prefix products of nums are inverted once, and each inverse is 
+        then recovered from the running inverse by two multiplications.
+
+        Args:
+            nums: A list of integer values for which modular inverses are to be 
+                calculated.
+            prime: An integer value to be used as the order of modulo operations.
+
+        Returns:
+            A list of integer values, the ith value being the modular inverse of 
+            nums[i].
+
+        Raises:
+            TypeError: Error when nums is not a list, or when prime is not an 
+                integer.
+            ValueError: Error when any value in nums is 0 modulo prime.
+        """
+
+        if type(nums) != list:
+            raise TypeError("invalid nums: list expected")
+        elif type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+
+        for num in nums:
+            if type(num) not in [int, long]:
+                raise TypeError("invalid nums: list of int or long expected")
+
+        return getField(prime).batchInv(nums)
+
+    @staticmethod
+    def lagrangeWeights(xList, prime):
+        """Returns the Lagrange basis weights at x = 0 for the given list of 
+        x-coordinates, such that the secret is the sum of weight[x] * y over 
+        all the shares [x, y].
+
+        Weights are cached by the sorted x-coordinates and prime, so that 
+        repeat reconstructions from the same set of nodes cost a single dot 
+        product. The least recently used weight set is discarded once 
+        maxLagrangeCache sets are cached. For NTT_PRIME and x-coordinates on 
+        roots of unity, the weights are computed by ntt.lagrangeWeights once 
+        ntt.preferWeights holds for the number of x-coordinates.
+
+        Args:
+            xList: A list of distinct integer x-coordinates.
+            prime: An integer value to be used as the order of modulo operations.
+
+        Returns:
+            A dict mapping each x-coordinate in xList to its integer weight.
+
+        Raises:
+            TypeError: Error when xList is not a list of integers, or when prime 
+                is not an integer.
+            ValueError: Error when xList contains duplicate x-coordinates.
+        """
+
+        if type(xList) != list:
+            raise TypeError("invalid xList: list expected")
+        elif type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+
+        key = (tuple(sorted(xList)), prime)
+        weights = secretSharing.lagrangeCache.pop(key, None)
+
+        if weights == None:
+            for x in xList:
+                if type(x) not in [int, long]:
+                    raise TypeError("invalid xList: list of int or long expected")
+            if len(set(x % prime for x in xList)) != len(xList):
+                raise ValueError("invalid xList: distinct x-coordinates expected")
+
+            if prime == NTT_PRIME and ntt.preferWeights(len(xList)):
+                try:
+                    weights = ntt.lagrangeWeights(xList)
+                except ValueError:
+                    weights = None
+
+            if weights == None:
+                field = getField(prime)
+                numerators = []
+                denominators = []
+                for xi in xList:
+                    others = [xj for xj in xList if xj != xi]
+                    numerators.append(field.product([-xj for xj in others]))
+                    denominators.append(field.product([xi - xj for xj in others]))
+
+                inverses = field.batchInv(denominators)
+                weights = {}
+                for i in range(0, len(xList)):
+                    weights[xList[i]] = field.mul(numerators[i], inverses[i])
+
+            while len(secretSharing.lagrangeCache) >= secretSharing.maxLagrangeCache:
+                secretSharing.lagrangeCache.popitem(last=False)
+
+        secretSharing.lagrangeCache[key] = weights
+        return weights
+
+    @staticmethod
+    def parityCheckWeights(xList, k, prime):
+        """Returns the n - k rows of a parity check matrix for the shares at 
+        the n x-coordinates in xList of a polynomial of degree less than k. 
+
+        The shares [x, y] lie on such a polynomial iff the sum of u(x) * x^j * y 
+        over all the shares is 0 for every j < n - k, where u(x) is the inverse 
+        of the product of (x - x') over the other x-coordinates x'. Row j holds 
+        the weights u(x) * x^j. The rows are cached by the sorted x-coordinates, 
+        k and prime, so that they are computed once per node set.
+
+        Args:
+            xList: A list of distinct integer x-coordinates.
+            k: An integer value representing the number of shares required for 
+                reconstructing the secret.
+            prime: An integer value to be used as the order of modulo operations.
+
+        Returns:
+            A list of n - k dicts, each mapping every x-coordinate in xList to 
+            its integer weight.
+
+        Raises:
+            TypeError: Error when xList is not a list of integers, or when 
+                either k or prime is not an integer.
+            ValueError: Error when k < 1 or k > len(xList), or when xList 
+                contains duplicate x-coordinates.
+        """
+
+        if type(xList) != list:
+            raise TypeError("invalid xList: list expected")
+        elif type(k) not in [int, long]:
+            raise TypeError("invalid k: int or long expected")
+        elif type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+        elif k < 1 or k > len(xList):
+            raise ValueError("invalid k: value in [1, %d] expected" % len(xList))
+
+        key = (tuple(sorted(xList)), k, prime)
+        rows = secretSharing.parityCache.pop(key, None)
+
+        if rows == None:
+            for x in xList:
+                if type(x) not in [int, long]:
+                    raise TypeError("invalid xList: list of int or long expected")
+            if len(set(x % prime for x in xList)) != len(xList):
+                raise ValueError("invalid xList: distinct x-coordinates expected")
+
+            field = getField(prime)
+            denominators = []
+            for xi in xList:
+                denominators.append(field.product([xi - xj for xj in xList if xj != xi]))
+
+            weights = field.batchInv(denominators)
+            rows = []
+            for j in range(0, len(xList) - k):
+                rows.append(dict(zip(xList, weights)))
+                weights = [field.mul(weights[i], xList[i]) for i in range(0, len(xList))]
+
+            while len(secretSharing.parityCache) >= secretSharing.maxParityCache:
+                secretSharing.parityCache.popitem(last=False)
+
+        secretSharing.parityCache[key] = rows
+        return rows
 
     @staticmethod
-    def evaluatePolynomial(msgNum, coefficients, n, prime):
+    def checkConsistency(shares, k, prime):
+        """Checks whether all the given shares lie on a single polynomial of 
+        degree less than k, using n - k dot products with the cached rows of 
+        parityCheckWeights instead of interpolating the shares. For chunked 
+        shares, whose values are lists of blocks, every block is checked.
+
+        If the shares are consistent, then fewer than n - k + 1 changed shares 
+        cannot explain them, so with at most n - k faulty nodes the shares are 
+        the ones that were dealt.
+
+        Args:
+            shares: A list of shares of the form [x, y] where x is an integer and 
+                y is an integer or a list of integers.
+            k: An integer value representing the number of shares required for 
+                reconstructing the secret.
+            prime: An integer value to be used as the order of modulo operations.
+
+        Returns:
+            A boolean value, True if the shares are consistent and False 
+            otherwise.
+
+        Raises:
+            TypeError: Error when shares is not a list of [x, y] lists, or when 
+                either k or prime is not an integer.
+            ValueError: Error when k < 1 or k > len(shares), when the 
+                x-coordinates are not distinct, or when chunked shares have 
+                different numbers of blocks.
+        """
+
+        if type(shares) != list:
+            raise TypeError("invalid shares: list expected")
+
+        try:
+            xList, yList = [list(values) for values in zip(*shares)]
+        except (TypeError, ValueError):
+            raise TypeError("invalid shares: list of [x, y] lists expected")
+
+        rows = secretSharing.parityCheckWeights(xList, k, prime)
+        field = getField(prime)
+
+        if type(yList[0]) != list:
+            blockLists = [yList]
+        else:
+            for y in yList:
+                if type(y) != list or len(y) != len(yList[0]):
+                    raise ValueError("invalid shares: equal numbers of blocks expected")
+            blockLists = [list(blocks) for blocks in zip(*yList)]
+
+        for blocks in blockLists:
+            for y in blocks:
+                if type(y) not in [int, long]:
+                    raise TypeError("invalid shares: integer share values expected")
+            for row in rows:
+                if field.dot([row[x] for x in xList], blocks) != 0:
+                    return False
+
+        return True
+
+
+    @staticmethod
+    def evaluatePolynomial(msgNum, coefficients, n, prime, usePowerTable=False):
         """Generates shares of the integer msgNum by evaluating the polynomial 
         y = msgNum + c[0]*x + c[1]*x^2 + ... + c[n-2]*x^(n-1) using the list 
         coefficients as the list of c[i] values for n different values of x and 
         returns a list of n pairs [x, y]. The prime value is used as the order 
         of modulo operations is all the evaluations.
 
+        The evaluation is delegated to polynomial.evaluateAll, which uses 
+        Horner's rule for each x, or a cached table of powers of x when 
+        usePowerTable is True.
+
         Args:
             msgNum: An integer value specifying the message for which the shares 
                 are to be generated.
@@ -127,6 +426,8 @@ class secretSharing:
                 the polynomial evaluation.
             n: An integer value representing the number of shares to be generated.
             prime: An integer value to be used as the order of modulo operations.
+            usePowerTable: A boolean specifying whether or not the cached table 
+                of powers of x is to be used. Default value = False.
 
         Returns:
             A list of n shares of the form [x, y] generated by polynomial 
@@ -149,18 +450,8 @@ class secretSharing:
             for coeff in coefficients:
                 if type(coeff) not in [int, long]:
                     raise TypeError("invalid coefficients: list of int or long expected")
-        
-        shares = []
-        for x in range(1, n+1):
-            y = msgNum
-            for i in range(1, len(coefficients) + 1):
-                exp = (x ** i) % prime
-                term = (exp * coefficients[i-1]) % prime
-                y = (y + term) % prime
-            
-            shares.append([x, y])
-        
-        return shares
+
+        return polynomial.evaluateAll(msgNum, coefficients, n, prime, usePowerTable)
 
     @staticmethod
     def randomPolynomial(k, prime):
@@ -193,17 +484,30 @@ class secretSharing:
         return coefficients 
 
     @staticmethod
-    def generateShares(msg, n, k, prime):
+    def generateShares(msg, n, k, prime, usePowerTable=False, field=PRIME_FIELD):
         """Generates n shares for the msg such that any k shares can be used 
         for reconstructing the msg. The prime value is used as the order of 
         modulo operations.
 
+        When field is BYTE_FIELD, the msg is shared byte by byte over GF(2^8) 
+        by gf256.generateShares instead, the prime is ignored, and each share 
+        y is a string of the same length as msg.
+
+        When field is NTT_FIELD, the prime is ignored and the msg is shared 
+        over NTT_PRIME at the roots of unity returned by ntt.getPoints(n). The 
+        shares are computed by ntt.evaluateAll in O(n log n) when 
+        ntt.preferEvaluation holds for k, and by Horner's rule otherwise.
+
         Args:
             msg: A string message for which the shares are to be generated.
             n: An integer value representing the number of shares to be generated.
             k: An integer value representing the number of shares that are 
                 required for reconstructing the msg.
             prime: An integer value to be used as the order of modulo operations.
+            usePowerTable: A boolean specifying whether or not the cached table 
+                of powers of x is to be used. Default value = False.
+            field: An integer value, PRIME_FIELD, BYTE_FIELD or NTT_FIELD, 
+                selecting the field of the shares. Default value = PRIME_FIELD.
 
         Returns:
             A list of n shares of the form [x, y] generated by the 
@@ -212,9 +516,18 @@ class secretSharing:
         Raises:
             TypeError: Error when either n, k or prime is not an integer, or 
                 when msg is not a string.
-            ValueError: Error when n and k do not satisfy n > k > 1.
+            ValueError: Error when n and k do not satisfy n > k > 1, when field 
+                is invalid, or when the msg is too long for NTT_FIELD.
         """
 
+        if field == BYTE_FIELD:
+            return gf256.generateShares(msg, n, k)
+        elif field == NTT_FIELD:
+            prime = NTT_PRIME
+        elif field != PRIME_FIELD:
+            raise ValueError("invalid field: %d, %d or %d expected" \
+                % (PRIME_FIELD, BYTE_FIELD, NTT_FIELD))
+
         if type(n) not in [int, long]:
             raise TypeError("invalid n: int or long expected")
         elif type(k) not in [int, long]:
@@ -232,30 +545,107 @@ class secretSharing:
             raise TypeError("invalid msg: str expected")
 
         coefficients = secretSharing.randomPolynomial(k, prime)
-        shares = secretSharing.evaluatePolynomial(msgNum, coefficients, n, prime)
+
+        if field == NTT_FIELD:
+            if msgNum >= prime:
+                raise ValueError("invalid msg: value smaller than NTT_PRIME expected")
+            elif ntt.preferEvaluation(k):
+                return ntt.evaluateAll(msgNum, coefficients, n)
+
+            xList = ntt.getPoints(n)
+            yList = getField(prime).hornerMany(msgNum, coefficients, xList)
+            return [list(share) for share in zip(xList, yList)]
+
+        shares = secretSharing.evaluatePolynomial(msgNum, coefficients, n, prime, usePowerTable)
         return shares
 
     @staticmethod
-    def reconstructSecret(shares, k, prime):
-        """Reconstruct secret message using 
+    def generateVerifiableShares(msg, n, k, prime):
+        """Generates n shares for the msg such that any k shares can be used 
+        for reconstructing the msg, along with the Feldman commitments to the 
+        coefficients of the sharing polynomial in the Schnorr group returned 
+        by feldman.getGroup(prime). Any share [x, y] can then be verified 
+        against the commitments by verifyCommitment.
 
         Args:
             msg: A string message for which the shares are to be generated.
             n: An integer value representing the number of shares to be generated.
             k: An integer value representing the number of shares that are 
                 required for reconstructing the msg.
+            prime: An integer prime value to be used as the order of modulo 
+                operations.
+
+        Returns:
+            A list containing the list of n shares of the form [x, y] and the 
+                list of k integer commitments.
+
+        Raises:
+            TypeError: Error when either n, k or prime is not an integer, or 
+                when msg is not a string.
+            ValueError: Error when n and k do not satisfy n > k > 1, or when 
+                prime is not a valid Schnorr group order.
+        """
+
+        if type(n) not in [int, long]:
+            raise TypeError("invalid n: int or long expected")
+        elif type(k) not in [int, long]:
+            raise TypeError("invalid k: int or long expected")
+        elif n < 2 or k < 2:
+            raise ValueError("invalid n or k: value greater than or equal to 2 expected")
+        elif n < k:
+            raise ValueError("invalid k: value less than or equal to n expected")
+        elif type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+        elif type(msg) != str:
+            raise TypeError("invalid msg: str expected")
+
+        group = getGroup(prime)
+        msgNum = message.strToNum(msg)
+        coefficients = secretSharing.randomPolynomial(k, prime)
+        shares = secretSharing.evaluatePolynomial(msgNum, coefficients, n, prime)
+        commitments = group.commit([msgNum] + coefficients)
+        return [shares, commitments]
+
+    @staticmethod
+    def reconstructSecret(shares, k, prime, field=PRIME_FIELD):
+        """Reconstruct secret message using the first k shares by Lagrange 
+        interpolation at x = 0. The Lagrange weights for the x-coordinates of 
+        the shares are computed with a single batch modular inversion and are 
+        cached by lagrangeWeights for repeat reconstructions.
+
+        When field is BYTE_FIELD, the shares are reconstructed over GF(2^8) by 
+        gf256.reconstructSecret instead, the prime is ignored, and the secret 
+        is returned as a string. When field is NTT_FIELD, the prime is 
+        replaced by NTT_PRIME.
+
+        Args:
+            shares: A list of shares of the form [x, y] where x and y are integers.
+            k: An integer value representing the number of shares that are 
+                required for reconstructing the secret.
             prime: An integer value to be used as the order of modulo operations.
+            field: An integer value, PRIME_FIELD, BYTE_FIELD or NTT_FIELD, 
+                selecting the field of the shares. Default value = PRIME_FIELD.
 
         Returns:
-            A list of n shares of the form [x, y] generated by the 
-            evaluatePolynomial method.
+            An integer value representing the reconstructed secret, or a string 
+            when field is BYTE_FIELD.
 
         Raises:
             TypeError: Error when either k or prime is not an integer, or when 
                 shares is not a list of [int, int] lists.
-            ValueError: Error when k < 2 or when number of shares is less than k.
+            ValueError: Error when k < 2, when number of shares is less than k, 
+                when the x-coordinates of the shares are not distinct, or when 
+                field is invalid.
         """
 
+        if field == BYTE_FIELD:
+            return gf256.reconstructSecret(shares, k)
+        elif field == NTT_FIELD:
+            prime = NTT_PRIME
+        elif field != PRIME_FIELD:
+            raise ValueError("invalid field: %d, %d or %d expected" \
+                % (PRIME_FIELD, BYTE_FIELD, NTT_FIELD))
+
         if type(shares) != list:
             raise TypeError("invalid shares: list expected")
         elif type(k) not in [int, long]:
@@ -275,28 +665,159 @@ class secretSharing:
         except TypeError:
             raise TypeError("invalid shares: list of lists expected")
 
-        secret = 0
+        for yi in yList:
+            if type(yi) not in [int, long]:
+                raise TypeError("invalid shares: list of [int, int] lists expected")
+
+        weights = secretSharing.lagrangeWeights(list(xList), prime)
+        secret = getField(prime).dot([weights[xi] for xi in xList], yList)
+        return secret
+
+    @staticmethod
+    def getBlockSize(prime):
+        """Returns the number of message characters per block for chunked 
+        sharing over the given prime, i.e. the largest blockSize such that 
+        every block generated by message.strToBlocks is smaller than prime.
+
+        Args:
+            prime: An integer value to be used as the order of modulo operations.
+
+        Returns:
+            An integer value specifying the number of characters per block.
+
+        Raises:
+            TypeError: Error when prime is not an integer.
+            ValueError: Error when prime is too small to hold a single character 
+                per block.
+        """
+
+        if type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+
+        blockSize = (len(bin(prime)) - 3) // 8 - 1
+        if blockSize < 1:
+            raise ValueError("invalid prime: value larger than 2^16 expected")
+
+        return blockSize
+
+    @staticmethod
+    def generateChunkedShares(msg, n, k, prime=CHUNK_PRIME):
+        """Generates n shares for a msg of arbitrary length such that any k 
+        shares can be used for reconstructing the msg. The msg is split into 
+        blocks of getBlockSize(prime) characters, and each block is shared 
+        with its own random polynomial at the same x-coordinates 1, ..., n.
+
+        Args:
+            msg: A string message for which the shares are to be generated.
+            n: An integer value representing the number of shares to be generated.
+            k: An integer value representing the number of shares that are 
+                required for reconstructing the msg.
+            prime: An integer value to be used as the order of modulo operations.
+                Default value = CHUNK_PRIME.
+
+        Returns:
+            A list of n shares of the form [x, yList] where yList is the list 
+            of the shares of each block at x.
+
+        Raises:
+            TypeError: Error when either n, k or prime is not an integer, or 
+                when msg is not a string.
+            ValueError: Error when n and k do not satisfy n > k > 1, or when 
+                prime is too small.
+        """
+
+        if type(n) not in [int, long]:
+            raise TypeError("invalid n: int or long expected")
+        elif type(k) not in [int, long]:
+            raise TypeError("invalid k: int or long expected")
+        elif n < 2 or k < 2:
+            raise ValueError("invalid n or k: value greater than or equal to 2 expected")
+        elif n < k:
+            raise ValueError("invalid k: value less than or equal to n expected")
+        elif type(msg) != str:
+            raise TypeError("invalid msg: str expected")
+
+        blocks = message.strToBlocks(msg, secretSharing.getBlockSize(prime))
+        shares = [[x, []] for x in range(1, n+1)]
+
+        for block in blocks:
+            coefficients = secretSharing.randomPolynomial(k, prime)
+            blockShares = polynomial.evaluateAll(block, coefficients, n, prime)
+            for i in range(0, n):
+                shares[i][1].append(blockShares[i][1])
+
+        return shares
+
+    @staticmethod
+    def reconstructChunkedSecret(shares, k, prime=CHUNK_PRIME):
+        """Reconstructs a msg of arbitrary length from the first k shares 
+        generated by generateChunkedShares. The Lagrange weights for the 
+        x-coordinates of the shares are computed once and reused for every 
+        block.
+
+        Args:
+            shares: A list of shares of the form [x, yList] where x is an 
+                integer and yList is a list of integers.
+            k: An integer value representing the number of shares that are 
+                required for reconstructing the msg.
+            prime: An integer value to be used as the order of modulo operations.
+                Default value = CHUNK_PRIME.
+
+        Returns:
+            The reconstructed string message.
+
+        Raises:
+            TypeError: Error when either k or prime is not an integer, or when 
+                shares is not a list of [int, list] lists.
+            ValueError: Error when k < 2, when number of shares is less than k, 
+                when the x-coordinates are not distinct, or when the shares 
+                hold different numbers of blocks.
+        """
+
+        if type(shares) != list:
+            raise TypeError("invalid shares: list expected")
+        elif type(k) not in [int, long]:
+            raise TypeError("invalid k: int or long expected")
+        elif k < 2:
+            raise ValueError("invalid k: value greater than 1 expected")
+        elif type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+        elif k > len(shares):
+            raise ValueError("insufficient number of shares: expected k or more")
+
+        shares = shares[:k]
 
         try:
-            for [xi, yi] in shares:
-                numerator, denominator = 1, 1
+            xList, blockLists = zip(*shares)
+        except TypeError:
+            raise TypeError("invalid shares: list of lists expected")
 
-                for xj in xList:
-                    if xi != xj:
-                        numerator = (numerator * -xj) % prime
-                        denominator = (denominator * (xi - xj)) % prime
+        numBlocks = None
+        for blockList in blockLists:
+            if type(blockList) != list:
+                raise TypeError("invalid shares: list of [int, list] lists expected")
+            elif numBlocks != None and len(blockList) != numBlocks:
+                raise ValueError("invalid shares: same number of blocks expected")
+            numBlocks = len(blockList)
+            for y in blockList:
+                if type(y) not in [int, long]:
+                    raise TypeError("invalid shares: list of int or long blocks expected")
 
-                term = numerator * secretSharing.modularInverse(denominator, prime)
-                secret = (secret + prime + (yi * term)) % prime
-        except [ValueError, TypeError]:
-            raise TypeError("invalid shares: list of [int, int] lists expected")
+        field = getField(prime)
+        weights = secretSharing.lagrangeWeights(list(xList), prime)
+        weightList = [weights[x] for x in xList]
 
-        return secret
+        blocks = []
+        for i in range(0, numBlocks):
+            blocks.append(field.dot(weightList, [blockList[i] for blockList in blockLists]))
+
+        return message.blocksToStr(blocks)
 
     @staticmethod
     def generateMac(msg, key):
         """Generates a base64 SHA256 based HMAC tag for the given msg using the 
-        given key. 
+        given key. The key is decoded and hashed once per key by 
+        macContext.getMacContext.
 
         Args:
             msg: A string message for which the MAC tag is to be generated.
@@ -314,10 +835,7 @@ class secretSharing:
         elif type(key) != str:
             raise TypeError("invalid key: string expected")
 
-        keyString = message.base64ToStr(key)    
-        dig = hmac.new(keyString, msg, hashlib.sha256).digest()
-        tag = base64.b64encode(dig)
-        return tag
+        return getMacContext(key).generateTag(msg)
 
     @staticmethod
     def verifyMac(msg, key, tag):
@@ -344,7 +862,53 @@ class secretSharing:
         elif type(tag) != str:
             raise TypeError("invalid msg: str expected")
 
-        return hmac.compare_digest(secretSharing.generateMac(msg, key), tag)
+        return getMacContext(key).verifyTag(msg, tag)
+
+    @staticmethod
+    def generatePolyMac(share, key, prime):
+        """Generates the Carter-Wegman tag of the integer share [x, y] using
+        the polynomial hash over the prime field keyed by the given key. The 
+        share is not serialized, and the key material is derived once per 
+        key by polyMac.getPolyMac.
+
+        Args:
+            share: A share of the form [x, y] where x is an integer and y is an 
+                integer or a list of integer blocks.
+            key: A base64 format string key shared with the verifier.
+            prime: An integer value to be used as the order of modulo operations.
+
+        Returns:
+            An integer tag modulo prime.
+
+        Raises:
+            TypeError: Error when share is not a valid share, when key is not a 
+                string, or when prime is not an integer.
+        """
+
+        return getPolyMac(key, prime).generateTag(share)
+
+    @staticmethod
+    def verifyPolyMac(share, key, prime, tag):
+        """Verifies the Carter-Wegman tag of the integer share [x, y] 
+        generated by generatePolyMac.
+
+        Args:
+            share: A share of the form [x, y] where x is an integer and y is an 
+                integer or a list of integer blocks.
+            key: A base64 format string key shared with the sender.
+            prime: An integer value to be used as the order of modulo operations.
+            tag: An integer tag to be verified.
+
+        Returns:
+            A boolean corresponding to the verification. True if tag is a valid 
+            tag for the share using the key, and False otherwise.
+
+        Raises:
+            TypeError: Error when key is not a string, or when prime is not an 
+                integer.
+        """
+
+        return getPolyMac(key, prime).verifyTag(share, tag)
 
     @staticmethod
     def generateAuxInfo(s, prime):
@@ -373,11 +937,193 @@ class secretSharing:
         elif s >= prime:
             raise ValueError("invalid prime: value larger than s expected")
 
+        field = getField(prime)
         b = genRandNum(prime)
         y = genRandNum(prime)
-        c = (b * s + y) % prime
+        c = field.add(field.mul(b, s), y)
         return [c, b, y]
 
+    @staticmethod
+    def generateAuxInfoBatch(s, count, prime):
+        """Generates count sets of auxilliary information for a msg integer s, 
+        each satisfying the equation c = bs + y as in generateAuxInfo. The 
+        arguments are validated once for all the sets, and all the random b 
+        and y values are drawn by a single call of genRandNums.
+
+        Args:
+            s: A integer message for which the auxilliary information is to be 
+                generated.
+            count: An integer value specifying the number of sets to be 
+                generated.
+            prime: A integer value specifying the prime field for modulo operations.
+
+        Returns:
+            A list consisting of the lists [cList, bList, yList] of count values 
+                each, such that cList[i] = bList[i]*s + yList[i].
+
+        Raises:
+            TypeError: Error when either the s, count or prime is not a integer.
+            ValueError: Error when prime is not greater than the given value of s.
+        """
+
+        if type(s) not in [int, long]:
+            raise TypeError("invalid msg: int or long expected")
+        elif type(count) not in [int, long]:
+            raise TypeError("invalid count: int or long expected")
+        elif type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+        elif s >= prime:
+            raise ValueError("invalid prime: value larger than s expected")
+
+        randoms = genRandNums(prime, 2 * count)
+        bList, yList = randoms[:count], randoms[count:]
+        cList = [(b * s + y) % prime for b, y in zip(bList, yList)]
+        return [cList, bList, yList]
+
+    @staticmethod
+    def deriveAuxInfo(key, seed, i, prime):
+        """Derives the auxilliary information values b and y of the share i 
+        from the seed of the share, with HMAC-SHA512 keyed by the shared key 
+        as a PRF. Each value is taken from 128 more bits than the prime, so 
+        that it is close to uniform modulo prime.
+
+        Unlike the values of generateAuxInfo, the derived values are only 
+        pseudorandom: the verification is computationally secure as long as 
+        the key is kept from the nodes, instead of information theoretically 
+        secure.
+
+        Args:
+            key: A base64 format string key shared by the sender and receiver.
+            seed: A base64 format string seed of the share.
+            i: An integer index of the share.
+            prime: A integer value specifying the prime field for modulo operations.
+
+        Returns:
+            A list consisting of the integer values [b, y].
+
+        Raises:
+            TypeError: Error when either key or seed is not a string, or when 
+                either i or prime is not an integer.
+        """
+
+        if type(key) != str:
+            raise TypeError("invalid key: str expected")
+        elif type(seed) != str:
+            raise TypeError("invalid seed: str expected")
+        elif type(i) not in [int, long]:
+            raise TypeError("invalid i: int or long expected")
+        elif type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+
+        hexCount = (len(bin(prime)) - 2 + 128 + 3) // 4
+        seedHmac = hmac.new(message.base64ToStr(key), seed, hashlib.sha512)
+        values = []
+
+        for label in ["b", "y"]:
+            digest = ""
+            counter = 0
+            while len(digest) < hexCount:
+                labelHmac = seedHmac.copy()
+                labelHmac.update(":%d:%s:%d" % (i, label, counter))
+                digest += labelHmac.hexdigest()
+                counter += 1
+            values.append(int(digest[:hexCount], 16) % prime)
+
+        return values
+
+    @staticmethod
+    def generateSeededAuxInfo(s, key, i, prime):
+        """Generates seeded auxilliary information for a msg integer s of the 
+        share i. A random seed of SEED_BYTES bytes is drawn, the values b and y 
+        are derived from it by deriveAuxInfo, and only the seed and the value 
+        c = b*s + y have to be sent, so that the share has a constant size 
+        regardless of the number of nodes.
+
+        Args:
+            s: A integer message for which the auxilliary information is to be 
+                generated.
+            key: A base64 format string key shared by the sender and receiver.
+            i: An integer index of the share.
+            prime: A integer value specifying the prime field for modulo operations.
+
+        Returns:
+            A list consisting of the base64 format seed and the integer value c.
+
+        Raises:
+            TypeError: Error when s is not an integer, or when the arguments of 
+                deriveAuxInfo are invalid.
+            ValueError: Error when prime is not greater than the given value of s.
+        """
+
+        if type(s) not in [int, long]:
+            raise TypeError("invalid msg: int or long expected")
+        elif type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+        elif s >= prime:
+            raise ValueError("invalid prime: value larger than s expected")
+
+        seed = base64.b64encode(os.urandom(SEED_BYTES))
+        b, y = secretSharing.deriveAuxInfo(key, seed, i, prime)
+        return [seed, (b * s + y) % prime]
+
+    @staticmethod
+    def generateShareDigest(share, salt):
+        """Generates the SHA-256 hex digest of the share [x, y] salted with 
+        the given salt, where y is an integer or a list of integer blocks. The 
+        salt keeps the digest of a share from being matched against guessed 
+        share values by the nodes that hold the digest. The share values are 
+        hashed as comma separated decimal text, which does not depend on 
+        whether they are int or long values.
+
+        Args:
+            share: A share of the form [x, y].
+            salt: A base64 format string salt of the share.
+
+        Returns:
+            A hex string digest of the share.
+
+        Raises:
+            TypeError: Error when share is not a list of 2 values, or when salt 
+                is not a string.
+        """
+
+        if type(share) != list or len(share) != 2:
+            raise TypeError("invalid share: [x, y] list expected")
+        elif type(salt) != str:
+            raise TypeError("invalid salt: str expected")
+
+        values = [share[0]] + (share[1] if type(share[1]) == list else [share[1]])
+        for value in values:
+            if type(value) not in [int, long]:
+                raise TypeError("invalid share: int or long values expected")
+
+        return hashlib.sha256(salt + ":" + ",".join("%d" % value for value in values)).hexdigest()
+
+    @staticmethod
+    def generateHashCommitments(shares):
+        """Generates a random salt of SEED_BYTES bytes for each share in 
+        shares, and the vector of the salted digests of all the shares, which 
+        is sent along with every share for hash commitment verification.
+
+        Args:
+            shares: A list of shares of the form [x, y].
+
+        Returns:
+            A list consisting of the list of base64 format salts and the list 
+                of hex string digests, one for each share in shares.
+
+        Raises:
+            TypeError: Error when shares is not a list of valid shares.
+        """
+
+        if type(shares) != list:
+            raise TypeError("invalid shares: list expected")
+
+        salts = [base64.b64encode(os.urandom(SEED_BYTES)) for share in shares]
+        digests = [secretSharing.generateShareDigest(share, salt) \
+            for share, salt in zip(shares, salts)]
+        return [salts, digests]
+
     @staticmethod
     def verifyAuxInfo(s, y, b, c, prime):
         """Verifies the given values of s, y, b and c for the equation c = bs + y 
@@ -412,6 +1158,125 @@ class secretSharing:
             raise TypeError("invalid prime: int or long expected")
         elif prime <= max(s, y, b, c):
             raise ValueError("invalid prime: value larger than s, y, b, c expected")
-        return c == (s * b + y) % prime
+        field = getField(prime)
+        return c == field.add(field.mul(s, b), y)
+
+    @staticmethod
+    def verifyAuxInfoBatch(sList, yList, bList, cList, prime):
+        """Verifies the equations c[m] = b[m]*s[m] + y[m] of many secrets 
+        at once, by checking the single random linear combination
+            r[0]*(c[0] - b[0]*s[0] - y[0]) + ... = 0  (mod prime)
+        with random coefficients r[m] of 8 * BATCH_COEFF_BYTES bits, which are 
+        unpacked from a single os.urandom call. The sum is reduced modulo 
+        prime only once. If any equation is wrong, the check passes with 
+        probability at most about max(2^-64, 1/prime). Only when the check 
+        fails, or when a value is not smaller than prime, every equation is 
+        verified by verifyAuxInfo to find the wrong ones.
+
+        Args:
+            sList: A list of integer s values, one for each secret.
+            yList: A list of integer y values, one for each secret.
+            bList: A list of integer b values, one for each secret.
+            cList: A list of integer c values, one for each secret.
+            prime: An integer value to be used as the order of modulo operations.
+
+        Returns:
+            A list of booleans, one for each secret, True if the corresponding 
+            equation holds and False otherwise.
+
+        Raises:
+            TypeError: Error when any of sList, yList, bList or cList is not a 
+                list of integers, or when prime is not an integer.
+            ValueError: Error when the lists are of different lengths.
+        """
+
+        if type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+
+        inRange = True
+        for values in [sList, yList, bList, cList]:
+            if type(values) != list:
+                raise TypeError("invalid values: list expected")
+            elif len(values) != len(sList):
+                raise ValueError("invalid values: lists of equal length expected")
+            elif not set(map(type, values)) <= set([int, long]):
+                raise TypeError("invalid values: list of int or long expected")
+            elif len(values) > 0 and (min(values) < 0 or max(values) >= prime):
+                inRange = False
+
+        count = len(sList)
+        if inRange:
+            coefficients = struct.unpack(">%dQ" % count, os.urandom(BATCH_COEFF_BYTES * count))
+            total = 0
+            for m in range(0, count):
+                total += coefficients[m] * (cList[m] - bList[m] * sList[m] - yList[m])
+
+            if total % prime == 0:
+                return [True] * count
+
+        results = []
+        for m in range(0, count):
+            try:
+                result = secretSharing.verifyAuxInfo(sList[m], yList[m], bList[m], cList[m], prime)
+            except ValueError:
+                result = False
+            results.append(result)
+
+        return results
+
+    @staticmethod
+    def verifyCommitment(share, commitments, prime):
+        """Verifies the given share [x, y] against the Feldman commitments
+        generated by generateVerifiableShares, using the Schnorr group
+        returned by feldman.getGroup(prime).
+
+        Args:
+            share: A share of the form [x, y] where x and y are integers.
+            commitments: A list of integer commitments.
+            prime: An integer value to be used as the order of modulo operations.
+
+        Returns:
+            A boolean corresponding to the verification. True if the share is
+            consistent with the commitments, and False otherwise.
+
+        Raises:
+            TypeError: Error when share is not a list of 2 integers, when
+                commitments is not a list, or when prime is not an integer.
+        """
+
+        if type(share) != list or len(share) != 2:
+            raise TypeError("invalid share: [x, y] list expected")
+        elif type(share[0]) not in [int, long] or type(share[1]) not in [int, long]:
+            raise TypeError("invalid share: int or long x and y expected")
+        elif type(commitments) != list:
+            raise TypeError("invalid commitments: list expected")
+        elif type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+
+        return getGroup(prime).verifyShare(share[0], share[1], commitments)
+
+    @staticmethod
+    def verifyShareDigest(share, salt, digest):
+        """Verifies the given share [x, y] against its salted digest 
+        generated by generateShareDigest.
+
+        Args:
+            share: A share of the form [x, y].
+            salt: A base64 format string salt of the share.
+            digest: A hex string digest to be verified.
+
+        Returns:
+            A boolean corresponding to the verification. True if digest is the 
+            digest of the share with the salt, and False otherwise.
+
+        Raises:
+            TypeError: Error when share is not a list of 2 values, or when either 
+                salt or digest is not a string.
+        """
+
+        if type(digest) != str:
+            raise TypeError("invalid digest: str expected")
+
+        return hmac.compare_digest(secretSharing.generateShareDigest(share, salt), digest)
 
-##################### End of Code ###########################
\ No newline at end of file
+##################### End of Code ###########################
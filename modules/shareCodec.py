@@ -0,0 +1,357 @@
+#!/usr/bin/python
+
+#############################################################
+# CSE 539 (Applied Cryptography) Fall 2015 - Project        #
+# Team: Saurabh Gupta, Omkar Kaptan                         #
+# Instructor: Dr. Rida Bazzi                                #
+#############################################################
+
+"""Provides a binary wire codec for the shares sent from the sender
+to the intermediate nodes and from the nodes to the receiver.
+
+An encoded share starts with a 2 byte header holding WIRE_VERSION and
+the verification mode, followed by the encoded share list. The values
+of the list are encoded with a 1 byte type code as follows:
+    'I' - non-negative integer: 2 byte length and big-endian bytes
+    'N' - negative integer: 2 byte length and big-endian bytes of
+          its absolute value
+    'S' - string: 4 byte length and raw bytes
+    'L' - list: 4 byte count and the encoded items
+All lengths are unsigned big-endian values. In MAC verification mode,
+the share list is [msg, tag], and the base64 tag is sent as its raw
+MAC_TAG_BYTES bytes after the encoded msg. The shares nest lists at
+most MAX_DEPTH levels deep, counting the share list itself.
+
+Integers take about 2.4 times fewer bytes than as decimal text, and
+the shares are decoded without parsing Python expressions. Decoding
+checks the header and every length, and raises ValueError for
+malformed data. The shares are decoded from strings or directly from
+the memoryviews returned by mysocket.recv. The buffer is not copied as
+a whole; only the bytes of each value are copied when the value is
+converted into an integer or a string.
+
+Class shareCodec
+~~~~~~~~~~~~~~~~
+    Static Methods:
+        encodeHex(value)
+        encodeValue(value)
+        decodeAt(data, offset, depth)
+        decodeValue(data, offset, end)
+        encodeShare(shareList, mode)
+        decodeShare(data, mode)
+        shareToStr(data)
+"""
+
+#################### Import modules #########################
+import base64
+import binascii
+import struct
+from util import message
+from secretSharing import MAC_VERIFICATION
+
+#################### Module Metadata ########################
+__author__ = "Saurabh Gupta, Omkar Kaptan"
+__email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
+__license__ = "GPL"
+__version__ = "1.0"
+
+############## Global Variables for Wire Format #############
+WIRE_VERSION = 1
+MAC_TAG_BYTES = 32
+MAX_DEPTH = 3
+
+HEADER = struct.Struct(">BB")
+INT_LENGTH = struct.Struct(">H")
+SEQ_LENGTH = struct.Struct(">I")
+
+SMALL_INTS = ["490000"] + ["490001%02x" % value for value in range(1, 256)]
+
+#############################################################
+#                    Class: shareCodec                      #
+#############################################################
+
+class shareCodec:
+    """A class for encoding the shares into binary strings and decoding
+    them back into lists.
+    """
+
+    @staticmethod
+    def encodeHex(value):
+        """Encodes an integer, a string or a list of such values into the hex
+        string of its binary encoding. The items of a list are encoded in a
+        single pass, with the encodings of the integers below 256 taken from
+        SMALL_INTS.
+
+        Args:
+            value: An integer, a string or a list to be encoded.
+
+        Returns:
+            A hex string of the binary encoding of the value.
+
+        Raises:
+            TypeError: Error when value or any of its items is not an integer,
+                a string or a list.
+            ValueError: Error when an integer is longer than 65535 bytes.
+        """
+
+        valueType = type(value)
+        if valueType != list:
+            value = [value]
+
+        parts = []
+        append = parts.append
+        for item in value:
+            itemType = type(item)
+            if itemType == int and 0 <= item < 256:
+                append(SMALL_INTS[item])
+            elif itemType == list:
+                append(shareCodec.encodeHex(item))
+            elif itemType in [int, long]:
+                code = "49"
+                if item < 0:
+                    code, item = "4e", -item
+                hexValue = "%x" % item if item != 0 else ""
+                if len(hexValue) % 2 == 1:
+                    hexValue = "0" + hexValue
+                if len(hexValue) > 0x1fffe:
+                    raise ValueError("invalid value: integer of 65535 bytes or less expected")
+                append("%s%04x%s" % (code, len(hexValue) // 2, hexValue))
+            elif itemType == str:
+                append("53%08x%s" % (len(item), binascii.hexlify(item)))
+            else:
+                raise TypeError("invalid value: int, long, str or list expected")
+
+        if valueType != list:
+            return parts[0]
+
+        return "4c%08x%s" % (len(value), "".join(parts))
+
+    @staticmethod
+    def encodeValue(value):
+        """Encodes an integer, a string or a list of such values into a
+        binary string.
+
+        Args:
+            value: An integer, a string or a list to be encoded.
+
+        Returns:
+            A binary string encoding the value.
+
+        Raises:
+            TypeError: Error when value or any of its items is not an integer,
+                a string or a list.
+            ValueError: Error when an integer is longer than 65535 bytes.
+        """
+
+        return binascii.unhexlify(shareCodec.encodeHex(value))
+
+    @staticmethod
+    def decodeAt(data, offset, depth=1):
+        """Decodes the value encoded in data at the given offset. Each integer
+        is parsed from the hex string of its own slice of data, and the
+        integers of a list are decoded in a single pass.
+
+        Args:
+            data: A binary string or memoryview holding an encoded value.
+            offset: An integer offset of the encoded value.
+            depth: An integer nesting depth of a list at the offset. Default 
+                value = 1.
+
+        Returns:
+            A list of the decoded value and the integer offset following it.
+
+        Raises:
+            IndexError, struct.error: Error when data is truncated.
+            ValueError: Error when data does not hold a valid encoded value, or 
+                when its lists nest deeper than MAX_DEPTH.
+        """
+
+        size = len(data)
+        code = data[offset]
+
+        if code == "L":
+            if depth > MAX_DEPTH:
+                raise ValueError("invalid data: lists nested at most %d deep expected" % MAX_DEPTH)
+            count = SEQ_LENGTH.unpack_from(data, offset + 1)[0]
+            offset += 5
+            if count > size - offset:
+                raise ValueError("invalid data: list count out of range")
+
+            items = []
+            append = items.append
+            for index in xrange(count):
+                if data[offset] == "I":
+                    length = INT_LENGTH.unpack_from(data, offset + 1)[0]
+                    offset += 3 + length
+                    if offset > size:
+                        raise ValueError("invalid data: truncated integer")
+                    elif length == 1:
+                        append(ord(data[offset - 1]))
+                    else:
+                        append(int(binascii.hexlify(data[offset - length:offset]) or "0", 16))
+                else:
+                    value, offset = shareCodec.decodeAt(data, offset, depth + 1)
+                    append(value)
+            return [items, offset]
+        elif code == "I" or code == "N":
+            length = INT_LENGTH.unpack_from(data, offset + 1)[0]
+            offset += 3 + length
+            if offset > size:
+                raise ValueError("invalid data: truncated integer")
+            value = int(binascii.hexlify(data[offset - length:offset]) or "0", 16)
+            return [value if code == "I" else -value, offset]
+        elif code == "S":
+            length = SEQ_LENGTH.unpack_from(data, offset + 1)[0]
+            offset += 5 + length
+            if offset > size:
+                raise ValueError("invalid data: truncated string")
+            value = data[offset - length:offset]
+            return [value if type(value) == str else value.tobytes(), offset]
+
+        raise ValueError("invalid data: unknown type code")
+
+    @staticmethod
+    def decodeValue(data, offset=0, end=None):
+        """Decodes the value encoded by encodeValue in data from the given
+        offset. When end is given, the value is decoded as the whole of
+        data[offset:end]; otherwise a list [value, offset] is returned with
+        the offset following the value.
+
+        Args:
+            data: A binary string or memoryview holding an encoded value.
+            offset: An integer offset of the encoded value. Default value = 0.
+            end: An integer offset at which the encoded value must end.
+                Default value = None, for returning the following offset.
+
+        Returns:
+            The decoded value when end is given, and otherwise a list of the
+                decoded value and the integer offset following it.
+
+        Raises:
+            TypeError: Error when data is not a string or memoryview.
+            ValueError: Error when data does not hold a valid encoded value,
+                or when the value does not end at end.
+        """
+
+        if type(data) not in [str, memoryview]:
+            raise TypeError("invalid data: str or memoryview expected")
+
+        try:
+            value, offset = shareCodec.decodeAt(data, offset)
+        except (IndexError, struct.error):
+            raise ValueError("invalid data: truncated value")
+
+        if end == None:
+            return [value, offset]
+        elif offset != end:
+            raise ValueError("invalid data: unexpected trailing bytes")
+
+        return value
+
+    @staticmethod
+    def encodeShare(shareList, mode):
+        """Encodes the share list of the given verification mode into a
+        binary string with the WIRE_VERSION and mode header.
+
+        Args:
+            shareList: A list share of the given mode.
+            mode: An integer value representing the verification mode.
+
+        Returns:
+            A binary string encoding the share.
+
+        Raises:
+            TypeError: Error when shareList is not a list, when mode is not an
+                integer, or when the values of shareList can not be encoded.
+            ValueError: Error when mode is out of the range [0-255], or when the
+                MAC tag does not decode to MAC_TAG_BYTES bytes.
+        """
+
+        if type(shareList) != list:
+            raise TypeError("invalid shareList: list expected")
+        elif type(mode) not in [int, long]:
+            raise TypeError("invalid mode: int or long expected")
+        elif mode < 0 or mode > 0xff:
+            raise ValueError("invalid mode: value in range [0-255] expected")
+
+        header = HEADER.pack(WIRE_VERSION, mode)
+        if mode != MAC_VERIFICATION:
+            return header + shareCodec.encodeValue(shareList)
+
+        if len(shareList) != 2 or type(shareList[1]) != str:
+            raise TypeError("invalid shareList: [msg, tag] list expected")
+
+        tag = message.base64ToStr(shareList[1])
+        if len(tag) != MAC_TAG_BYTES:
+            raise ValueError("invalid tag: %d bytes expected" % MAC_TAG_BYTES)
+
+        return header + shareCodec.encodeValue(shareList[0]) + tag
+
+    @staticmethod
+    def decodeShare(data, mode=None):
+        """Decodes the binary string share encoded by encodeShare into the
+        share list.
+
+        Args:
+            data: A binary string or memoryview share.
+            mode: An integer value representing the expected verification
+                mode. Default value = None, for any mode.
+
+        Returns:
+            The decoded list share.
+
+        Raises:
+            TypeError: Error when data is not a string or memoryview.
+            ValueError: Error when data is not a valid share of the WIRE_VERSION
+                format and the given mode.
+        """
+
+        if type(data) not in [str, memoryview]:
+            raise TypeError("invalid data: str or memoryview expected")
+        elif len(data) < HEADER.size:
+            raise ValueError("invalid data: header expected")
+
+        version, dataMode = HEADER.unpack_from(data)
+        if version != WIRE_VERSION:
+            raise ValueError("invalid data: wire version %d expected" % WIRE_VERSION)
+        elif mode != None and dataMode != mode:
+            raise ValueError("invalid data: mode %d expected" % mode)
+
+        if dataMode != MAC_VERIFICATION:
+            shareList = shareCodec.decodeValue(data, HEADER.size, len(data))
+            if type(shareList) != list:
+                raise ValueError("invalid data: list share expected")
+            return shareList
+
+        tagOffset = len(data) - MAC_TAG_BYTES
+        if tagOffset <= HEADER.size:
+            raise ValueError("invalid data: MAC tag expected")
+
+        msg = shareCodec.decodeValue(data, HEADER.size, tagOffset)
+        tag = data[tagOffset:]
+        return [msg, base64.b64encode(tag if type(tag) == str else tag.tobytes())]
+
+    @staticmethod
+    def shareToStr(data):
+        """Converts the binary string share into the string of its decoded
+        list for display, where the msg of a MAC verification mode share is
+        decoded as well. Data that can not be decoded is shown as a string
+        literal.
+
+        Args:
+            data: A binary string or memoryview share.
+
+        Returns:
+            A string showing the share.
+        """
+
+        try:
+            shareList = shareCodec.decodeShare(data)
+            if HEADER.unpack_from(data)[1] == MAC_VERIFICATION:
+                msg = shareList[0]
+                shareList[0] = shareCodec.decodeValue(msg, 0, len(msg))
+            return message.listToStr(shareList)
+        except (TypeError, ValueError):
+            return repr(data if type(data) != memoryview else data.tobytes())
+
+##################### End of Code ###########################
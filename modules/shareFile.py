@@ -0,0 +1,389 @@
+#!/usr/bin/python
+
+#############################################################
+# CSE 539 (Applied Cryptography) Fall 2015 - Project        #
+# Team: Saurabh Gupta, Omkar Kaptan                         #
+# Instructor: Dr. Rida Bazzi                                #
+#############################################################
+
+"""Provides a binary share file module for storing the shares of many
+secrets held by one node, at one x-coordinate, in a single file.
+
+A share file starts with a fixed size header, followed by one record
+per secret, followed by an offset index. Every record holds the blocks
+of the share value y as big-endian unsigned integers of blockSize bytes,
+followed by the raw tag of tagSize bytes in MAC_VERIFICATION mode. The
+index holds count + 1 big-endian 8-byte offsets, such that record i
+spans the bytes offset[i] to offset[i+1] of the file.
+
+Header layout (big-endian, HEADER_SIZE bytes):
+    magic (4s), version (B), primeId (B), mode (B), flags (B),
+    n (H), k (H), x (H), reserved (H), blockSize (I), tagSize (I),
+    count (Q), indexOffset (Q)
+
+The prime is stored as its position in the list of util.generatePrimes.
+Files are written one record at a time by writeShareFile, and read by
+the shareFile class, which maps the file into memory with mmap and only
+decodes the records that are accessed, so a single secret can be located
+and reconstructed without reading the rest of the file.
+
+Global Variables
+~~~~~~~~~~~~~~~~
+    SHARE_FILE_MAGIC - the magic string of share files
+    SHARE_FILE_VERSION - the format version written by writeShareFile
+    HEADER_FORMAT - the struct format of the header
+    HEADER_SIZE - the size of the header in bytes
+    TAG_SIZE - the size of a raw HMAC-SHA256 tag in bytes
+    CHUNKED_FLAG - the header flag for chunked share values
+
+Global Methods
+~~~~~~~~~~~~~~
+    getPrimeId(prime)
+    getPrime(primeId)
+    writeShareFile(path, x, n, k, prime, values, mode, tags, chunked)
+    reconstructFromFiles(shareFiles, index)
+
+Class shareFile
+~~~~~~~~~~~~~~~
+    Attributes:
+        path, x, n, k, prime, mode, chunked, blockSize, tagSize, count
+    Constructor:
+        __init__(self, path)
+    Methods:
+        close(self)
+        getOffsets(self, index)
+        getBlockCount(self, index)
+        getBlock(self, index, blockIndex)
+        getValue(self, index)
+        getShare(self, index)
+        getTag(self, index)
+"""
+
+#################### Import modules #########################
+import mmap
+import struct
+import binascii
+from array import array
+from util import generatePrimes, message
+from secretSharing import secretSharing, NO_VERIFICATION, MAC_VERIFICATION
+
+#################### Module Metadata ########################
+__author__ = "Saurabh Gupta, Omkar Kaptan"
+__email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
+__license__ = "GPL"
+__version__ = "1.0"
+
+############ Global Variables for Share Files ###############
+SHARE_FILE_MAGIC = "SSF\x00"
+SHARE_FILE_VERSION = 1
+HEADER_FORMAT = ">4sBBBBHHHHIIQQ"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+TAG_SIZE = 32
+CHUNKED_FLAG = 0x01
+
+#################### Method Definitions #####################
+
+def getPrimeId(prime):
+    """Returns the id of the given prime, i.e. its position in the list
+    returned by util.generatePrimes.
+
+    Args:
+        prime: An integer prime value.
+
+    Returns:
+        An integer id of the prime.
+
+    Raises:
+        ValueError: Error when prime is not in the list of util.generatePrimes.
+    """
+
+    primes = generatePrimes()
+    if prime not in primes:
+        raise ValueError("invalid prime: prime from util.generatePrimes expected")
+
+    return primes.index(prime)
+
+def getPrime(primeId):
+    """Returns the prime with the given id, as returned by getPrimeId.
+
+    Args:
+        primeId: An integer id of the prime.
+
+    Returns:
+        An integer prime value.
+
+    Raises:
+        ValueError: Error when primeId is not a valid id.
+    """
+
+    primes = generatePrimes()
+    if primeId < 0 or primeId >= len(primes):
+        raise ValueError("invalid primeId: id of a prime from util.generatePrimes expected")
+
+    return primes[primeId]
+
+def writeShareFile(path, x, n, k, prime, values, mode=NO_VERIFICATION, \
+    tags=None, chunked=False):
+    """Writes the shares of many secrets at the x-coordinate x to a share file
+    at path. The records are written one at a time, so values and tags may be
+    generators.
+
+    Args:
+        path: A string path of the share file.
+        x: An integer x-coordinate of the shares.
+        n: An integer value representing the number of shares per secret.
+        k: An integer value representing the number of shares that are
+            required for reconstructing a secret.
+        prime: An integer prime from util.generatePrimes used for sharing.
+        values: An iterable of share values y, each an integer smaller than
+            prime, or a list of such integers if chunked is True.
+        mode: An integer value representing the verification mode, either
+            NO_VERIFICATION or MAC_VERIFICATION. Default value is
+            NO_VERIFICATION.
+        tags: An iterable of base64 MAC tags returned by
+            secretSharing.generateMac, one per value, in MAC_VERIFICATION
+            mode. Default value is None.
+        chunked: A boolean value, True if the values are lists of blocks
+            returned by secretSharing.generateChunkedShares. Default value
+            is False.
+
+    Returns:
+        An integer value of the number of records written.
+
+    Raises:
+        TypeError: Error when either x, n or k is not an integer.
+        ValueError: Error when the prime is unknown, when the mode is not
+            supported, when the tags are missing in MAC_VERIFICATION mode,
+            or when a value is not a valid share value.
+    """
+
+    if type(x) not in [int, long]:
+        raise TypeError("invalid x: int or long expected")
+    elif type(n) not in [int, long]:
+        raise TypeError("invalid n: int or long expected")
+    elif type(k) not in [int, long]:
+        raise TypeError("invalid k: int or long expected")
+    elif x < 1 or x > n or n > 0xffff or k < 2 or k > n:
+        raise ValueError("invalid x, n or k: 1 <= x <= n < 65536 and 2 <= k <= n expected")
+    elif mode not in [NO_VERIFICATION, MAC_VERIFICATION]:
+        raise ValueError("invalid mode: NO_VERIFICATION or MAC_VERIFICATION expected")
+    elif mode == MAC_VERIFICATION and tags == None:
+        raise ValueError("invalid tags: MAC tags expected in MAC_VERIFICATION mode")
+
+    primeId = getPrimeId(prime)
+    blockSize = (len(bin(prime)) - 2 + 7) // 8
+    tagSize = TAG_SIZE if mode == MAC_VERIFICATION else 0
+    flags = CHUNKED_FLAG if chunked else 0
+    hexSize = 2 * blockSize
+
+    if tags != None:
+        tags = iter(tags)
+
+    offsets = array('L')
+    offset = HEADER_SIZE
+
+    fp = open(path, "wb")
+    try:
+        fp.write('\x00' * HEADER_SIZE)
+
+        for value in values:
+            blocks = value if chunked else [value]
+            if type(blocks) != list or len(blocks) == 0:
+                raise ValueError("invalid values: int or list of int values expected")
+
+            record = []
+            for block in blocks:
+                if type(block) not in [int, long] or block < 0 or block >= prime:
+                    raise ValueError("invalid values: values in [0, prime) expected")
+                record.append(binascii.unhexlify('%0*x' % (hexSize, block)))
+
+            if tagSize > 0:
+                tag = message.base64ToStr(next(tags))
+                if len(tag) != tagSize:
+                    raise ValueError("invalid tags: %d byte MAC tags expected" % tagSize)
+                record.append(tag)
+
+            record = ''.join(record)
+            fp.write(record)
+            offsets.append(offset)
+            offset += len(record)
+
+        offsets.append(offset)
+        count = len(offsets) - 1
+        for start in range(0, len(offsets), 65536):
+            chunk = offsets[start:start + 65536]
+            fp.write(struct.pack(">%dQ" % len(chunk), *chunk))
+
+        fp.seek(0)
+        fp.write(struct.pack(HEADER_FORMAT, SHARE_FILE_MAGIC, SHARE_FILE_VERSION, \
+            primeId, mode, flags, n, k, x, 0, blockSize, tagSize, count, offset))
+    finally:
+        fp.close()
+
+    return count
+
+def reconstructFromFiles(shareFiles, index):
+    """Reconstructs the secret with the given index from k or more share files
+    of the same secrets at different x-coordinates. Only the records of the
+    secret are read from the files.
+
+    Args:
+        shareFiles: A list of shareFile objects.
+        index: An integer index of the secret in the share files.
+
+    Returns:
+        The integer secret, or the string secret if the share files hold
+        chunked shares.
+
+    Raises:
+        TypeError: Error when shareFiles is not a list.
+        ValueError: Error when the share files do not belong to the same
+            secrets, or when fewer than k share files are given.
+    """
+
+    if type(shareFiles) != list:
+        raise TypeError("invalid shareFiles: list expected")
+    elif len(shareFiles) == 0:
+        raise ValueError("insufficient number of shares: expected k or more")
+
+    first = shareFiles[0]
+    for other in shareFiles:
+        if [other.prime, other.n, other.k, other.chunked, other.count] != \
+            [first.prime, first.n, first.k, first.chunked, first.count]:
+            raise ValueError("invalid shareFiles: share files of the same secrets expected")
+
+    shares = [other.getShare(index) for other in shareFiles[:first.k]]
+    if first.chunked:
+        return secretSharing.reconstructChunkedSecret(shares, first.k, first.prime)
+    return secretSharing.reconstructSecret(shares, first.k, first.prime)
+
+#############################################################
+#                    Class: shareFile                       #
+#############################################################
+
+class shareFile:
+    """A class for reading a share file written by writeShareFile through a
+    read-only memory map.
+
+    Attributes:
+        path: A string path of the share file.
+        x: An integer x-coordinate of the shares.
+        n: An integer value representing the number of shares per secret.
+        k: An integer value representing the number of shares that are
+            required for reconstructing a secret.
+        prime: An integer prime used for sharing.
+        mode: An integer value representing the verification mode.
+        chunked: A boolean value, True if the share values are lists of blocks.
+        blockSize: An integer value of the size of a block in bytes.
+        tagSize: An integer value of the size of a tag in bytes.
+        count: An integer value of the number of records.
+    """
+
+    def __init__(self, path):
+        """Opens and maps the share file at path, and reads its header.
+
+        Args:
+            path: A string path of the share file.
+
+        Raises:
+            ValueError: Error when the file is not a valid share file.
+        """
+
+        self.path = path
+        fp = open(path, "rb")
+        try:
+            header = fp.read(HEADER_SIZE)
+            if len(header) != HEADER_SIZE:
+                raise ValueError("invalid share file: header expected")
+            self.map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            fp.close()
+
+        magic, version, primeId, self.mode, flags, self.n, self.k, self.x, \
+            reserved, self.blockSize, self.tagSize, self.count, self.indexOffset = \
+            struct.unpack(HEADER_FORMAT, header)
+
+        if magic != SHARE_FILE_MAGIC or version != SHARE_FILE_VERSION:
+            self.close()
+            raise ValueError("invalid share file: version %d share file expected" \
+                % SHARE_FILE_VERSION)
+        elif self.indexOffset + 8 * (self.count + 1) > len(self.map):
+            self.close()
+            raise ValueError("invalid share file: complete offset index expected")
+
+        self.prime = getPrime(primeId)
+        self.chunked = (flags & CHUNKED_FLAG) != 0
+
+    def __len__(self):
+        """Returns the number of records in the share file."""
+        return self.count
+
+    def close(self):
+        """Closes the memory map of the share file."""
+        self.map.close()
+
+    def getOffsets(self, index):
+        """Returns the start and end offsets of the record with the given
+        index, read from the offset index.
+
+        Raises:
+            IndexError: Error when index is out of range.
+        """
+
+        if index < 0 or index >= self.count:
+            raise IndexError("invalid index: value in [0, count) expected")
+
+        position = self.indexOffset + 8 * index
+        return struct.unpack(">QQ", self.map[position:position + 16])
+
+    def getBlockCount(self, index):
+        """Returns the number of blocks in the record with the given index."""
+
+        start, end = self.getOffsets(index)
+        return (end - start - self.tagSize) // self.blockSize
+
+    def getBlock(self, index, blockIndex):
+        """Returns the integer block blockIndex of the share value of the
+        record with the given index.
+
+        Raises:
+            IndexError: Error when either index or blockIndex is out of range.
+        """
+
+        start, end = self.getOffsets(index)
+        if blockIndex < 0 or blockIndex >= (end - start - self.tagSize) // self.blockSize:
+            raise IndexError("invalid blockIndex: value in [0, block count) expected")
+
+        start += blockIndex * self.blockSize
+        return int(binascii.hexlify(self.map[start:start + self.blockSize]), 16)
+
+    def getValue(self, index):
+        """Returns the share value y of the record with the given index, an
+        integer, or a list of integer blocks if the share file is chunked.
+        """
+
+        start, end = self.getOffsets(index)
+        data = binascii.hexlify(self.map[start:end - self.tagSize])
+        hexSize = 2 * self.blockSize
+
+        blocks = [int(data[i:i + hexSize], 16) for i in range(0, len(data), hexSize)]
+        if self.chunked:
+            return blocks
+        return blocks[0]
+
+    def getShare(self, index):
+        """Returns the share [x, y] of the record with the given index."""
+        return [self.x, self.getValue(index)]
+
+    def getTag(self, index):
+        """Returns the base64 MAC tag of the record with the given index, or
+        None if the share file holds no tags.
+        """
+
+        if self.tagSize == 0:
+            return None
+
+        start, end = self.getOffsets(index)
+        return message.strToBase64(self.map[end - self.tagSize:end])
+
+##################### End of Code ###########################
@@ -12,6 +12,7 @@ Global Methods
 ~~~~~~~~~~~~~~
     generatekey(length)
     genRandNum(maximum)
+    genRandNums(maximum, count)
     generatePrimes()
     getLargePrime(num)
     secureFail()
@@ -26,6 +27,8 @@ Class message
         strToBase64(msg)
         base64ToStr(b64Msg)
         numToBase64(msgNum)
+        strToBlocks(msg, blockSize)
+        blocksToStr(blocks)
 """
 
 #################### Import modules #########################
@@ -109,6 +112,48 @@ def genRandNum(maximum=2):
 
     return num
 
+def genRandNums(maximum=2, count=1):
+    """Generates a list of count cryptographically secure random numbers 
+    less than the given maximum value, using a single os.urandom call for 
+    each batch instead of one call per number. Each number is drawn from 
+    as many random bits as the bit length of maximum, and is redrawn in the 
+    next batch if it is not less than maximum. The method enforces the 
+    maximum value to be at least 2.
+
+    Args:
+        maximum: An integer defining the value corresponding to which 
+            the generated numbers should be smaller. Default value = 2
+        count: An integer value specifying the number of random numbers.
+            Default value = 1
+
+    Returns:
+        A list of count randomly generated integers less than maximum.
+
+    Raises:
+        TypeError: Error when either maximum or count is not an int or long.
+    """
+
+    if type(maximum) not in [int, long]:
+        raise TypeError("invalid maximum: int or long expected")
+    elif type(count) not in [int, long]:
+        raise TypeError("invalid count: int or long expected")
+    elif maximum < 2:
+        maximum = 2
+
+    bits = len(bin(maximum - 1)) - 2
+    length = (bits + 7) // 8
+    shift = 8 * length - bits
+    nums = []
+
+    while len(nums) < count:
+        hexData = binascii.hexlify(os.urandom(length * (count - len(nums))))
+        for i in range(0, len(hexData), 2 * length):
+            num = int(hexData[i:i + 2 * length], 16) >> shift
+            if num < maximum:
+                nums.append(num)
+
+    return nums
+
 def generatePrimes():
     """Generates set of prime numbers using Mersenne Primes and 
     known large primes (https://primes.utm.edu/lists/2small/).
@@ -267,6 +312,73 @@ class message:
 
         return message.strToBase64(bytes(msgNum))
 
+    @staticmethod
+    def strToBlocks(msg, blockSize):
+        """Splits a string message into blocks of blockSize characters and 
+        converts each block to an integer. Each block is prefixed with a 
+        '\x01' byte before the conversion, so that leading zero bytes and 
+        the length of the last block are preserved.
+
+        Args:
+            msg: A string message to be converted.
+            blockSize: An integer value specifying the number of characters 
+                per block.
+
+        Returns:
+            A list of integers, one for each block of msg. Each integer is 
+            smaller than 256^(blockSize+1).
+
+        Raises:
+            TypeError: Error when msg is not a string, or when blockSize is 
+                not an integer.
+            ValueError: Error when blockSize is less than 1.
+        """
+
+        if type(msg) != str:
+            raise TypeError("invalid msg: str expected")
+        elif type(blockSize) not in [int, long]:
+            raise TypeError("invalid blockSize: int or long expected")
+        elif blockSize < 1:
+            raise ValueError("invalid blockSize: value greater than 0 expected")
+
+        blocks = []
+        for i in range(0, len(msg), blockSize):
+            block = '\x01' + msg[i:i+blockSize]
+            blocks.append(int(binascii.hexlify(block), 16))
+
+        return blocks
+
+    @staticmethod
+    def blocksToStr(blocks):
+        """Converts a list of integer blocks generated by strToBlocks back to 
+        the string message.
+
+        Args:
+            blocks: A list of integers generated by strToBlocks.
+
+        Returns:
+            A string corresponding to the given blocks.
+
+        Raises:
+            TypeError: Error when blocks is not a list of integers.
+            ValueError: Error when a block was not generated by strToBlocks.
+        """
+
+        if type(blocks) != list:
+            raise TypeError("invalid blocks: list expected")
+
+        chunks = []
+        for block in blocks:
+            if type(block) not in [int, long]:
+                raise TypeError("invalid blocks: list of int or long expected")
+
+            blockHex = '%x' % block
+            if len(blockHex) % 2 == 0 or blockHex[0] != '1':
+                raise ValueError("invalid blocks: block prefix not present")
+            chunks.append(binascii.unhexlify('0' + blockHex)[1:])
+
+        return ''.join(chunks)
+
     @staticmethod
     def strToList(msg):
         """Converts a string message encapsulating a list to the 
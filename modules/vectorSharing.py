@@ -0,0 +1,292 @@
+#!/usr/bin/python
+
+#############################################################
+# CSE 539 (Applied Cryptography) Fall 2015 - Project        #
+# Team: Saurabh Gupta, Omkar Kaptan                         #
+# Instructor: Dr. Rida Bazzi                                #
+#############################################################
+
+"""Provides an optional NumPy based (n, k) secret sharing module for
+splitting and reconstructing many small secrets at once over a prime
+that fits a machine word.
+
+The shares of m secrets are computed as the matrix product of the
+m x k coefficient matrix, whose first column holds the secrets, with
+the k x n Vandermonde matrix of the x-coordinates 1, ..., n. The
+secrets are interpolated back as the product of the m x k share
+matrix with the Lagrange weights of the x-coordinates. All the
+arithmetic is done on uint64 arrays: products modulo primes below
+2^32 fit a uint64 directly, and products modulo the Mersenne prime
+2^61 - 1 are split into 31-bit halves and folded.
+
+The module requires numpy. isSupported returns False when numpy is
+not installed, and the other methods raise ImportError.
+
+Global Variables
+~~~~~~~~~~~~~~~~
+    MERSENNE_61 - the Mersenne prime 2^61 - 1
+
+Class vectorSharing
+~~~~~~~~~~~~~~~~~~~
+    Static Methods:
+        isSupported(prime)
+        mulMod(a, b, prime)
+        addMod(a, b, prime)
+        randomMatrix(rows, cols, prime)
+        vandermonde(xList, k, prime)
+        generateShares(secrets, n, k, prime)
+        reconstructSecrets(xList, shares, k, prime)
+"""
+
+#################### Import modules #########################
+import os
+from secretSharing import secretSharing
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+#################### Module Metadata ########################
+__author__ = "Saurabh Gupta, Omkar Kaptan"
+__email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
+__license__ = "GPL"
+__version__ = "1.0"
+
+################ Global Variables for Primes ################
+MERSENNE_61 = 2**61 - 1
+
+#############################################################
+#                    Class: vectorSharing                   #
+#############################################################
+
+class vectorSharing:
+    """A class of static methods for vectorized secret sharing over word-size
+    primes using numpy."""
+
+    @staticmethod
+    def isSupported(prime):
+        """Returns whether numpy is available and the given prime is supported,
+        i.e. the prime is smaller than 2^32 or equal to 2^61 - 1.
+
+        Args:
+            prime: An integer value to be used as the order of modulo operations.
+
+        Returns:
+            A boolean value, True if the prime can be used by this module.
+        """
+
+        if numpy == None or type(prime) not in [int, long]:
+            return False
+
+        return (prime > 2 and prime < 2**32) or prime == MERSENNE_61
+
+    @staticmethod
+    def mulMod(a, b, prime):
+        """Returns the element-wise product of the uint64 arrays a and b modulo
+        prime. The values of a and b must be smaller than prime.
+
+        For 2^61 - 1, a and b are split into 31-bit halves, so that every
+        partial product fits a uint64, and the partial products are folded
+        using 2^61 = 1 modulo prime.
+
+        Args:
+            a: A uint64 numpy array or scalar.
+            b: A uint64 numpy array or scalar.
+            prime: An integer value supported by isSupported.
+
+        Returns:
+            A uint64 numpy array of the products modulo prime.
+        """
+
+        uint64 = numpy.uint64
+        p = uint64(prime)
+
+        if prime != MERSENNE_61:
+            return (a * b) % p
+
+        mask31, mask30 = uint64(2**31 - 1), uint64(2**30 - 1)
+        a1, a0 = a >> uint64(31), a & mask31
+        b1, b0 = b >> uint64(31), b & mask31
+
+        mid = a1 * b0 + a0 * b1
+        s = ((a1 * b1) << uint64(1)) + (mid >> uint64(30)) + \
+            ((mid & mask30) << uint64(31)) + a0 * b0
+        s = (s & p) + (s >> uint64(61))
+        return numpy.where(s >= p, s - p, s)
+
+    @staticmethod
+    def addMod(a, b, prime):
+        """Returns the element-wise sum of the uint64 arrays a and b modulo
+        prime. The values of a and b must be smaller than prime.
+        """
+
+        p = numpy.uint64(prime)
+        s = a + b
+        return numpy.where(s >= p, s - p, s)
+
+    @staticmethod
+    def randomMatrix(rows, cols, prime):
+        """Generates a rows x cols uint64 matrix of cryptographically secure
+        random values smaller than prime, by rejection sampling of masked
+        os.urandom words.
+
+        Args:
+            rows: An integer value specifying the number of rows.
+            cols: An integer value specifying the number of columns.
+            prime: An integer value supported by isSupported.
+
+        Returns:
+            A rows x cols uint64 numpy array.
+        """
+
+        p = numpy.uint64(prime)
+        mask = numpy.uint64((1 << (len(bin(prime)) - 2)) - 1)
+        count = rows * cols
+
+        values = numpy.frombuffer(os.urandom(8 * count), dtype=numpy.uint64).copy() & mask
+        rejected = numpy.nonzero(values >= p)[0]
+        while len(rejected) > 0:
+            redraw = numpy.frombuffer(os.urandom(8 * len(rejected)), dtype=numpy.uint64) & mask
+            values[rejected] = redraw
+            rejected = rejected[redraw >= p]
+
+        return values.reshape((rows, cols))
+
+    @staticmethod
+    def vandermonde(xList, k, prime):
+        """Returns the k x len(xList) Vandermonde matrix whose jth row holds
+        x^j modulo prime for each x in xList.
+
+        Args:
+            xList: A list of integer x-coordinates smaller than prime.
+            k: An integer value specifying the number of rows.
+            prime: An integer value supported by isSupported.
+
+        Returns:
+            A k x len(xList) uint64 numpy array.
+        """
+
+        x = numpy.array(xList, dtype=numpy.uint64)
+        matrix = numpy.empty((k, len(xList)), dtype=numpy.uint64)
+        matrix[0] = 1
+        for j in range(1, k):
+            matrix[j] = vectorSharing.mulMod(matrix[j-1], x, prime)
+
+        return matrix
+
+    @staticmethod
+    def generateShares(secrets, n, k, prime):
+        """Generates n shares for each of the integer secrets such that any k
+        shares of a secret can be used for reconstructing it. Each secret is
+        shared with its own random polynomial at x = 1, ..., n.
+
+        Args:
+            secrets: A list or numpy array of integer secrets smaller than prime.
+            n: An integer value representing the number of shares per secret.
+            k: An integer value representing the number of shares that are
+                required for reconstructing a secret.
+            prime: An integer value supported by isSupported.
+
+        Returns:
+            A len(secrets) x n uint64 numpy array whose (i, x-1) entry is the
+            share y of secrets[i] at x.
+
+        Raises:
+            ImportError: Error when numpy is not available.
+            TypeError: Error when either n, k or prime is not an integer.
+            ValueError: Error when n and k do not satisfy n >= k >= 2, when the
+                prime is not supported, or when a secret is not smaller than
+                prime.
+        """
+
+        if numpy == None:
+            raise ImportError("numpy is required for vectorized secret sharing")
+        elif type(n) not in [int, long]:
+            raise TypeError("invalid n: int or long expected")
+        elif type(k) not in [int, long]:
+            raise TypeError("invalid k: int or long expected")
+        elif type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+        elif n < 2 or k < 2:
+            raise ValueError("invalid n or k: value greater than or equal to 2 expected")
+        elif n < k:
+            raise ValueError("invalid k: value less than or equal to n expected")
+        elif not vectorSharing.isSupported(prime) or n >= prime:
+            raise ValueError("invalid prime: prime below 2^32 or 2^61 - 1 expected")
+
+        secrets = numpy.asarray(secrets, dtype=numpy.uint64)
+        if secrets.ndim != 1:
+            raise ValueError("invalid secrets: one dimensional list expected")
+        elif len(secrets) > 0 and secrets.max() >= numpy.uint64(prime):
+            raise ValueError("invalid secrets: values smaller than prime expected")
+
+        coefficients = vectorSharing.randomMatrix(len(secrets), k - 1, prime)
+        powers = vectorSharing.vandermonde(range(1, n+1), k, prime)
+
+        shares = numpy.tile(secrets.reshape((-1, 1)), (1, n))
+        for j in range(1, k):
+            terms = vectorSharing.mulMod(coefficients[:, j-1:j], powers[j], prime)
+            shares = vectorSharing.addMod(shares, terms, prime)
+
+        return shares
+
+    @staticmethod
+    def reconstructSecrets(xList, shares, k, prime):
+        """Reconstructs many secrets shared at the same x-coordinates. Column j
+        of shares holds the shares at xList[j], and only the first k columns
+        are used.
+
+        Args:
+            xList: A list of distinct integer x-coordinates.
+            shares: A numpy array or list of lists with len(xList) columns, one
+                row per secret.
+            k: An integer value representing the number of shares that are
+                required for reconstructing a secret.
+            prime: An integer value supported by isSupported.
+
+        Returns:
+            A uint64 numpy array of the reconstructed secrets.
+
+        Raises:
+            ImportError: Error when numpy is not available.
+            TypeError: Error when xList is not a list, or when either k or prime
+                is not an integer.
+            ValueError: Error when k < 2, when fewer than k x-coordinates are
+                given, when the shares do not match xList or are not smaller
+                than prime, or when the prime is not supported.
+        """
+
+        if numpy == None:
+            raise ImportError("numpy is required for vectorized secret sharing")
+        elif type(xList) != list:
+            raise TypeError("invalid xList: list expected")
+        elif type(k) not in [int, long]:
+            raise TypeError("invalid k: int or long expected")
+        elif type(prime) not in [int, long]:
+            raise TypeError("invalid prime: int or long expected")
+        elif k < 2:
+            raise ValueError("invalid k: value greater than 1 expected")
+        elif k > len(xList):
+            raise ValueError("insufficient number of shares: expected k or more")
+        elif not vectorSharing.isSupported(prime):
+            raise ValueError("invalid prime: prime below 2^32 or 2^61 - 1 expected")
+
+        shares = numpy.asarray(shares, dtype=numpy.uint64)
+        if shares.ndim != 2 or shares.shape[1] != len(xList):
+            raise ValueError("invalid shares: one column per x-coordinate expected")
+        elif shares.size > 0 and shares.max() >= numpy.uint64(prime):
+            raise ValueError("invalid shares: values smaller than prime expected")
+
+        xList = xList[:k]
+        weights = secretSharing.lagrangeWeights(xList, prime)
+
+        secrets = numpy.zeros(shares.shape[0], dtype=numpy.uint64)
+        for j in range(0, k):
+            weight = numpy.uint64(weights[xList[j]])
+            terms = vectorSharing.mulMod(shares[:, j], weight, prime)
+            secrets = vectorSharing.addMod(secrets, terms, prime)
+
+        return secrets
+
+##################### End of Code ###########################
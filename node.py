@@ -27,6 +27,7 @@ Class node
 		getNode(self)
 		receiveShare(self, client, buf)
 		manipulateShare(self, mode)
+		manipulateValue(self, y)
 		sendShare(self, client)
 		isShareReceived(self)
 		run(self, senderPorts, receiverPorts, buf, mode, honest)
@@ -70,9 +71,14 @@ import argparse
 from time import time
 from modules.mysocket import mysocket
 from modules.util import genRandNum, message, secureFail
+from modules.shareCodec import shareCodec
 from modules.secretSharing import NO_VERIFICATION
 from modules.secretSharing import MAC_VERIFICATION
 from modules.secretSharing import AUX_INFO_VERIFICATION
+from modules.secretSharing import FELDMAN_VERIFICATION
+from modules.secretSharing import POLY_MAC_VERIFICATION
+from modules.secretSharing import SEEDED_AUX_INFO_VERIFICATION
+from modules.secretSharing import HASH_VERIFICATION
 
 #################### Module Metadata ########################
 __author__ = "Saurabh Gupta, Omkar Kaptan"
@@ -155,30 +161,42 @@ class node:
 		elif type(buf) not in [int, long]:
 			raise TypeError("invalid buf: int or long expected")
 
-		share = client.recv(buf, ',')
+		share = client.recv(buf)
 		self.share = share
 
 	def manipulateShare(self, mode):
 		"""Manipulate the share value by replacing it with a random integer
 		value. The manipulation algorithm varies based on the mode of 
 		verification because the message format is different for different
-		modes of verification. 
+		modes of verification. The binary share is decoded into the lists 
+		below by shareCodec.decodeShare, and encoded back by 
+		shareCodec.encodeShare after the manipulation.
 
 		When mode is NO_VERIFICATION, the share is of the form "[x, y]". The 
 		manipulation converts the share into a list, replaces the y value 
 		with a random integer value and converts it back to a string.
 
-		When mode is AUX_INFO_VERIFICATION, the share is of the form 
-		"[[x, s], yList, bList, cList]". The manipulation converts the share 
+		When mode is AUX_INFO_VERIFICATION or SEEDED_AUX_INFO_VERIFICATION, the 
+		share is of the form "[[x, s], yList, bList, cList]" or 
+		"[[x, s], seed, c]". The manipulation converts the share 
 		into a list, replaces the s value with a random integer value and 
 		converts it back to a string.
 
-		When mode is MAC_VERIFICATION, the share is of the form "['[x, y]', tag]".
-		The manipulation converts the share into a list, extracts the first 
-		element '[x, y]', converts it into a list, replaces the y value with a 
-		random integer value, converts it back to a string, replaces the original 
-		'[x, y]' string with the new string in the list form share and converts 
-		it back to a string.
+		When mode is FELDMAN_VERIFICATION, POLY_MAC_VERIFICATION or 
+		HASH_VERIFICATION, the share is of the form "[[x, y], commitments]", 
+		"[[x, y], tag]" or "[[x, y], salt, digests]". The 
+		manipulation converts the share into a list, replaces the y value 
+		with a random integer value and converts it back to a string.
+
+		For shares of chunked secrets, y is a list of block shares, and only 
+		the first block share is replaced.
+
+		When mode is MAC_VERIFICATION, the share is of the form [msg, tag], where 
+		msg is the binary string of [x, y] encoded by shareCodec.encodeValue.
+		The manipulation converts the share into a list, decodes msg into a 
+		list, replaces the y value with a random integer value, encodes it back 
+		into a binary string, replaces the original msg in the list form share 
+		and converts it back to a string.
 
 		** Invoked by faulty nodes only. **
 
@@ -193,23 +211,48 @@ class node:
 
 		if type(mode) not in [int, long]:
 			raise TypeError("invalid mode: int or long expected")
-		elif mode not in [NO_VERIFICATION, MAC_VERIFICATION, AUX_INFO_VERIFICATION]:
-			modeRange = "%d, %d or %d" % (NO_VERIFICATION, MAC_VERIFICATION, AUX_INFO_VERIFICATION)
+		elif mode not in [NO_VERIFICATION, MAC_VERIFICATION, AUX_INFO_VERIFICATION, \
+				FELDMAN_VERIFICATION, POLY_MAC_VERIFICATION, SEEDED_AUX_INFO_VERIFICATION, \
+				HASH_VERIFICATION]:
+			modeRange = "%d, %d, %d, %d, %d, %d or %d" % (NO_VERIFICATION, MAC_VERIFICATION, \
+				AUX_INFO_VERIFICATION, FELDMAN_VERIFICATION, POLY_MAC_VERIFICATION, \
+				SEEDED_AUX_INFO_VERIFICATION, HASH_VERIFICATION)
 			raise ValueError("invalid mode: " + modeRange + " expected")
 
-		share = message.strToList(self.share)
+		share = shareCodec.decodeShare(self.share, mode)
 		if mode == NO_VERIFICATION:
-			share[1] = genRandNum(share[1])
-		elif mode == AUX_INFO_VERIFICATION:
+			share[1] = self.manipulateValue(share[1])
+		elif mode in [AUX_INFO_VERIFICATION, SEEDED_AUX_INFO_VERIFICATION]:
 			share[0][1] = genRandNum(share[0][1])
+		elif mode in [FELDMAN_VERIFICATION, POLY_MAC_VERIFICATION, HASH_VERIFICATION]:
+			share[0][1] = self.manipulateValue(share[0][1])
 		elif mode == MAC_VERIFICATION:
 			shareStr = share[0]
-			shareList = message.strToList(shareStr)
-			shareList[1] = genRandNum(shareList[1])
-			shareStr = message.listToStr(shareList)
+			shareList = shareCodec.decodeValue(shareStr, 0, len(shareStr))
+			shareList[1] = self.manipulateValue(shareList[1])
+			shareStr = shareCodec.encodeValue(shareList)
 			share[0] = shareStr
 
-		self.share = message.listToStr(share)
+		self.share = shareCodec.encodeShare(share, mode)
+
+	def manipulateValue(self, y):
+		"""Returns a random integer value smaller than y to substitute the 
+		share value y. When y is a list of block shares of a chunked secret, 
+		the first block share is substituted and the list is returned.
+
+		Args:
+			y: An integer share value, or a list of integer block shares.
+
+		Returns:
+			The substituted integer share value or list of block shares.
+		"""
+
+		if type(y) == list:
+			if len(y) > 0:
+				y[0] = genRandNum(y[0])
+			return y
+
+		return genRandNum(y)
 
 	def sendShare(self, client):
 		"""Send the share stored in the instance variable share value to the
@@ -226,7 +269,7 @@ class node:
 		if not isinstance(client, mysocket):
 			raise TypeError("invalid client: mysocket object expected")
 
-		client.send(self.share, ',')
+		client.send(self.share)
 
 	def isShareReceived(self):
 		"""Returns whether the share has been received from the sender and 
@@ -279,8 +322,12 @@ class node:
 				raise TypeError("invalid mode: int or long expected")
 			elif type(honest) != bool:
 				raise TypeError("invalid honest: bool expected")
-			elif mode not in [NO_VERIFICATION, MAC_VERIFICATION, AUX_INFO_VERIFICATION]:
-				modeRange = "%d, %d or %d" % (NO_VERIFICATION, MAC_VERIFICATION, AUX_INFO_VERIFICATION)
+			elif mode not in [NO_VERIFICATION, MAC_VERIFICATION, AUX_INFO_VERIFICATION, \
+				FELDMAN_VERIFICATION, POLY_MAC_VERIFICATION, SEEDED_AUX_INFO_VERIFICATION, \
+				HASH_VERIFICATION]:
+				modeRange = "%d, %d, %d, %d, %d, %d or %d" % (NO_VERIFICATION, MAC_VERIFICATION, \
+					AUX_INFO_VERIFICATION, FELDMAN_VERIFICATION, POLY_MAC_VERIFICATION, \
+					SEEDED_AUX_INFO_VERIFICATION, HASH_VERIFICATION)
 				raise ValueError("invalid mode: " + modeRange + " expected")
 
 			self.sock.listen(5)
@@ -304,17 +351,17 @@ class node:
 				if clients[0] != None and tasksDone[0] != True:
 					self.receiveShare(clients[0], buf)
 					clients[0].close()
-					print "Share received:", self.share, "\n"
+					print "Share received:", shareCodec.shareToStr(self.share), "\n"
 					if honest == False:
 						self.manipulateShare(mode)
-						print "Share manipulated:", self.share, "\n"
+						print "Share manipulated:", shareCodec.shareToStr(self.share), "\n"
 					tasksDone[0] = True
 					print "-" * 50
 
 				if clients[1] != None and tasksDone[0] == True and self.isShareReceived():
 					self.sendShare(clients[1])
 					clients[1].close()
-					print "Sent:", self.share, "\n"
+					print "Sent:", shareCodec.shareToStr(self.share), "\n"
 					tasksDone[1] = True
 
 			self.sock.close()
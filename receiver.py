@@ -16,9 +16,26 @@ integrity of each share.
 	1. No verification 
 	2. Information Theoretic Verification 
 	3. MAC Verification 
+	4. Feldman Commitment Verification
+	5. Polynomial Hash MAC Verification
+	6. Seeded Information Theoretic Verification
+	7. Hash Commitment Verification
+
+The shares are binary strings encoded by shareCodec, which are 
+decoded into lists before the verification.
+
+The shares are requested from all the nodes concurrently by a pool of
+at most MAX_WORKERS threads, and collected as they arrive until either
+enough shares are received or RECV_DEADLINE seconds have passed. Up to
+n - k nodes may be missing, so the reconstruction waits for the fastest
+nodes rather than the slowest. The pending requests are then stopped,
+and the nodes not yet queried are only connected to and released. A
+faulty node whose share is not among the collected ones is never
+reported. The response time of each node is kept in responseTimes.
 
 If the verification fails for any share, the corresponding node 
-is declared faulty.
+is declared faulty. Without verification, up to (n - k) / 2 faulty 
+nodes are detected by Reed-Solomon decoding of all the shares.
 
 The receiver reconstructs the secret using k valid shares and 
 calculates the list of faulty nodes for final output.
@@ -31,19 +48,30 @@ Class receiver
 		sock - list of socket objects
 		key - shared key for MAC mode verification
 		debug - a boolean debug mode indicator
+		responseTimes - list of response times of the nodes
     Constructor: 
         __init__(self, ports, key)
     Methods:		
-		reconstructSecret(self, nodes, buffer, k, t, prime, mode)
-		getShares(self, nodes, buffer)
-		getShareFromNode(self, node, buffer, index)
+		reconstructSecret(self, nodes, buffer, k, t, prime, mode, chunked, 
+			deadline)
+		getShares(self, nodes, buffer, deadline, quorum, workers)
+		getShareFromNode(self, node, buffer, index, timeout)
 		getReconSharesNoVrfy(self, sList, k)
+		correctSharesNoVrfy(self, sList, k, prime)
 		unpackSharesAuxMode(self, shares)
-		verifyAuxInfo(self, sList, yList, bList, cList, t, prime)
+		verifyAuxInfo(self, sList, yList, bList, cList, t, prime, k, nodeIds)
 		getReconSharesAuxMode(self, sList, honestNodes, k)
 		unpackSharesMacMode(self, shares)
 		verifyMac(self, sList, macList)
 		getReconSharesMacMode(self, sList, honestNodes, k)
+		unpackSharesFeldmanMode(self, shares)
+		verifyCommitments(self, sList, commitmentList, prime)
+		unpackSharesPolyMacMode(self, shares)
+		verifyPolyMac(self, sList, tagList, prime)
+		unpackSharesSeededAuxMode(self, shares)
+		verifySeededAuxInfo(self, sList, seedList, cList, prime, k, nodeIds)
+		unpackSharesHashMode(self, shares)
+		verifyHashCommitments(self, sList, saltList, digestLists, nodeIds)
 		getFaultyNodes(self, nodes, honestNodes)
 
 Boilerplate
@@ -60,10 +88,13 @@ The algorithm used is as follows:
 	2. Initiate receiver object with the port numbers list and the
 		shared key. The object is constructed with the corresponding 
 		sockets initiated and bound.
-	3. Connect to the intermediate nodes and receive shares from 
-		each node.
-	4. If verification mode is MAC or Information Theoretic, verify
-		each share using the verification information in the shares.
+	3. Connect to the intermediate nodes concurrently and receive 
+		shares from the nodes until enough shares are received or 
+		the deadline passes.
+	4. If verification mode is MAC, Information Theoretic, Feldman, 
+		Polynomial Hash MAC, Seeded Information Theoretic or Hash 
+		Commitment, verify each share using the verification 
+		information in the shares.
 		Return a list of invalid shares.
 	5. Reconstruct the secret message using valid shares, and return 
 		the secret and the list of faulty nodes using the list of 
@@ -81,14 +112,23 @@ Execute the following format command in a linux/unix shell.
 #################### Import modules #########################
 import argparse
 import sys
+import threading
+from Queue import Queue, Empty
 from time import time, sleep
 from random import random
 from modules.mysocket import mysocket
 from modules.util import message, secureFail
 from modules.secretSharing import secretSharing
+from modules.reedSolomon import reedSolomon
+from modules.macContext import getMacContext
+from modules.shareCodec import shareCodec
 from modules.secretSharing import NO_VERIFICATION
 from modules.secretSharing import MAC_VERIFICATION
 from modules.secretSharing import AUX_INFO_VERIFICATION
+from modules.secretSharing import FELDMAN_VERIFICATION
+from modules.secretSharing import POLY_MAC_VERIFICATION
+from modules.secretSharing import SEEDED_AUX_INFO_VERIFICATION
+from modules.secretSharing import HASH_VERIFICATION
 
 #################### Module Metadata ########################
 __author__ = "Saurabh Gupta, Omkar Kaptan"
@@ -96,6 +136,11 @@ __email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
 __license__ = "GPL"
 __version__ = "1.0"
 
+############## Global Variables for Share Collection ########
+MAX_WORKERS = 16
+RECV_DEADLINE = 10.0
+RELEASE_TIMEOUT = 1.0
+
 #############################################################
 #                    Class: receiver                        #
 #############################################################
@@ -110,6 +155,10 @@ class receiver:
 		key: A base64 format string key to be used for MAC tag 
 			verification.
 		debug: A boolean value indicating debug mode. 
+		responseTimes: A list of the float response times in seconds of the 
+			nodes of the last getShares call, with None for the nodes that 
+			did not respond.
+		printLock: A lock serializing the output of the collecting threads.
 	"""
 
 	def __init__(self, ports, key=None, debug=False):
@@ -137,6 +186,8 @@ class receiver:
 			self.sock = []
 			self.key = key
 			self.debug = debug
+			self.responseTimes = []
+			self.printLock = threading.Lock()
 			for port in ports:
 				self.sock.append(mysocket())
 				self.sock[-1].bind((self.host, port))
@@ -148,18 +199,22 @@ class receiver:
 				secureFail()
 				sys.exit()
 
-	def getShareFromNode(self, node, buffer, index):
+	def getShareFromNode(self, node, buffer, index, timeout=None):
 		"""Connects to the given node and receives the corresponding share
-		from it, and returns the share string. 
+		from it, and returns the share. The share is received into a buffer 
+		of its exact length by mysocket.recv, and returned as a memoryview of 
+		it, which is decoded by shareCodec without copying.
 
 		Args:
 			node: A tuple (host, port) for the node to connect.
 			buffer: An integer value specifying the input buffer size.
 			index: An integer value specifying the index of socket to be used
 				for connecting to the node.
+			timeout: A float value specifying the timeout in seconds for 
+				connecting and receiving. Default value = None, for no timeout.
 
 		Returns:
-			A string share value received from the node.
+			A memoryview share value received from the node.
 
 		Raises:
 			TypeError: Error when node is not a list or tuple, or when either 
@@ -178,42 +233,144 @@ class receiver:
 		if index >= len(self.sock):
 			raise ValueError("invalid index: out of range")
 
-		print "-" * 50
-		print "Attempting to connect to node (Port=%d)" % node[1]
-		self.sock[index].connect(node)
-		print "Node (Port=%d) connected" % node[1]
-		share = self.sock[index].recv(buffer, ',')
-		self.sock[index].close()
-		print "Share received:", share
+		try:
+			self.sock[index].settimeout(timeout)
+			self.sock[index].connect(node)
+			share = self.sock[index].recv(buffer)
+		finally:
+			self.sock[index].close()
+
+		with self.printLock:
+			print "-" * 50
+			print "Node (Port=%d) connected" % node[1]
+			print "Share received:", shareCodec.shareToStr(share)
+
 		return share
 
-	def getShares(self, nodes, buffer):
-		"""Gets shares from each of the nodes using the given buffer size, 
-		and returns the list of shares. 
+	def getShares(self, nodes, buffer, deadline=RECV_DEADLINE, quorum=None, \
+		workers=MAX_WORKERS):
+		"""Gets shares from the nodes concurrently using the given buffer size, 
+		and returns the list of shares. The nodes are queried by a pool of at 
+		most workers threads, and the shares are collected as they arrive 
+		until either quorum shares are received, all the nodes have responded, 
+		or deadline seconds have passed. A node that fails or does not respond 
+		in time is missing from the returned list. The response time of each 
+		node is recorded in responseTimes.
+
+		When the collection stops, the sockets of the requests in progress are 
+		shut down, and the nodes not yet queried are connected to with a 
+		timeout of RELEASE_TIMEOUT seconds and disconnected without receiving 
+		their shares, so that no node keeps waiting for the receiver. All the 
+		threads are joined before returning. The shares of these nodes are 
+		not verified, so a faulty node among them is never reported.
 
 		Args:
-			node: A tuple (host, port) for the node to connect.
+			nodes: A list of tuples (host, port) for the nodes to connect.
 			buffer: An integer value specifying the input buffer size.
+			deadline: A float value specifying the time in seconds after which 
+				the missing shares are no longer awaited. Default value = 
+				RECV_DEADLINE.
+			quorum: An integer value specifying the number of shares after 
+				which the collection stops. Default value = None, for awaiting 
+				all the nodes.
+			workers: An integer value specifying the maximum number of 
+				concurrent requests. Default value = MAX_WORKERS.
 
 		Returns:
-			A list of string share values received from the nodes.
+			A list of share values received from the nodes, with None for each 
+				missing node.
 
 		Raises:
-			TypeError: Error when node is not a list or tuple, or when buffer 
-				is not an integer.
+			TypeError: Error when nodes is not a list or tuple, or when either 
+				buffer, quorum or workers is not an integer, or when deadline 
+				is not a number.
+			ValueError: Error when deadline or workers is not positive, or when 
+				there are fewer sockets than nodes.
 		"""
 
 		if type(nodes) not in [tuple, list]:
 			raise TypeError("invalid node: list or tuple expected")
 		elif type(buffer) not in [int, long]:
 			raise TypeError("invalid buffer: int or long expected")
-
-		shares = []
-		index = 0
-		for node in nodes:
-			share = self.getShareFromNode(node, buffer, index)
-			shares.append(share)
-			index += 1
+		elif type(deadline) not in [int, long, float]:
+			raise TypeError("invalid deadline: int, long or float expected")
+		elif quorum != None and type(quorum) not in [int, long]:
+			raise TypeError("invalid quorum: int or long expected")
+		elif type(workers) not in [int, long]:
+			raise TypeError("invalid workers: int or long expected")
+		elif deadline <= 0 or workers < 1:
+			raise ValueError("invalid deadline or workers: positive value expected")
+		elif len(self.sock) < len(nodes):
+			raise ValueError("invalid nodes: at most one node per socket expected")
+
+		startTime = time()
+		endTime = startTime + deadline
+		pending = Queue()
+		arrived = Queue()
+		for index in range(0, len(nodes)):
+			pending.put(index)
+
+		stopped = threading.Event()
+		inProgress = set()
+		lock = threading.Lock()
+
+		def collect():
+			while True:
+				try:
+					index = pending.get_nowait()
+				except Empty:
+					return
+
+				remaining = endTime - time()
+				with lock:
+					release = stopped.is_set() or remaining <= 0
+					if not release:
+						inProgress.add(index)
+
+				if release:
+					try:
+						self.sock[index].settimeout(RELEASE_TIMEOUT)
+						self.sock[index].connect(nodes[index])
+					except Exception:
+						pass
+					finally:
+						self.sock[index].close()
+					continue
+
+				try:
+					share = self.getShareFromNode(nodes[index], buffer, index, remaining)
+				except Exception:
+					share = None
+				with lock:
+					inProgress.discard(index)
+				arrived.put([index, share, time() - startTime])
+
+		threads = [threading.Thread(target=collect) for i in range(0, min(workers, len(nodes)))]
+		for thread in threads:
+			thread.start()
+
+		shares = [None] * len(nodes)
+		self.responseTimes = [None] * len(nodes)
+		responded = 0
+		received = 0
+		while responded < len(nodes) and (quorum == None or received < quorum):
+			try:
+				index, share, elapsed = arrived.get(True, max(endTime - time(), 0.001))
+			except Empty:
+				break
+
+			responded += 1
+			if share != None:
+				shares[index] = share
+				self.responseTimes[index] = elapsed
+				received += 1
+
+		with lock:
+			stopped.set()
+			for index in inProgress:
+				self.sock[index].shutdown()
+		for thread in threads:
+			thread.join()
 
 		return shares
 
@@ -222,8 +379,9 @@ class receiver:
 		into a list of all msg values and a list of all tag values.
 
 		Args:
-			shares: A list of string shares of the form "[msg, tag]"
-				where msg and tag are strings. 
+			shares: A list of binary string shares of the form [msg, tag] 
+				encoded by shareCodec.encodeShare, where msg and tag are 
+				strings. 
 
 		Returns:
 			A list containing 2 lists: a list of all msg values and a list 
@@ -240,7 +398,7 @@ class receiver:
 		macList = []
 
 		for share in shares:
-			shareList = message.strToList(share)
+			shareList = shareCodec.decodeShare(share, MAC_VERIFICATION)
 			sList.append(shareList[0])
 			macList.append(shareList[1])
 			
@@ -271,7 +429,7 @@ class receiver:
 		cList = []
 
 		for share in shares:
-			shareList = message.strToList(share)
+			shareList = shareCodec.decodeShare(share, AUX_INFO_VERIFICATION)
 			sList.append(shareList[0])
 			yList += shareList[1]
 			bList += shareList[2]
@@ -282,7 +440,9 @@ class receiver:
 	def verifyMac(self, sList, macList):
 		"""Verifies the MAC tags in macList for corresponding share strings 
 		in sList and returns a list of booleans representing the verification 
-		status of each share.
+		status of each share. The tags are verified by macContext.verifyMany, 
+		which decodes and hashes the key once, and a tag that is not a string 
+		is invalid.
 
 		Args:
 			sList: A list of string shares. 
@@ -302,18 +462,22 @@ class receiver:
 		elif type(macList) != list:
 			raise TypeError("invalid macList: list expected")
 
-		acceptMac = []
-		for i in range(0, len(sList)):
-			result = secretSharing.verifyMac(sList[i], self.key, macList[i])
-			acceptMac.append(result)
-
+		acceptMac = getMacContext(self.key).verifyMany(sList, macList)
 		return acceptMac
 
-	def verifyAuxInfo(self, sList, yList, bList, cList, t, prime):
+	def verifyAuxInfo(self, sList, yList, bList, cList, t, prime, k=None, nodeIds=None):
 		"""Verifies the auxilliary information specified by the yList, bList
 		and cList lists for each share in sList list, and returns a list of 
 		booleans representing the verification status of each share.
 
+		The [i, j, y], [j, i, b] and [j, i, c] triples are indexed once by the 
+		pair (i, j). A share is rejected when t of its checks fail, so the 
+		checks of a share stop as soon as either t checks have failed or too 
+		few checks remain for t failures. When k is given, the shares are 
+		verified in order until k of them are accepted, and the remaining 
+		shares are not verified. When nodeIds is given, each share is only 
+		checked against the other shares in sList.
+
 		Args:
 			sList: A list of shares of the form [x, s] where x and s are 
 				integers.
@@ -325,15 +489,25 @@ class receiver:
 				are integers.
 			t: An integer representing the maximum number of faulty nodes.
 			prime: A integer value specifying the prime field for modulo operations.
+			k: An integer representing the number of accepted shares after 
+				which the verification stops. Default value = None, for 
+				verifying all the shares.
+			nodeIds: A list of the integer node numbers, from 1 to n, of the 
+				shares in sList when the shares of some nodes are missing. 
+				Default value = None, for sList[i] being the share of node i+1.
 
 		Returns:
-			A list of boolean values, one corresponding to each share in 
-				sList. If acceptMac[i] = True, then sList[i] is a valid 
-				share, otherwise it is invalid.
+			A list containing the list acceptAuxInfo and the integer number 
+				of skipped checks out of the n * (n - 1) checks. If 
+				acceptAuxInfo[i] = True, then sList[i] is a valid share, if it 
+				is False, sList[i] is invalid, and if it is None, sList[i] was 
+				not verified.
 
 		Raises:
 			TypeError: Error when any of sList, yList, bList or cList is not a 
-				list, or when either t or prime is not an integer.
+				list, or when either t, prime or k is not an integer, or when 
+				nodeIds is not a list.
+			ValueError: Error when the sizes of sList and nodeIds differ.
 		"""
 
 		if type(sList) != list:
@@ -348,33 +522,426 @@ class receiver:
 			raise TypeError("invalid t: int or long expected")
 		elif type(prime) not in [int, long]:
 			raise TypeError("invalid prime: int or long expected")
+		elif k != None and type(k) not in [int, long]:
+			raise TypeError("invalid k: int or long expected")
+		elif nodeIds != None and type(nodeIds) != list:
+			raise TypeError("invalid nodeIds: list expected")
+		elif nodeIds != None and len(nodeIds) != len(sList):
+			raise ValueError("invalid sList or nodeIds: list counts expected to match")
+
+		yIndex = dict(((element[0], element[1]), element[2]) for element in yList)
+		bIndex = dict(((element[0], element[1]), element[2]) for element in bList)
+		cIndex = dict(((element[0], element[1]), element[2]) for element in cList)
+
+		n = len(sList)
+		if nodeIds == None:
+			nodeIds = range(1, n+1)
+		acceptAuxInfo = [None] * n
+		accepted = 0
+		checks = 0
+
+		for i in range(0, n):
+			if k != None and accepted >= k:
+				break
 
-		acceptAuxInfo = [True] * len(sList) 
-		resultMatrix = [[True] * len(sList) for i in range(len(sList))]
-		
-		for i in range(0, len(sList)):
 			si = sList[i][1]
-			yiList = [element for element in yList if element[0] == i+1]
-			biList = [element for element in bList if element[1] == i+1]
-			ciList = [element for element in cList if element[1] == i+1]
-			yiList = sorted(yiList, key=lambda x: x[1])
-			biList = sorted(biList, key=lambda x: x[0])
-			ciList = sorted(ciList, key=lambda x: x[0])
-
-			for j in range(0, len(yiList)):
-				yij = yiList[j][2]
-				bij = biList[j][2]
-				cij = ciList[j][2]
-				if j < i:
-					z = j
-				else:
-					z = j+1
-				resultMatrix[i][z] = secretSharing.verifyAuxInfo(si, yij, bij, cij, prime)
+			failures = 0
+			remaining = n - 1
+			for j in nodeIds:
+				if t <= 0 or failures >= t or failures + remaining < t:
+					break
+				elif j == nodeIds[i]:
+					continue
+
+				remaining -= 1
+				checks += 1
+				try:
+					result = secretSharing.verifyAuxInfo(si, yIndex[(nodeIds[i], j)], \
+						bIndex[(j, nodeIds[i])], cIndex[(j, nodeIds[i])], prime)
+				except (KeyError, TypeError, ValueError):
+					result = False
+				if result == False:
+					failures += 1
+
+			acceptAuxInfo[i] = not (t > 0 and failures >= t)
+			if acceptAuxInfo[i] == True:
+				accepted += 1
+
+		return [acceptAuxInfo, n * (n - 1) - checks]
+
+	def unpackSharesFeldmanMode(self, shares):
+		"""Unpacks a list of string shares of the form "[[x, y], commitments]"
+		into a list of all [x, y] shares and a list of all commitment lists.
+
+		Args:
+			shares: A list of string shares of the form "[[x, y], commitments]"
+				where x and y are integers and commitments is a list of integers.
+
+		Returns:
+			A list containing 2 lists: a list of all [x, y] shares and a list 
+				of all commitment lists from the list shares.
+
+		Raises:
+			TypeError: Error when shares is not a list.
+		"""
+
+		if type(shares) != list:
+			raise TypeError("invalid shares: list expected")
+
+		sList = []
+		commitmentList = []
+
+		for share in shares:
+			shareList = shareCodec.decodeShare(share, FELDMAN_VERIFICATION)
+			sList.append(shareList[0])
+			commitmentList.append(shareList[1])
+
+		return [sList, commitmentList]
+
+	def verifyCommitments(self, sList, commitmentList, prime):
+		"""Verifies each share in sList against the Feldman commitments and 
+		returns a list of booleans representing the verification status of 
+		each share.
+
+		Every node forwards its own copy of the commitments, so a faulty node 
+		may alter them along with its share. The commitments forwarded by the 
+		most nodes are taken as the ones published by the sender, and a share 
+		is valid iff its node forwarded these commitments and the share is 
+		consistent with them.
+
+		Args:
+			sList: A list of shares of the form [x, y] where x and y are 
+				integers.
+			commitmentList: A list of lists of integer commitments, one for 
+				each share in sList.
+			prime: An integer value specifying the prime field for modulo 
+				operations.
+
+		Returns:
+			A list of boolean values, one corresponding to each share in 
+				sList. If honestNodes[i] = True, then sList[i] is a valid 
+				share, otherwise it is invalid.
+
+		Raises:
+			TypeError: Error when either sList or commitmentList is not a list, 
+				or when prime is not an integer.
+			ValueError: Error when the number of shares is not the same as the 
+				size of list commitmentList.
+		"""
+
+		if type(sList) != list:
+			raise TypeError("invalid sList: list expected")
+		elif type(commitmentList) != list:
+			raise TypeError("invalid commitmentList: list expected")
+		elif type(prime) not in [int, long]:
+			raise TypeError("invalid prime: int or long expected")
+		elif len(sList) != len(commitmentList):
+			raise ValueError("invalid sList or commitmentList: list counts expected to match")
+
+		votes = {}
+		for commitments in commitmentList:
+			key = str(commitments)
+			votes[key] = votes.get(key, 0) + 1
+		published = commitmentList[0]
+		for commitments in commitmentList:
+			if votes[str(commitments)] > votes[str(published)]:
+				published = commitments
+
+		honestNodes = []
+		for i in range(0, len(sList)):
+			if commitmentList[i] != published:
+				honestNodes.append(False)
+				continue
+			try:
+				result = secretSharing.verifyCommitment(sList[i], published, prime)
+			except TypeError:
+				result = False
+			honestNodes.append(result)
+
+		return honestNodes
+
+	def unpackSharesPolyMacMode(self, shares):
+		"""Unpacks a list of string shares of the form "[[x, y], tag]" into a 
+		list of all [x, y] shares and a list of all integer tags.
+
+		Args:
+			shares: A list of string shares of the form "[[x, y], tag]" where x 
+				and tag are integers and y is an integer or a list of integers.
+
+		Returns:
+			A list containing 2 lists: a list of all [x, y] shares and a list 
+				of all tags from the list shares.
+
+		Raises:
+			TypeError: Error when shares is not a list.
+		"""
+
+		if type(shares) != list:
+			raise TypeError("invalid shares: list expected")
+
+		sList = []
+		tagList = []
+
+		for share in shares:
+			shareList = shareCodec.decodeShare(share, POLY_MAC_VERIFICATION)
+			sList.append(shareList[0])
+			tagList.append(shareList[1])
+
+		return [sList, tagList]
+
+	def verifyPolyMac(self, sList, tagList, prime):
+		"""Verifies the polynomial hash MAC tags in tagList for the 
+		corresponding shares in sList and returns a list of booleans 
+		representing the verification status of each share.
+
+		Args:
+			sList: A list of shares of the form [x, y] where x is an integer and 
+				y is an integer or a list of integers.
+			tagList: A list of integer tags.
+			prime: An integer value specifying the prime field for modulo 
+				operations.
+
+		Returns:
+			A list of boolean values, one corresponding to each share in 
+				sList. If honestNodes[i] = True, then tagList[i] is a valid 
+				tag for sList[i], otherwise it is invalid.
+
+		Raises:
+			TypeError: Error when either sList or tagList is not a list, or when 
+				prime is not an integer.
+		"""
+
+		if type(sList) != list:
+			raise TypeError("invalid sList: list expected")
+		elif type(tagList) != list:
+			raise TypeError("invalid tagList: list expected")
+		elif type(prime) not in [int, long]:
+			raise TypeError("invalid prime: int or long expected")
+
+		honestNodes = []
+		for i in range(0, len(sList)):
+			result = secretSharing.verifyPolyMac(sList[i], self.key, prime, tagList[i])
+			honestNodes.append(result)
+
+		return honestNodes
+
+	def unpackSharesSeededAuxMode(self, shares):
+		"""Unpacks a list of string shares of the form "[[x, s], seed, c]" into 
+		a list of all [x, s] shares, a list of all seeds and a list of all c 
+		values.
+
+		Args:
+			shares: A list of string shares of the form "[[x, s], seed, c]" where 
+				x, s and c are integers and seed is a base64 string.
+
+		Returns:
+			A list containing 3 lists: a list of all [x, s] shares, a list of 
+				all seeds and a list of all c values from the list shares.
+
+		Raises:
+			TypeError: Error when shares is not a list.
+		"""
+
+		if type(shares) != list:
+			raise TypeError("invalid shares: list expected")
+
+		sList = []
+		seedList = []
+		cList = []
+
+		for share in shares:
+			shareList = shareCodec.decodeShare(share, SEEDED_AUX_INFO_VERIFICATION)
+			sList.append(shareList[0])
+			seedList.append(shareList[1])
+			cList.append(shareList[2])
+
+		return [sList, seedList, cList]
+
+	def verifySeededAuxInfo(self, sList, seedList, cList, prime, k=None, nodeIds=None):
+		"""Verifies the seeded auxilliary information specified by the seedList 
+		and cList lists for each share in sList list, and returns a list of 
+		booleans representing the verification status of each share.
+
+		For the share i, the values b and y are derived from its seed with the 
+		shared key by secretSharing.deriveAuxInfo, and the share is accepted 
+		iff c = b*s + y. All the values of a share come from the same node, so 
+		the share is decided by this single check. When k is given, the shares 
+		are verified in order until k of them are accepted, and the remaining 
+		shares are left as None. When nodeIds is given, nodeIds[i] is the index 
+		from which the values of sList[i] are derived.
+
+		The check is only as strong as the secrecy of the shared key, since a 
+		node that knows the key can derive b and y for any seed and forge c.
+
+		Args:
+			sList: A list of shares of the form [x, s] where x and s are 
+				integers.
+			seedList: A list of base64 string seeds, one for each share.
+			cList: A list of integer c values, one for each share.
+			prime: A integer value specifying the prime field for modulo operations.
+			k: An integer representing the number of accepted shares after 
+				which the verification stops. Default value = None, for 
+				verifying all the shares.
+			nodeIds: A list of the integer node numbers, from 1 to n, of the 
+				shares in sList when the shares of some nodes are missing. 
+				Default value = None, for sList[i] being the share of node i+1.
+
+		Returns:
+			A list containing the list acceptAuxInfo, with one boolean or None 
+				for each share, and the integer number of skipped checks out 
+				of the n checks.
+
+		Raises:
+			TypeError: Error when any of sList, seedList, cList or nodeIds is 
+				not a list, or when either prime or k is not an integer.
+			ValueError: Error when the sizes of sList and nodeIds differ.
+		"""
+
+		if type(sList) != list:
+			raise TypeError("invalid sList: list expected")
+		elif type(seedList) != list:
+			raise TypeError("invalid seedList: list expected")
+		elif type(cList) != list:
+			raise TypeError("invalid cList: list expected")
+		elif type(prime) not in [int, long]:
+			raise TypeError("invalid prime: int or long expected")
+		elif k != None and type(k) not in [int, long]:
+			raise TypeError("invalid k: int or long expected")
+		elif nodeIds != None and type(nodeIds) != list:
+			raise TypeError("invalid nodeIds: list expected")
+		elif nodeIds != None and len(nodeIds) != len(sList):
+			raise ValueError("invalid sList or nodeIds: list counts expected to match")
+
+		n = len(sList)
+		acceptAuxInfo = [None] * n
+		accepted = 0
+		checks = 0
+
+		for i in range(0, n):
+			if k != None and accepted >= k:
+				break
+
+			nodeId = i+1 if nodeIds == None else nodeIds[i]
+			checks += 1
+			try:
+				b, y = secretSharing.deriveAuxInfo(self.key, seedList[i], nodeId, prime)
+				result = secretSharing.verifyAuxInfo(sList[i][1], y, b, cList[i], prime)
+			except (IndexError, TypeError, ValueError):
+				result = False
+
+			acceptAuxInfo[i] = result
+			if result == True:
+				accepted += 1
+
+		return [acceptAuxInfo, n - checks]
+
+	def unpackSharesHashMode(self, shares):
+		"""Unpacks a list of string shares of the form "[[x, y], salt, digests]" 
+		into a list of all [x, y] shares, a list of all salts and a list of all 
+		lists of digests.
+
+		Args:
+			shares: A list of string shares of the form "[[x, y], salt, digests]" 
+				where x is an integer, y is an integer or a list of integers, salt 
+				is a base64 string and digests is a list of hex string digests.
+
+		Returns:
+			A list containing 3 lists: a list of all [x, y] shares, a list of 
+				all salts and a list of all lists of digests from the list shares.
+
+		Raises:
+			TypeError: Error when shares is not a list.
+		"""
+
+		if type(shares) != list:
+			raise TypeError("invalid shares: list expected")
+
+		sList = []
+		saltList = []
+		digestLists = []
+
+		for share in shares:
+			shareList = shareCodec.decodeShare(share, HASH_VERIFICATION)
+			sList.append(shareList[0])
+			saltList.append(shareList[1])
+			digestLists.append(shareList[2])
+
+		return [sList, saltList, digestLists]
+
+	def verifyHashCommitments(self, sList, saltList, digestLists, nodeIds=None):
+		"""Verifies each share in sList against the SHA-256 hash commitments 
+		and returns a list of booleans representing the verification status of 
+		each share.
+
+		Every node forwards its own copy of the digests of all the n shares, so 
+		a faulty node may alter them along with its share. As in 
+		verifyCommitments, the digests forwarded by the most nodes are taken as 
+		the ones generated by the sender, and a share is valid iff its node 
+		forwarded these digests and the salted digest of the share matches its 
+		entry. This takes n hash computations and O(n^2) comparisons of fixed 
+		size digests, and identifies the faulty nodes as long as they are fewer 
+		than the honest nodes.
+
+		Args:
+			sList: A list of shares of the form [x, y] where x is an integer and 
+				y is an integer or a list of integers.
+			saltList: A list of base64 string salts, one for each share in sList.
+			digestLists: A list of lists of hex string digests, one for each 
+				share in sList.
+			nodeIds: A list of the integer node numbers, from 1 to n, of the 
+				shares in sList when the shares of some nodes are missing. 
+				Default value = None, for sList[i] being the share of node i+1.
 
-			if t > 0 and resultMatrix[i].count(False) >= t:
-				acceptAuxInfo[i] = False
+		Returns:
+			A list of boolean values, one corresponding to each share in 
+				sList. If honestNodes[i] = True, then sList[i] is a valid 
+				share, otherwise it is invalid.
+
+		Raises:
+			TypeError: Error when any of sList, saltList, digestLists or nodeIds 
+				is not a list.
+			ValueError: Error when the number of shares is not the same as the 
+				size of list saltList, digestLists or nodeIds.
+		"""
+
+		if type(sList) != list:
+			raise TypeError("invalid sList: list expected")
+		elif type(saltList) != list:
+			raise TypeError("invalid saltList: list expected")
+		elif type(digestLists) != list:
+			raise TypeError("invalid digestLists: list expected")
+		elif nodeIds != None and type(nodeIds) != list:
+			raise TypeError("invalid nodeIds: list expected")
+		elif len(sList) != len(saltList) or len(sList) != len(digestLists):
+			raise ValueError("invalid sList, saltList or digestLists: list counts expected to match")
+		elif nodeIds != None and len(nodeIds) != len(sList):
+			raise ValueError("invalid sList or nodeIds: list counts expected to match")
+
+		if nodeIds == None:
+			nodeIds = range(1, len(sList)+1)
+
+		votes = {}
+		for digests in digestLists:
+			key = str(digests)
+			votes[key] = votes.get(key, 0) + 1
+		published = digestLists[0] if len(digestLists) > 0 else []
+		for digests in digestLists:
+			if votes[str(digests)] > votes[str(published)]:
+				published = digests
+
+		honestNodes = []
+		for i in range(0, len(sList)):
+			if digestLists[i] != published:
+				honestNodes.append(False)
+				continue
+			try:
+				result = secretSharing.verifyShareDigest(sList[i], saltList[i], \
+					published[nodeIds[i]-1])
+			except (IndexError, KeyError, TypeError):
+				result = False
+			honestNodes.append(result)
 
-		return acceptAuxInfo
+		return honestNodes
 
 	def getReconSharesMacMode(self, sList, honestNodes, k):
 		"""Returns a list of k valid shares, of the form [x, y] where x and y 
@@ -383,8 +950,9 @@ class receiver:
 		such that honestNodes[i] = True iff sList[i] is a valid share.
 
 		Args:
-			sList: A list of string shares of the form "[x, y]" where x and y 
-				are integers.
+			sList: A list of binary string msg values of MAC mode shares, each 
+				encoding [x, y] by shareCodec.encodeValue, where x and y are 
+				integers.
 			honestNodes: A list of booleans corresponding to each share in sList
 				such that honestNodes[i] = True iff sList[i] is a valid share.
 			k: An integer representing the number of shares required for 
@@ -416,7 +984,7 @@ class receiver:
 
 		for i in range(0, len(honestNodes)):
 			if honestNodes[i] == True:
-				share = message.strToList(sList[i]) 
+				share = shareCodec.decodeValue(sList[i], 0, len(sList[i]))
 				sharesForRecon.append(share)
 
 		return sharesForRecon[0:k]
@@ -470,8 +1038,8 @@ class receiver:
 		integers, for reconstruction of the secret.
 
 		Args:
-			sList: A list of string shares of the form "[x, y]" where x and y 
-				are integers.
+			sList: A list of binary string shares of the form [x, y] encoded by 
+				shareCodec.encodeShare, where x and y are integers.
 			k: An integer representing the number of shares required for 
 				reconstructing the secret message.
 
@@ -493,10 +1061,57 @@ class receiver:
 		sharesForRecon = []
 
 		for share in sList:
-			sharesForRecon.append(message.strToList(share))
+			sharesForRecon.append(shareCodec.decodeShare(share, NO_VERIFICATION))
 
 		return sharesForRecon[0:k]
 
+	def correctSharesNoVrfy(self, sList, k, prime):
+		"""Decodes all the shares in sList as a Reed-Solomon codeword using 
+		reedSolomon.findErrors, and returns the list honestNodes such that 
+		honestNodes[i] = False iff sList[i] is one of the wrong shares. Up to
+		(n - k) / 2 wrong shares can be detected this way without any 
+		verification information. If more shares are wrong, the shares cannot 
+		be checked and an empty list is returned. The decoding is skipped when 
+		secretSharing.checkConsistency finds all the shares consistent.
+
+		Args:
+			sList: A list of binary string shares of the form [x, y] encoded by 
+				shareCodec.encodeShare, where y is an integer or a list of 
+				integer blocks.
+			k: An integer representing the number of shares required for 
+				reconstructing the secret message.
+			prime: An integer value specifying the prime field for modulo 
+				operations.
+
+		Returns:
+			A list of booleans corresponding to each share in sList, or an 
+				empty list if the shares could not be decoded.
+
+		Raises:
+			TypeError: Error when sList is not a list, or when either k or prime
+				is not an integer.
+			ValueError: Error when k is greater than the number of shares.
+		"""
+
+		if type(sList) != list:
+			raise TypeError("invalid sList: list expected")
+		elif type(k) not in [int, long]:
+			raise TypeError("invalid k: int or long expected")
+		elif type(prime) not in [int, long]:
+			raise TypeError("invalid prime: int or long expected")
+		elif k > len(sList):
+			raise ValueError("invalid sList: expected %d or more shares" % k)
+
+		shares = [shareCodec.decodeShare(share, NO_VERIFICATION) for share in sList]
+		try:
+			if secretSharing.checkConsistency(shares, k, prime):
+				return [True] * len(shares)
+			wrongX = reedSolomon.findErrors(shares, k, prime)
+		except (TypeError, ValueError):
+			return []
+
+		return [share[0] not in wrongX for share in shares]
+
 	def getFaultyNodes(self, nodes, honestNodes):
 		"""Returns a list of integer values corresponding to the port numbers, 
 		from list nodes, of faulty nodes using the boolean values in honestNodes
@@ -538,18 +1153,33 @@ class receiver:
 		return faultyNodes
 
 
-	def reconstructSecret(self, nodes, buffer, k, t, prime, mode=NO_VERIFICATION):
+	def reconstructSecret(self, nodes, buffer, k, t, prime, mode=NO_VERIFICATION, chunked=False, \
+		deadline=RECV_DEADLINE):
 		"""Reconstruct the secret message and calculate the set of faulty nodes 
 		based on the shares received from the nodes using the input buffer size
 		specified by buffer argument.
 
 		It uses the following steps:
-		1. Connect to each node in nodes and receive corresponding shares using the
-			input buffer size specified by buffer.
-		2. Based on the mode argument, verify the validity of each share.
+		1. Connect to the nodes concurrently and receive the corresponding shares 
+			using the input buffer size specified by buffer, until k + t shares, 
+			or k + 2t shares without verification, are received or the deadline 
+			passes. The nodes that did not respond in time, or were not awaited, 
+			are left out of the verification, so a faulty node among them is 
+			never reported.
+		2. Based on the mode argument, verify the validity of each share. 
+			Without verification, the wrong shares are located by decoding all 
+			the shares as a Reed-Solomon codeword. With auxilliary information, 
+			the verification is skipped when the shares are consistent and at 
+			most n - k nodes can be faulty, and otherwise stops once k shares 
+			are accepted. With Feldman commitments or hash commitments, each 
+			share is checked against the commitments forwarded by the most 
+			nodes.
 		3. Use k valid shares to reconstruct the secret message.
 		4. Use the list of invalid shares to calculate the list of faulty nodes. 
 
+		In chunked mode, each share holds a vector of block shares and the 
+		secret is reconstructed block by block with the same Lagrange weights.
+
 		Args:
 			nodes: A list of tuples (host, port) where host is the host name and 
 				port is the port number of the corresponding node.
@@ -560,6 +1190,10 @@ class receiver:
 			prime: An integer value specifying the prime field for modulo operations.
 			mode: An integer value representing the mode of verification as defined
 				in the module message.py
+			chunked: A boolean value specifying whether or not the secret was 
+				shared in blocks. Default value = False.
+			deadline: A float value specifying the time in seconds for receiving 
+				the shares. Default value = RECV_DEADLINE.
 
 		Returns:
 			A list containing the secret message string and a list of port numbers
@@ -568,7 +1202,10 @@ class receiver:
 		Raises:
 			TypeError: Error when any of k, t, prime, buffer or mode is not an 
 				integer, or when nodes is not a list.
-			ValueError: Error when the mode is invalid.
+			ValueError: Error when the mode is invalid, or when chunked is True 
+				and mode is AUX_INFO_VERIFICATION, FELDMAN_VERIFICATION or 
+				SEEDED_AUX_INFO_VERIFICATION.
+			RuntimeError: Error when fewer than k shares are received.
 		"""
 
 		try:
@@ -584,34 +1221,98 @@ class receiver:
 				raise TypeError("invalid prime: int or long expected")
 			elif type(mode) not in [int, long]:
 				raise TypeError("invalid mode: int or long expected")
-			elif mode not in [NO_VERIFICATION, MAC_VERIFICATION, AUX_INFO_VERIFICATION]:
-				modeRange = "%d, %d or %d" % (NO_VERIFICATION, MAC_VERIFICATION, AUX_INFO_VERIFICATION)
+			elif mode not in [NO_VERIFICATION, MAC_VERIFICATION, AUX_INFO_VERIFICATION, \
+				FELDMAN_VERIFICATION, POLY_MAC_VERIFICATION, SEEDED_AUX_INFO_VERIFICATION, \
+				HASH_VERIFICATION]:
+				modeRange = "%d, %d, %d, %d, %d, %d or %d" % (NO_VERIFICATION, MAC_VERIFICATION, \
+					AUX_INFO_VERIFICATION, FELDMAN_VERIFICATION, POLY_MAC_VERIFICATION, \
+					SEEDED_AUX_INFO_VERIFICATION, HASH_VERIFICATION)
 				raise ValueError("invalid mode: " + modeRange + " expected")
+			elif chunked == True and mode in [AUX_INFO_VERIFICATION, FELDMAN_VERIFICATION, \
+				SEEDED_AUX_INFO_VERIFICATION]:
+				raise ValueError("invalid mode: chunked shares support %d, %d, %d or %d" \
+					% (NO_VERIFICATION, MAC_VERIFICATION, POLY_MAC_VERIFICATION, \
+					HASH_VERIFICATION))
+
+			quorum = min(len(nodes), k + (2 * t if mode == NO_VERIFICATION else t))
+			allShares = self.getShares(nodes, buffer, deadline, quorum)
+			received = [i for i in range(0, len(nodes)) if allShares[i] != None]
+			shares = [allShares[i] for i in received]
+			nodeIds = [i+1 for i in received]
+
+			print "-" * 50
+			for i in range(0, len(nodes)):
+				if self.responseTimes[i] == None:
+					print "Node (Port=%d): no share received" % nodes[i][1]
+				else:
+					print "Node (Port=%d): share received in %.4fs" % (nodes[i][1], \
+						self.responseTimes[i])
+			print "Shares received: %d of %d" % (len(shares), len(nodes))
+
+			if len(shares) < k:
+				raise RuntimeError("receive failed: at least %d shares expected" % k)
 
-			shares = self.getShares(nodes, buffer)
 			reconStartTime = time()
 			sharesForRecon = []
 			honestNodes = []
 
 			if mode == NO_VERIFICATION:
-				sharesForRecon = self.getReconSharesNoVrfy(shares, k)
+				honestNodes = self.correctSharesNoVrfy(shares, k, prime)
+				if len(honestNodes) == 0:
+					sharesForRecon = self.getReconSharesNoVrfy(shares, k)
+				else:
+					sList = [shareCodec.decodeShare(share, mode) for share in shares]
+					sharesForRecon = self.getReconSharesAuxMode(sList, honestNodes, k)
 			elif mode == MAC_VERIFICATION:
 				sList, macList = self.unpackSharesMacMode(shares)
 				honestNodes = self.verifyMac(sList, macList)
 				sharesForRecon = self.getReconSharesMacMode(sList, honestNodes, k)
 			elif mode == AUX_INFO_VERIFICATION:
 				sList, yList, bList, cList = self.unpackSharesAuxMode(shares)
-				honestNodes = self.verifyAuxInfo(sList, yList, bList, cList, t, prime)
+				if t <= len(sList) - k and secretSharing.checkConsistency(sList, k, prime):
+					honestNodes = [True] * len(sList)
+				else:
+					honestNodes, skippedChecks = self.verifyAuxInfo(sList, yList, bList, \
+						cList, t, prime, k, nodeIds)
+					print "Auxilliary information checks skipped:", skippedChecks
+				sharesForRecon = self.getReconSharesAuxMode(sList, honestNodes, k)
+			elif mode == FELDMAN_VERIFICATION:
+				sList, commitmentList = self.unpackSharesFeldmanMode(shares)
+				honestNodes = self.verifyCommitments(sList, commitmentList, prime)
+				sharesForRecon = self.getReconSharesAuxMode(sList, honestNodes, k)
+			elif mode == POLY_MAC_VERIFICATION:
+				sList, tagList = self.unpackSharesPolyMacMode(shares)
+				honestNodes = self.verifyPolyMac(sList, tagList, prime)
+				sharesForRecon = self.getReconSharesAuxMode(sList, honestNodes, k)
+			elif mode == SEEDED_AUX_INFO_VERIFICATION:
+				sList, seedList, cList = self.unpackSharesSeededAuxMode(shares)
+				if t <= len(sList) - k and secretSharing.checkConsistency(sList, k, prime):
+					honestNodes = [True] * len(sList)
+				else:
+					honestNodes, skippedChecks = self.verifySeededAuxInfo(sList, seedList, \
+						cList, prime, k, nodeIds)
+					print "Auxilliary information checks skipped:", skippedChecks
+				sharesForRecon = self.getReconSharesAuxMode(sList, honestNodes, k)
+			elif mode == HASH_VERIFICATION:
+				sList, saltList, digestLists = self.unpackSharesHashMode(shares)
+				honestNodes = self.verifyHashCommitments(sList, saltList, digestLists, \
+					nodeIds)
 				sharesForRecon = self.getReconSharesAuxMode(sList, honestNodes, k)
 
 			print "-" * 50
 			print "Reconstructing Secret from Shares", sharesForRecon
-			secretNum = secretSharing.reconstructSecret(sharesForRecon, k, prime)
-			try:
-				secret = message.numToStr(secretNum)
-			except TypeError:
-				secret = None
-			faultyNodes = self.getFaultyNodes(nodes, honestNodes)
+			if chunked == True:
+				try:
+					secret = secretSharing.reconstructChunkedSecret(sharesForRecon, k, prime)
+				except ValueError:
+					secret = None
+			else:
+				secretNum = secretSharing.reconstructSecret(sharesForRecon, k, prime)
+				try:
+					secret = message.numToStr(secretNum)
+				except TypeError:
+					secret = None
+			faultyNodes = self.getFaultyNodes([nodes[i] for i in received], honestNodes)
 			reconEndTime = time()
 
 			return [secret, faultyNodes, reconEndTime-reconStartTime]
@@ -646,13 +1347,16 @@ if __name__ == "__main__":		#code to execute if called from command-line
 		prime = recvrDict['prime']
 		key = recvrDict['key']
 		mode = recvrDict['mode']
+		chunked = recvrDict.get('chunked', False)
+		deadline = recvrDict.get('deadline', RECV_DEADLINE)
 		buf = recvrDict['buffer']
 		nodePorts = recvrDict['nodes']
 		addr = mysocket.gethostname()
 		nodes = [(addr, portNum) for portNum in nodePorts]
 
 		r = receiver(ports, key, args.debug)
-		secret, faultyNodes, reconTime = r.reconstructSecret(nodes, buf, k, t, prime, mode)
+		secret, faultyNodes, reconTime = r.reconstructSecret(nodes, buf, k, t, prime, mode, \
+			chunked, deadline)
 		if len(faultyNodes) == 0:
 			faultyNodes = None
 
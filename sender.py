@@ -15,9 +15,20 @@ of the mode selected from the below options.
 	1. No verification 
 	2. Information Theoretic Verification 
 	3. MAC Verification 
+	4. Feldman Commitment Verification
+	5. Polynomial Hash MAC Verification
+	6. Seeded Information Theoretic Verification
+	7. Hash Commitment Verification
 
 The verification information and the share are packaged together
-and send to an intermediate node as a single string message. 
+and send to an intermediate node as a single binary string message 
+encoded by shareCodec. 
+
+The shares are delivered to the nodes concurrently by a pool of at
+most MAX_WORKERS threads, with a timeout of SEND_TIMEOUT seconds for
+each node, so that the delivery takes about as long as the slowest
+node rather than the sum over all the nodes. The delivered status,
+latency and error of each node are kept in deliveryReport.
 
 Class sender
 ~~~~~~~~~~~~
@@ -27,14 +38,21 @@ Class sender
 		sock - list of socket objects
 		key - shared key for MAC mode verification
 		debug - a boolean debug mode indicator
+		deliveryReport - list of [node, delivered, latency, error] lists
     Constructor: 
         __init__(self, ports, key)
     Methods:		
-		sendShares(self, msg, n, k, prime, nodes, mode)
-		sendShareToNode(self, share, node, index)
+		sendShares(self, msg, n, k, prime, nodes, mode, chunked, workers, 
+			timeout)
+		deliverShares(self, sharesToSend, nodes, workers, timeout)
+		sendShareToNode(self, share, node, index, timeout)
 		getSharesNoVrfy(self, shares)
 		getSharesWithMac(self, shares)
 		getSharesWithAuxInfo(self, shares, prime)
+		getSharesWithCommitments(self, shares, commitments)
+		getSharesWithPolyMac(self, shares, prime)
+		getSharesWithSeededAuxInfo(self, shares, prime)
+		getSharesWithHashCommitments(self, shares)
 
 Boilerplate
 ~~~~~~~~~~~
@@ -47,15 +65,17 @@ The algorithm used is as follows:
 		the mode of verification, the shared key to be used 
 		for MAC mode verification and the port numbers to be 
 		used for initiating sender node sockets for communication
-		with the intermediate nodes.
+		with the intermediate nodes. Optionally, the number of 
+		concurrent deliveries (workers) and the timeout in seconds 
+		for each node (timeout) are read as well.
 	2. Initiate sender object with the port numbers list and the
 		shared key. The object is constructed with the corresponding 
 		sockets initiated and bound.
 	3. Generate n shares for the secret message along with the 
 		verification information corresponding to the mode selected.
-	4. Send one share each to the intermediate nodes. Each share 
-		contains the share of the message along with the verification 
-		information pertaining to the share.
+	4. Send one share each to the intermediate nodes concurrently. 
+		Each share contains the share of the message along with the 
+		verification information pertaining to the share.
 
 Usage:
 ~~~~~~
@@ -69,13 +89,21 @@ Execute the following format command in a linux/unix shell.
 #################### Import modules #########################
 import sys
 import argparse
+import threading
+from Queue import Queue, Empty
 from time import time
 from modules.mysocket import mysocket
 from modules.util import message, secureFail
 from modules.secretSharing import secretSharing
+from modules.macContext import getMacContext
+from modules.shareCodec import shareCodec
 from modules.secretSharing import NO_VERIFICATION
 from modules.secretSharing import MAC_VERIFICATION
 from modules.secretSharing import AUX_INFO_VERIFICATION
+from modules.secretSharing import FELDMAN_VERIFICATION
+from modules.secretSharing import POLY_MAC_VERIFICATION
+from modules.secretSharing import SEEDED_AUX_INFO_VERIFICATION
+from modules.secretSharing import HASH_VERIFICATION
 
 #################### Module Metadata ########################
 __author__ = "Saurabh Gupta, Omkar Kaptan"
@@ -83,6 +111,10 @@ __email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
 __license__ = "GPL"
 __version__ = "1.0"
 
+############## Global Variables for Share Delivery ##########
+MAX_WORKERS = 16
+SEND_TIMEOUT = 10.0
+
 #############################################################
 #					Class: sender							#
 #############################################################
@@ -95,6 +127,9 @@ class sender:
 		sock: A list of socket objects.
 		key: A base64 format string key to be used for MAC tag generation.
 		debug: A boolean value indicating debug mode. 
+		deliveryReport: A list of [node, delivered, latency, error] lists for 
+			the nodes of the last sendShares call.
+		printLock: A lock serializing the output of the delivery threads.
 	"""
 
 	def __init__(self, ports, key=None, debug=False):
@@ -122,6 +157,8 @@ class sender:
 			self.sock = []
 			self.key = key
 			self.debug = debug
+			self.deliveryReport = []
+			self.printLock = threading.Lock()
 			for port in ports:
 				self.sock.append(mysocket())
 				self.sock[-1].bind((self.host, port))
@@ -153,7 +190,7 @@ class sender:
 
 		sharesToSend = []
 		for share in shares:
-			msg = message.listToStr(share)
+			msg = shareCodec.encodeShare(share, NO_VERIFICATION)
 			sharesToSend.append(msg)
 
 		return sharesToSend
@@ -163,9 +200,12 @@ class sender:
 
 		For each share [x, y] in the list shares, where x and y are integers, 
 		it performs the following steps:
-		1. Convert it into a string '[x, y]'
-		2. Generate a MAC tag for the message '[x, y]'
-		3. Create a list ['[x, y]', tag] and convert it into string "['[x, y]', tag]"
+		1. Encode it into a binary string msg by shareCodec.encodeValue
+		2. Generate a MAC tag for the message msg
+		3. Create a list [msg, tag] and encode it by shareCodec.encodeShare
+
+		The tags of all the shares are generated by macContext.tagMany, which 
+		decodes and hashes the key once.
 
 		Args:
 			shares: A list of [int, int] lists corresponding to the shares
@@ -181,11 +221,11 @@ class sender:
 		if type(shares) != list:
 			raise TypeError("invalid shares: list expected")
 
+		shareStrList = [shareCodec.encodeValue(share) for share in shares]
+		macList = getMacContext(self.key).tagMany(shareStrList)
 		sharesToSend = []
-		for share in shares:
-			shareStr = message.listToStr(share)
-			mac = secretSharing.generateMac(shareStr, self.key)
-			msg = message.listToStr([shareStr, mac])
+		for shareStr, mac in zip(shareStrList, macList):
+			msg = shareCodec.encodeShare([shareStr, mac], MAC_VERIFICATION)
 			sharesToSend.append(msg)
 
 		return sharesToSend
@@ -203,6 +243,10 @@ class sender:
 		3. Create a list [[x, s], y[i], b[i], c[i]]
 		4. Convert it into string "[[x, s], y[i], b[i], c[i]]"
 
+		The values for share[i] are generated directly into the lists for the 
+		node i, which are serialized and released before the next share, so 
+		the work is O(n^2) and only the lists of one node are held at a time.
+
 		Args:
 			shares: A list of [int, int] lists corresponding to the shares
 				to be sent to intermediate nodes.
@@ -222,38 +266,171 @@ class sender:
 			raise TypeError("invalid prime: int or long expected")
 
 		sharesToSend = []
-		yList = []
-		bList = []
-		cList = []
+		n = len(shares)
 
-		for i in range(0, len(shares)):
-			for j in range(0, len(shares)):
-				if i == j:
-					continue
-				c, b, y = secretSharing.generateAuxInfo(shares[i][1], prime)
-				yList.append([i+1, j+1, y])
-				bList.append([j+1, i+1, b])
-				cList.append([j+1, i+1, c])
+		for i in range(0, n):
+			share = shares[i]
+			others = [j for j in range(1, n+1) if j != i+1]
+			cValues, bValues, yValues = secretSharing.generateAuxInfoBatch(share[1], n-1, prime)
+			y = [[i+1, others[m], yValues[m]] for m in range(0, n-1)]
+			b = [[others[m], i+1, bValues[m]] for m in range(0, n-1)]
+			c = [[others[m], i+1, cValues[m]] for m in range(0, n-1)]
+			msg = shareCodec.encodeShare([share, y, b, c], AUX_INFO_VERIFICATION)
+			sharesToSend.append(msg)
 
-		for i in range(0, len(shares)):
+		return sharesToSend
+
+	def getSharesWithCommitments(self, shares, commitments):
+		"""Generates a list of string format shares with the Feldman commitments
+		for verification. Each share [x, y] is converted into the string 
+		"[[x, y], commitments]", so that any node or receiver holding the share 
+		can verify it against the commitments published by the sender.
+
+		Args:
+			shares: A list of [int, int] lists corresponding to the shares
+				to be sent to intermediate nodes.
+			commitments: A list of integer commitments to the coefficients of 
+				the sharing polynomial.
+
+		Returns:
+			A list of string value shares including the commitments.
+
+		Raises:
+			TypeError: Error when either shares or commitments is not a list.
+		"""
+
+		if type(shares) != list:
+			raise TypeError("invalid shares: list expected")
+		elif type(commitments) != list:
+			raise TypeError("invalid commitments: list expected")
+
+		sharesToSend = []
+		for share in shares:
+			msg = shareCodec.encodeShare([share, commitments], FELDMAN_VERIFICATION)
+			sharesToSend.append(msg)
+
+		return sharesToSend
+
+	def getSharesWithPolyMac(self, shares, prime):
+		"""Generates a list of string format shares with polynomial hash MAC 
+		tags for verification. For each share [x, y], the integer tag is 
+		computed on the integer share by secretSharing.generatePolyMac, and the 
+		share is converted into the string "[[x, y], tag]".
+
+		Args:
+			shares: A list of [int, int] lists, or [int, list] lists for chunked 
+				secrets, corresponding to the shares to be sent to intermediate 
+				nodes.
+			prime: An integer value specifying the prime field for modulo operations.
+
+		Returns:
+			A list of string value shares including polynomial hash MAC tags.
+
+		Raises:
+			TypeError: Error when shares is not a list, or when prime is not integer.
+		"""
+
+		if type(shares) != list:
+			raise TypeError("invalid shares: list expected")
+		elif type(prime) not in [int, long]:
+			raise TypeError("invalid prime: int or long expected")
+
+		sharesToSend = []
+		for share in shares:
+			tag = secretSharing.generatePolyMac(share, self.key, prime)
+			msg = shareCodec.encodeShare([share, tag], POLY_MAC_VERIFICATION)
+			sharesToSend.append(msg)
+
+		return sharesToSend
+
+	def getSharesWithSeededAuxInfo(self, shares, prime):
+		"""Generates a list of string format shares with seeded auxilliary 
+		information for verification using information theoretic technique.
+
+		For each share[i] = [x, s] in the list shares, the values b[i] and y[i] 
+		are derived from a random seed of the share with the shared key by 
+		secretSharing.generateSeededAuxInfo, and the share is converted into 
+		the string "[[x, s], seed, c]", where c = b[i]*s[i] + y[i]. The receiver 
+		derives the same b and y values from the seed, so the share carries a 
+		single value instead of three labelled values for each other node.
+
+		The security of the verification then rests on the secrecy of the shared 
+		key from the intermediate nodes, as the derived values are pseudorandom, 
+		instead of being information theoretic.
+
+		Args:
+			shares: A list of [int, int] lists corresponding to the shares
+				to be sent to intermediate nodes.
+			prime: A integer value specifying the prime field for modulo operations.
+
+		Returns:
+			A list of string value shares including seeded auxilliary information.
+
+		Raises:
+			TypeError: Error when shares is not a list, or when prime is not integer.
+		"""
+
+		if type(shares) != list:
+			raise TypeError("invalid shares: list expected")
+		elif type(prime) not in [int, long]:
+			raise TypeError("invalid prime: int or long expected")
+
+		sharesToSend = []
+		n = len(shares)
+
+		for i in range(0, n):
 			share = shares[i]
-			y = [element for element in yList if element[0] == i+1]
-			b = [element for element in bList if element[1] == i+1]
-			c = [element for element in cList if element[1] == i+1]
-			msg = message.listToStr([share, y, b, c])
+			seed, c = secretSharing.generateSeededAuxInfo(share[1], self.key, i+1, prime)
+			msg = shareCodec.encodeShare([share, seed, c], SEEDED_AUX_INFO_VERIFICATION)
+			sharesToSend.append(msg)
+
+		return sharesToSend
+
+	def getSharesWithHashCommitments(self, shares):
+		"""Generates a list of string format shares with SHA-256 hash 
+		commitments for verification. A random salt and the salted digest of 
+		each share are generated by secretSharing.generateHashCommitments, and 
+		each share [x, y] is converted into the string "[[x, y], salt, digests]", 
+		where digests is the list of the digests of all the n shares. The 
+		receiver identifies the faulty nodes by a majority vote on the digests.
+
+		Args:
+			shares: A list of [int, int] lists, or [int, list] lists for chunked 
+				secrets, corresponding to the shares to be sent to intermediate 
+				nodes.
+
+		Returns:
+			A list of string value shares including hash commitments.
+
+		Raises:
+			TypeError: Error when shares is not a list.
+		"""
+
+		if type(shares) != list:
+			raise TypeError("invalid shares: list expected")
+
+		salts, digests = secretSharing.generateHashCommitments(shares)
+		sharesToSend = []
+		for i in range(0, len(shares)):
+			msg = shareCodec.encodeShare([shares[i], salts[i], digests], HASH_VERIFICATION)
 			sharesToSend.append(msg)
 
 		return sharesToSend
 
-	def sendShareToNode(self, share, node, index):
+	def sendShareToNode(self, share, node, index, timeout=None):
 		"""Sends the given string share to the given node by connecting through 
-		the socket sock[index] and using separator = ','. 
+		the socket sock[index], framed by the length header of mysocket.send.
 
 		Args:
 			share: A string share to be sent.
 			node: A tuple (host, port) for the node to send the share to.
 			index: An integer value specifying the index of socket to be used
 				for connecting to the node.
+			timeout: A float value specifying the timeout in seconds for 
+				connecting and sending. Default value = None, for no timeout.
+
+		Returns:
+			A float value of the time in seconds taken to deliver the share.
 
 		Raises:
 			TypeError: Error when share is not a string value, or when port is not 
@@ -267,21 +444,111 @@ class sender:
 		elif type(index) not in [int, long]:
 			raise TypeError("invalid index: int or long expected")
 
-		print "-" * 50
-		print "Attempting to connect to node (Port=%d)" % node[1]
-		self.sock[index].connect(node)
-		print "Node (Port=%d) connected" % node[1]
-		self.sock[index].send(share, ',')
-		self.sock[index].close()
-		print "Share sent:", share
-
-	def sendShares(self, msg, n, k, prime, nodes, mode=NO_VERIFICATION):
+		startTime = time()
+		try:
+			self.sock[index].settimeout(timeout)
+			self.sock[index].connect(node)
+			self.sock[index].send(share)
+		finally:
+			self.sock[index].close()
+		latency = time() - startTime
+
+		with self.printLock:
+			print "-" * 50
+			print "Node (Port=%d) connected" % node[1]
+			print "Share sent:", shareCodec.shareToStr(share)
+
+		return latency
+
+	def deliverShares(self, sharesToSend, nodes, workers=MAX_WORKERS, \
+		timeout=SEND_TIMEOUT):
+		"""Sends sharesToSend[i] to nodes[i] for every node concurrently, 
+		using a pool of at most workers threads that each take the next 
+		undelivered node in turn. A node that fails or times out does not 
+		stop the delivery to the other nodes.
+
+		Args:
+			sharesToSend: A list of string shares, one for each node.
+			nodes: A list of (host, port) tuples for the intermediate nodes.
+			workers: An integer value specifying the maximum number of 
+				concurrent deliveries. Default value = MAX_WORKERS.
+			timeout: A float value specifying the timeout in seconds for each 
+				node, or None for no timeout. Default value = SEND_TIMEOUT.
+
+		Returns:
+			A list of [node, delivered, latency, error] lists, one for each 
+				node, where delivered is a boolean, latency is the float time 
+				in seconds spent on the node, and error is the string error 
+				message of a failed delivery or None.
+
+		Raises:
+			TypeError: Error when either sharesToSend or nodes is not a list, 
+				or when workers is not an integer.
+			ValueError: Error when there are fewer shares or sockets than 
+				nodes, or when workers is less than 1.
+		"""
+
+		if type(sharesToSend) != list:
+			raise TypeError("invalid sharesToSend: list expected")
+		elif type(nodes) != list:
+			raise TypeError("invalid nodes: list expected")
+		elif type(workers) not in [int, long]:
+			raise TypeError("invalid workers: int or long expected")
+		elif workers < 1:
+			raise ValueError("invalid workers: positive value expected")
+		elif len(sharesToSend) < len(nodes) or len(self.sock) < len(nodes):
+			raise ValueError("invalid nodes: at most one node per share and socket expected")
+
+		report = [[node, False, 0.0, None] for node in nodes]
+		pending = Queue()
+		for i in range(0, len(nodes)):
+			pending.put(i)
+
+		def deliver():
+			while True:
+				try:
+					i = pending.get_nowait()
+				except Empty:
+					return
+
+				startTime = time()
+				try:
+					report[i][2] = self.sendShareToNode(sharesToSend[i], nodes[i], i, timeout)
+					report[i][1] = True
+				except Exception as error:
+					report[i][2] = time() - startTime
+					report[i][3] = "%s: %s" % (type(error).__name__, error)
+
+		threads = [threading.Thread(target=deliver) for i in range(0, min(workers, len(nodes)))]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+
+		return report
+
+	def sendShares(self, msg, n, k, prime, nodes, mode=NO_VERIFICATION, chunked=False, \
+		workers=MAX_WORKERS, timeout=SEND_TIMEOUT):
 		"""Generates n shares for the msg such that any k shares can be 
 		used for reconstruction of the msg. According to the specified mode, 
 		the verification information is added to each share and they are sent 
 		to the given list of nodes. The value prime is used for as the order 
 		of modulo operations.
 
+		In chunked mode, the msg may be of any length. It is split into blocks 
+		that are shared separately under prime, and each share carries the 
+		vector of its block shares. Chunked mode supports the no verification, 
+		MAC verification, polynomial hash MAC verification and hash commitment 
+		verification modes.
+
+		In Feldman verification mode, the commitments to the coefficients of 
+		the sharing polynomial are generated along with the shares by 
+		secretSharing.generateVerifiableShares, and sent with every share.
+
+		The shares are delivered by deliverShares, and its report is kept in 
+		deliveryReport. The dealing fails unless at least k shares are 
+		delivered.
+
 		Args:
 			msg: A string message for which the shares are to be sent.
 			n: An integer number representing the number of shares to be generated.
@@ -291,6 +558,12 @@ class sender:
 			nodes: A list of (host, port) tuples for the intermediate nodes.
 			mode: An integer value representing the verification mode as per options 
 				defined in the message.py module.
+			chunked: A boolean value specifying whether or not the msg is shared 
+				in blocks. Default value = False.
+			workers: An integer value specifying the maximum number of 
+				concurrent deliveries. Default value = MAX_WORKERS.
+			timeout: A float value specifying the timeout in seconds for each 
+				node, or None for no timeout. Default value = SEND_TIMEOUT.
 
 		Returns:
 			A list of string value shares sent to the given nodes.
@@ -298,14 +571,17 @@ class sender:
 		Raises:
 			TypeError: Error when msg is not a string, or when either n, k, prime 
 				or mode is not an integer, or when nodes is not a list.
-			ValueError: Error when msg is longer than 159 characters, or when the 
-				mode is invalid.
+			ValueError: Error when msg is longer than 159 characters and chunked 
+				is False, when the mode is invalid, or when chunked is True and 
+				mode is AUX_INFO_VERIFICATION, FELDMAN_VERIFICATION or 
+				SEEDED_AUX_INFO_VERIFICATION.
+			RuntimeError: Error when fewer than k shares are delivered.
 		"""
 
 		try:
 			if type(msg) != str:
 				raise TypeError("invalid msg: str expected")
-			elif len(msg) > 159:
+			elif len(msg) > 159 and chunked != True:
 				raise ValueError("invalid msg: expected 159 characters or less")
 			elif type(n) not in [int, long]:
 				raise TypeError("invalid n: int or long expected")
@@ -317,13 +593,27 @@ class sender:
 				raise TypeError("invalid nodes: list expected")
 			elif type(mode) != type(NO_VERIFICATION):
 				raise TypeError("invalid mode: int or long expected")
-			elif mode not in [NO_VERIFICATION, MAC_VERIFICATION, AUX_INFO_VERIFICATION]:
-				modeRange = "%d, %d or %d" % (NO_VERIFICATION, MAC_VERIFICATION, AUX_INFO_VERIFICATION)
+			elif mode not in [NO_VERIFICATION, MAC_VERIFICATION, AUX_INFO_VERIFICATION, \
+				FELDMAN_VERIFICATION, POLY_MAC_VERIFICATION, SEEDED_AUX_INFO_VERIFICATION, \
+				HASH_VERIFICATION]:
+				modeRange = "%d, %d, %d, %d, %d, %d or %d" % (NO_VERIFICATION, MAC_VERIFICATION, \
+					AUX_INFO_VERIFICATION, FELDMAN_VERIFICATION, POLY_MAC_VERIFICATION, \
+					SEEDED_AUX_INFO_VERIFICATION, HASH_VERIFICATION)
 				raise ValueError("invalid mode: " + modeRange + " expected")
+			elif chunked == True and mode in [AUX_INFO_VERIFICATION, FELDMAN_VERIFICATION, \
+				SEEDED_AUX_INFO_VERIFICATION]:
+				raise ValueError("invalid mode: chunked shares support %d, %d, %d or %d" \
+					% (NO_VERIFICATION, MAC_VERIFICATION, POLY_MAC_VERIFICATION, \
+					HASH_VERIFICATION))
 
 			print "Secret message:", msg
 			genStartTime = time()
-			shares = secretSharing.generateShares(msg, n, k, prime)
+			if chunked == True:
+				shares = secretSharing.generateChunkedShares(msg, n, k, prime)
+			elif mode == FELDMAN_VERIFICATION:
+				shares, commitments = secretSharing.generateVerifiableShares(msg, n, k, prime)
+			else:
+				shares = secretSharing.generateShares(msg, n, k, prime)
 			sharesToSend = []
 
 			if mode == NO_VERIFICATION:
@@ -332,10 +622,27 @@ class sender:
 				sharesToSend = self.getSharesWithMac(shares)
 			elif mode == AUX_INFO_VERIFICATION:
 				sharesToSend = self.getSharesWithAuxInfo(shares, prime)
+			elif mode == FELDMAN_VERIFICATION:
+				sharesToSend = self.getSharesWithCommitments(shares, commitments)
+			elif mode == POLY_MAC_VERIFICATION:
+				sharesToSend = self.getSharesWithPolyMac(shares, prime)
+			elif mode == SEEDED_AUX_INFO_VERIFICATION:
+				sharesToSend = self.getSharesWithSeededAuxInfo(shares, prime)
+			elif mode == HASH_VERIFICATION:
+				sharesToSend = self.getSharesWithHashCommitments(shares)
 
 			genEndTime = time()
-			for i in range(0, len(nodes)):
-				self.sendShareToNode(sharesToSend[i], nodes[i], i)
+			self.deliveryReport = self.deliverShares(sharesToSend, nodes, workers, timeout)
+			delivered = [entry[1] for entry in self.deliveryReport].count(True)
+
+			print "-" * 50
+			for node, success, latency, error in self.deliveryReport:
+				status = "delivered" if success == True else "failed (%s)" % error
+				print "Node (Port=%d): %s in %.4fs" % (node[1], status, latency)
+			print "Shares delivered: %d of %d" % (delivered, len(nodes))
+
+			if delivered < k:
+				raise RuntimeError("delivery failed: at least %d delivered shares expected" % k)
 
 			msgSize = sys.getsizeof(msg)
 			shareSize = sys.getsizeof(sharesToSend[0])
@@ -380,12 +687,16 @@ if __name__ == "__main__":		#code to execute if called from command-line
 		prime = senderDict['prime']
 		key = senderDict['key']
 		mode = senderDict['mode']
+		chunked = senderDict.get('chunked', False)
+		workers = senderDict.get('workers', MAX_WORKERS)
+		timeout = senderDict.get('timeout', SEND_TIMEOUT)
 		nodePorts = senderDict['nodes']
 		addr = mysocket.gethostname()
 		nodes = [(addr, portNum) for portNum in nodePorts]
 
 		s = sender(ports, key, args.debug)
-		shares, genTime = s.sendShares(msg, n, k, prime, nodes, mode)
+		shares, genTime = s.sendShares(msg, n, k, prime, nodes, mode, chunked, \
+			workers, timeout)
 
 		print "Time taken to generate shares:", genTime
 		print "-" * 50
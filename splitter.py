@@ -0,0 +1,333 @@
+#!/usr/bin/python
+
+#############################################################
+# CSE 539 (Applied Cryptography) Fall 2015 - Project        #
+# Team: Saurabh Gupta, Omkar Kaptan                         #
+# Instructor: Dr. Rida Bazzi                                #
+#############################################################
+
+"""Provides a streaming file splitter and combiner using the (n, k)
+secret sharing scheme over GF(2^8), through secretSharing with 
+BYTE_FIELD.
+
+The input file is read in fixed-size chunks through a generator, and
+the shares of each chunk are appended to the n share files before
+the next chunk is read, so neither the whole file nor all its shares
+are held in memory. Combining reads the k share files chunk by chunk
+in the same way. Since every byte is shared independently, the share
+files are as large as the input file plus a one line header holding
+the x-coordinate, n and k.
+
+Global Methods:
+~~~~~~~~~~~~~~~
+	readChunks(fp, chunkSize)
+	writeHeader(fp, x, n, k)
+	readHeader(fp)
+	splitFile(inputPath, n, k, prefix, chunkSize)
+	combineFiles(sharePaths, outputPath, chunkSize)
+	printReport(operation, size, elapsed)
+
+Usage:
+~~~~~~
+Execute the following format commands in a linux/unix shell.
+./splitter.py split -i <input> -n <nodes> -k <shares> [-o <prefix>] [-b <size>] [-d]
+./splitter.py combine -s <share> <share> ... -o <output> [-b <size>] [-d]
+	-i <input> is the path of the file to be split.
+	-n <nodes> is an integer value representing the number
+		of share files to be generated.
+	-k <shares> is an integer value representing the number
+		of share files requried for combining.
+	-o <prefix> is the path prefix of the share files, which
+		are named <prefix>.share<x>. Default value is the
+		input path.
+	-s <share> <share> ... are the paths of k or more share
+		files to be combined.
+	-o <output> is the path of the combined file.
+	-b <size> is an integer value representing the chunk size
+		in bytes. Default value is 65536.
+	-d is for debug mode. If used, the error and exception
+		messages are displayed as debug information.
+		Otherwise, a secure fail is executed.
+"""
+
+#################### Import modules #########################
+import argparse
+from time import time
+from modules.util import secureFail
+from modules.secretSharing import secretSharing, BYTE_FIELD
+
+#################### Module Metadata ########################
+__author__ = "Saurabh Gupta, Omkar Kaptan"
+__email__ = "saurabhgupta@asu.edu, okaptan@asu.edu"
+__license__ = "GPL"
+__version__ = "1.0"
+
+############ Global variables for share files ###############
+CHUNK_SIZE = 65536
+SHARE_SUFFIX = ".share"
+
+#################### Method Definitions #####################
+
+def readChunks(fp, chunkSize):
+	"""Generates the consecutive chunks of chunkSize bytes read from the
+	file object fp until the end of the file. The last chunk may be shorter.
+
+	Args:
+		fp: A file object opened for reading in binary mode.
+		chunkSize: An integer value specifying the chunk size in bytes.
+
+	Yields:
+		A string chunk of at most chunkSize bytes.
+	"""
+
+	while True:
+		chunk = fp.read(chunkSize)
+		if chunk == '':
+			return
+		yield chunk
+
+def writeHeader(fp, x, n, k):
+	"""Writes the share file header line "x n k" to the file object fp.
+
+	Args:
+		fp: A file object opened for writing in binary mode.
+		x: An integer x-coordinate of the share file.
+		n: An integer value representing the number of share files.
+		k: An integer value representing the number of share files
+			required for combining.
+	"""
+
+	fp.write("%d %d %d\n" % (x, n, k))
+
+def readHeader(fp):
+	"""Reads the share file header line from the file object fp and returns
+	the x-coordinate, n and k values.
+
+	Args:
+		fp: A file object opened for reading in binary mode.
+
+	Returns:
+		A list [x, n, k] of integers.
+
+	Raises:
+		ValueError: Error when the header line is invalid.
+	"""
+
+	header = fp.readline(64).split()
+	if len(header) != 3:
+		raise ValueError("invalid share file: header expected")
+
+	return [int(value) for value in header]
+
+def splitFile(inputPath, n, k, prefix=None, chunkSize=CHUNK_SIZE):
+	"""Splits the file at inputPath into n share files named
+	<prefix>.share<x> for x = 1, ..., n, such that any k of them can be
+	combined into the original file. The file is processed one chunk at a
+	time.
+
+	Args:
+		inputPath: A string path of the file to be split.
+		n: An integer value representing the number of share files.
+		k: An integer value representing the number of share files
+			required for combining.
+		prefix: A string path prefix of the share files. Default value is
+			inputPath.
+		chunkSize: An integer value specifying the chunk size in bytes.
+			Default value = CHUNK_SIZE.
+
+	Returns:
+		A list containing the list of share file paths and the number of
+			bytes split.
+
+	Raises:
+		TypeError: Error when inputPath or prefix is not a string, or when
+			either n, k or chunkSize is not an integer.
+		ValueError: Error when n and k do not satisfy 255 >= n >= k >= 2, or
+			when chunkSize is less than 1.
+	"""
+
+	if type(inputPath) != str:
+		raise TypeError("invalid inputPath: str expected")
+	elif prefix != None and type(prefix) != str:
+		raise TypeError("invalid prefix: str expected")
+	elif type(n) not in [int, long]:
+		raise TypeError("invalid n: int or long expected")
+	elif type(k) not in [int, long]:
+		raise TypeError("invalid k: int or long expected")
+	elif type(chunkSize) not in [int, long]:
+		raise TypeError("invalid chunkSize: int or long expected")
+	elif n < 2 or k < 2:
+		raise ValueError("invalid n or k: value greater than or equal to 2 expected")
+	elif n < k:
+		raise ValueError("invalid k: value less than or equal to n expected")
+	elif n > 255:
+		raise ValueError("invalid n: value less than 256 expected")
+	elif chunkSize < 1:
+		raise ValueError("invalid chunkSize: value greater than 0 expected")
+
+	if prefix == None:
+		prefix = inputPath
+
+	sharePaths = [prefix + SHARE_SUFFIX + str(x) for x in range(1, n+1)]
+	shareFiles = []
+	size = 0
+
+	inputFile = open(inputPath, "rb")
+	try:
+		for x in range(1, n+1):
+			shareFiles.append(open(sharePaths[x-1], "wb"))
+			writeHeader(shareFiles[-1], x, n, k)
+
+		for chunk in readChunks(inputFile, chunkSize):
+			for [x, y] in secretSharing.generateShares(chunk, n, k, None, field=BYTE_FIELD):
+				shareFiles[x-1].write(y)
+			size += len(chunk)
+	finally:
+		inputFile.close()
+		for shareFile in shareFiles:
+			shareFile.close()
+
+	return [sharePaths, size]
+
+def combineFiles(sharePaths, outputPath, chunkSize=CHUNK_SIZE):
+	"""Combines the share files at sharePaths, generated by splitFile, into
+	the original file at outputPath. The first k share files are read one
+	chunk at a time.
+
+	Args:
+		sharePaths: A list of string paths of at least k share files.
+		outputPath: A string path of the combined file.
+		chunkSize: An integer value specifying the chunk size in bytes.
+			Default value = CHUNK_SIZE.
+
+	Returns:
+		An integer value of the number of bytes combined.
+
+	Raises:
+		TypeError: Error when sharePaths is not a list, when outputPath is
+			not a string, or when chunkSize is not an integer.
+		ValueError: Error when fewer than k share files are given, when the
+			share files belong to different splits, or when the share files
+			have different lengths.
+	"""
+
+	if type(sharePaths) != list:
+		raise TypeError("invalid sharePaths: list expected")
+	elif type(outputPath) != str:
+		raise TypeError("invalid outputPath: str expected")
+	elif type(chunkSize) not in [int, long]:
+		raise TypeError("invalid chunkSize: int or long expected")
+	elif chunkSize < 1:
+		raise ValueError("invalid chunkSize: value greater than 0 expected")
+	elif len(sharePaths) < 2:
+		raise ValueError("invalid sharePaths: 2 or more share files expected")
+
+	shareFiles = []
+	size = 0
+
+	try:
+		headers = []
+		for sharePath in sharePaths:
+			shareFiles.append(open(sharePath, "rb"))
+			headers.append(readHeader(shareFiles[-1]))
+
+		n, k = headers[0][1], headers[0][2]
+		if len(shareFiles) < k:
+			raise ValueError("invalid sharePaths: %d or more share files expected" % k)
+		for header in headers:
+			if header[1] != n or header[2] != k:
+				raise ValueError("invalid sharePaths: share files of the same split expected")
+
+		xList = [header[0] for header in headers[:k]]
+		readers = [readChunks(shareFile, chunkSize) for shareFile in shareFiles[:k]]
+
+		outputFile = open(outputPath, "wb")
+		try:
+			while True:
+				chunks = [next(reader, None) for reader in readers]
+				if chunks.count(None) == k:
+					break
+				elif chunks.count(None) > 0:
+					raise ValueError("invalid sharePaths: share files of equal length expected")
+
+				shares = [[xList[i], chunks[i]] for i in range(0, k)]
+				chunk = secretSharing.reconstructSecret(shares, k, None, BYTE_FIELD)
+				outputFile.write(chunk)
+				size += len(chunk)
+		finally:
+			outputFile.close()
+	finally:
+		for shareFile in shareFiles:
+			shareFile.close()
+
+	return size
+
+def printReport(operation, size, elapsed):
+	"""Prints the number of bytes processed by the operation along with the
+	time taken and the throughput.
+
+	Args:
+		operation: A string name of the operation.
+		size: An integer value of the number of bytes processed.
+		elapsed: A float value of the time taken in seconds.
+	"""
+
+	megabytes = size / (1024.0 * 1024.0)
+	print "-" * 50
+	print "%s: %d bytes in %.4f seconds" % (operation, size, elapsed)
+	print "Throughput: %.2f MB/s" % (megabytes / max(elapsed, 1e-9))
+	print "-" * 50
+
+
+#############################################################
+#					Boilerplate Code						#
+#############################################################
+
+if __name__ == "__main__":		#code to execute if called from command-line
+	parser = argparse.ArgumentParser(description="Split or combine files using secret sharing")
+	parser.add_argument("operation", choices=["split", "combine"])
+	parser.add_argument("-s", "--shares", nargs="+")
+	parser.add_argument("-i", "--input")
+	parser.add_argument("-o", "--output")
+	parser.add_argument("-n", "--nodes", type=int)
+	parser.add_argument("-k", "--klimit", type=int)
+	parser.add_argument("-b", "--blocksize", type=int, default=CHUNK_SIZE)
+	parser.add_argument("-d", "--debug", dest="debug", action='store_true')
+	parser.set_defaults(debug=False)
+
+	args = parser.parse_args()
+
+	if args.operation == "split":
+		if args.input == None:
+			parser.error("Missing -i <input>")
+		elif args.nodes == None:
+			parser.error("Missing -n <nodes>")
+		elif args.klimit == None:
+			parser.error("Missing -k <shares>")
+	elif args.shares == None:
+		parser.error("Missing -s <share> <share> ...")
+	elif args.output == None:
+		parser.error("Missing -o <output>")
+
+	try:
+		startTime = time()
+		if args.operation == "split":
+			sharePaths, size = splitFile(args.input, args.nodes, args.klimit, \
+				args.output, args.blocksize)
+			for sharePath in sharePaths:
+				print "Share file written:", sharePath
+			printReport("Split", size, time() - startTime)
+		else:
+			size = combineFiles(args.shares, args.output, args.blocksize)
+			print "Combined file written:", args.output
+			printReport("Combine", size, time() - startTime)
+
+	except SystemExit:
+		pass
+	except:
+		if args.debug == True:
+			raise
+		else:
+			secureFail()
+
+##################### End of Code ###########################